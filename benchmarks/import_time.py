@@ -0,0 +1,85 @@
+"""Measure the import time of valopy with ``python -X importtime``.
+
+Runs a statement in fresh interpreters and reports the median time spent in
+imports beyond those of a bare interpreter. Exits with status 1 if it exceeds
+``--max-ms`` or if ``import valopy`` eagerly loads a module that should be lazy::
+
+    python benchmarks/import_time.py --runs 20 --max-ms 50
+    python benchmarks/import_time.py --statement "from valopy import Client"
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Modules that must not be loaded by a bare "import valopy"
+LAZY_MODULES = ("aiohttp", "valopy.adapter", "valopy.client", "valopy.models", "valopy.enums")
+
+
+def import_once(statement: str) -> tuple[float, set[str]]:
+    """Run a statement in a fresh interpreter, returning the import ms and imported modules."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+
+        modules.add(name.strip())
+
+        # Nested imports are indented and already included in their parent
+        if not name[1:].startswith(" "):
+            total_us += int(cumulative)
+
+    return total_us / 1000, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--statement", default="import valopy")
+    parser.add_argument("--max-ms", type=float, default=None, help="fail above this median")
+    args = parser.parse_args()
+
+    baseline = statistics.median(import_once("pass")[0] for _ in range(args.runs))
+
+    timings = []
+    modules: set[str] = set()
+    for _ in range(args.runs):
+        milliseconds, modules = import_once(args.statement)
+        timings.append(milliseconds - baseline)
+
+    median = statistics.median(timings)
+    print(f"{args.statement!r}: median {median:.1f} ms, min {min(timings):.1f} ms")
+
+    eager = [module for module in LAZY_MODULES if module in modules]
+    failed = False
+    if args.statement == "import valopy" and eager:
+        print(f"eagerly imported: {', '.join(eager)}")
+        failed = True
+
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median import time exceeds {args.max_ms} ms")
+        failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
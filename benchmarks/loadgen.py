@@ -0,0 +1,127 @@
+"""Drive a Client at a target request rate and report throughput and latency.
+
+Runs against a local stand-in API by default, or any API URL with ``--url``::
+
+    python benchmarks/loadgen.py --rps 200 --duration 10 --endpoint leaderboard
+    python benchmarks/loadgen.py --latency 0.05 --error-rate 0.01 --rate-limit 300
+    python benchmarks/loadgen.py --rps 2000 --loop asyncio  # compare with --loop uvloop
+
+The built-in stand-in server shares the process with the client. For high rates
+run it separately with ``python -m valopy.testing tests/mock`` and pass ``--url``.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from valopy import Client, Platform, Region
+from valopy.runtime import run
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+
+MOCK_DIR = Path(__file__).parent.parent / "tests" / "mock"
+
+CALLS: Dict[str, Callable[[Client], Awaitable[Any]]] = {
+    "version": lambda client: client.get_version(Region.EU),
+    "account": lambda client: client.get_account_v2("Player", "TAG"),
+    "content": lambda client: client.get_content(),
+    "status": lambda client: client.get_status(Region.EU),
+    "leaderboard": lambda client: client.get_leaderboard(Region.EU, Platform.PC, size=1000),
+}
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+async def drive(client: Client, call: Callable[[Client], Awaitable[Any]], args: Any) -> None:
+    latencies: List[float] = []
+    errors: Counter = Counter()
+    interval = 1 / args.rps
+    total = int(args.rps * args.duration)
+
+    async def one() -> None:
+        started = time.perf_counter()
+        try:
+            await call(client)
+        except Exception as e:
+            errors[type(e).__name__] += 1
+        else:
+            latencies.append(time.perf_counter() - started)
+
+    # Open loop: requests are started on schedule regardless of completions
+    started = time.perf_counter()
+    tasks = []
+    for index in range(total):
+        delay = started + index * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one()))
+
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    print(f"requests:   {total} in {elapsed:.2f}s ({total / elapsed:.1f} req/s, target {args.rps})")
+    print(f"successful: {len(latencies)}")
+    for name, count in errors.most_common():
+        print(f"error:      {name} x{count}")
+
+    if latencies:
+        ordered = sorted(latencies)
+        print(
+            "latency ms: "
+            f"mean={statistics.fmean(ordered) * 1000:.1f} "
+            f"p50={percentile(ordered, 0.5) * 1000:.1f} "
+            f"p90={percentile(ordered, 0.9) * 1000:.1f} "
+            f"p99={percentile(ordered, 0.99) * 1000:.1f} "
+            f"max={ordered[-1] * 1000:.1f}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="API URL to drive, by default a local stand-in server")
+    parser.add_argument("--api-key", default="loadgen-key")
+    parser.add_argument("--endpoint", choices=sorted(CALLS), default="version")
+    parser.add_argument("--rps", type=float, default=100.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in server latency")
+    parser.add_argument("--jitter", type=float, default=0.0, help="stand-in server jitter")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="stand-in 5xx rate")
+    parser.add_argument("--rate-limit", type=int, default=None, help="stand-in rate limit")
+    parser.add_argument(
+        "--loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default="auto",
+        help="event loop, auto uses uvloop if installed",
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"event loop: {type(asyncio.get_running_loop()).__module__}")
+
+    async with Client(api_key=args.api_key, max_concurrency=args.max_concurrency) as client:
+        if args.url:
+            client.adapter.api_url = args.url
+            await drive(client, CALLS[args.endpoint], args)
+            return
+
+        config = FakeAPIConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+        )
+        async with FakeAPIServer(MOCK_DIR, config=config) as server:
+            client.adapter.api_url = server.url
+            await drive(client, CALLS[args.endpoint], args)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run(main(args), use_uvloop={"auto": None, "asyncio": False, "uvloop": True}[args.loop])
@@ -0,0 +1,77 @@
+"""Compare the size and speed of model serialization formats.
+
+Fetches models from a local stand-in API and serializes them with
+``valopy.serialization``, :mod:`pickle` and JSON (``dataclasses.asdict`` on the
+way out, ``dict_to_dataclass`` on the way back, as when parsing a response)::
+
+    python benchmarks/serialization.py --players 1000 --content-scale 50
+"""
+
+import argparse
+import asyncio
+import json
+import pickle
+import timeit
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+from valopy import Client, Platform, Region
+from valopy.serialization import from_bytes, to_bytes
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+from valopy.utils import dict_to_dataclass
+
+MOCK_DIR = Path(__file__).parent.parent / "tests" / "mock"
+
+
+def json_formats(model: Any) -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    cls = type(model)
+    return (
+        lambda m: json.dumps(asdict(m), default=datetime.isoformat).encode("utf-8"),
+        lambda b: dict_to_dataclass(json.loads(b), cls),
+    )
+
+
+async def fetch_models(players: int, content_scale: int) -> Dict[str, Any]:
+    config = FakeAPIConfig(leaderboard_size=players, content_scale=content_scale)
+    async with FakeAPIServer(MOCK_DIR, config=config) as server, Client(api_key="bench") as client:
+        client.adapter.api_url = server.url
+        return {
+            "Leaderboard": await client.get_leaderboard(Region.EU, Platform.PC, size=players),
+            "Content": await client.get_content(),
+            "AccountV2": await client.get_account_v2("Player", "TAG"),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--content-scale", type=int, default=50)
+    parser.add_argument("--number", type=int, default=50, help="iterations per measurement")
+    args = parser.parse_args()
+
+    models = asyncio.run(fetch_models(args.players, args.content_scale))
+
+    print(f"{'model':<12} {'format':<8} {'bytes':>10} {'dump ms':>9} {'load ms':>9}")
+    for name, model in models.items():
+        formats = {
+            "valopy": (to_bytes, from_bytes),
+            "pickle": (lambda m: pickle.dumps(m, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            "json": json_formats(model),
+        }
+
+        for format_name, (dump, load) in formats.items():
+            data = dump(model)
+            assert load(data) == model, f"{format_name} did not round-trip {name}"
+
+            dump_ms = min(timeit.repeat(lambda: dump(model), number=args.number, repeat=3))
+            load_ms = min(timeit.repeat(lambda: load(data), number=args.number, repeat=3))
+            print(
+                f"{name:<12} {format_name:<8} {len(data):>10} "
+                f"{dump_ms * 1000 / args.number:>9.3f} {load_ms * 1000 / args.number:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ async def main() -> None:
         ("Player3", "TAG3"),
     ]
 
-    async with Client(api_key="your-api-key") as client:
+    # Bound the requests in flight and waiting, so large bursts do not pile up
+    async with Client(api_key="your-api-key", max_concurrency=10, max_queue=100) as client:
         # Fetch multiple accounts concurrently.
         tasks = [client.get_account_v2(name=name, tag=tag) for name, tag in players]
         accounts = await asyncio.gather(*tasks, return_exceptions=True)
@@ -6,6 +6,9 @@ from typing import Any, Dict
 from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from valopy.models import Result
 
@@ -38,6 +41,33 @@ def mock_adapter_get_result():
     return _create_result
 
 
+@pytest_asyncio.fixture
+async def api_server():
+    """Factory fixture for serving a fake API over HTTP.
+
+    Returns an async function that starts an aiohttp server with the given
+    ``{path: handler}`` routes and returns the base URL to use as ``Adapter.api_url``.
+    """
+
+    servers = []
+
+    async def _create_server(routes: Dict[str, Any]) -> str:
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_get(path, handler)
+
+        server = TestServer(app)
+        await server.start_server()
+        servers.append(server)
+
+        return str(server.make_url("")).rstrip("/")
+
+    yield _create_server
+
+    for server in servers:
+        await server.close()
+
+
 # Import MockDataLoader from parent conftest
 class MockDataLoader:
     """Load mock API response data from JSON files.
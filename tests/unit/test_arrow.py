@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import pytest
+
+from valopy import arrow
+from valopy.client import Client
+from valopy.enums import Platform, Region
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+
+MOCK_DIR = Path(__file__).parent.parent / "mock"
+
+
+class TestArrowExport:
+    """Test the optional Arrow and Parquet leaderboard export."""
+
+    def test_requires_pyarrow(self, monkeypatch) -> None:
+        """Test that a missing pyarrow raises an ImportError naming the extra."""
+
+        monkeypatch.setattr(arrow, "pa", None)
+        arrow.leaderboard_schema.cache_clear()
+
+        with pytest.raises(ImportError, match=r"valopy\[arrow\]"):
+            arrow.leaderboard_schema()
+
+        arrow.leaderboard_schema.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_write_snapshots(self, tmp_path) -> None:
+        """Test typed columns and one file per snapshot."""
+
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        async with (
+            FakeAPIServer(MOCK_DIR, FakeAPIConfig(leaderboard_size=2500)) as server,
+            Client(api_key="test-key") as client,
+        ):
+            client.adapter.api_url = server.url
+
+            path = await arrow.write_leaderboard_snapshot(client, tmp_path, Region.EU, Platform.PC)
+            assert path is not None and server.requests == 3
+
+            again = await arrow.write_leaderboard_snapshot(client, tmp_path, Region.EU, Platform.PC)
+            assert again is None and server.requests == 4
+
+        table = pq.read_table(tmp_path)
+        assert table.num_rows == 2500
+        assert table.schema.field("rr").type == pa.int32()
+        assert pa.types.is_dictionary(table.schema.field("tier_name").type)
+        assert table.column("leaderboard_rank").to_pylist()[:3] == [1, 2, 3]
+        assert table.column("tier_name").to_pylist()[0] == "Radiant"
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.breaker import CircuitBreaker, CircuitBreakerConfig
+from valopy.enums import CircuitState, Endpoint
+from valopy.exceptions import ValoPyCircuitOpenError, ValoPyServerError
+from valopy.models import Version
+
+
+class TestCircuitBreaker:
+    """Test per-endpoint circuit breaking."""
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_recovers(self, version, api_server) -> None:
+        """Test that an endpoint fails fast while open and closes after a good probe."""
+
+        upstream = {"healthy": False, "calls": 0}
+
+        async def handler(request: web.Request) -> web.Response:
+            upstream["calls"] += 1
+            if not upstream["healthy"]:
+                return web.json_response({"errors": []}, status=503)
+            return web.json_response(version)
+
+        adapter = Adapter(
+            api_key="test-key",
+            circuit_breaker=CircuitBreakerConfig(consecutive_failures=2, recovery_time=0.05),
+        )
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        for _ in range(2):
+            with pytest.raises(ValoPyServerError):
+                await adapter.get("/v1/version/eu", Version, endpoint=Endpoint.VERSION_V1)
+
+        breaker = adapter.circuit_breakers[Endpoint.VERSION_V1.name]
+        assert breaker.state is CircuitState.OPEN
+
+        with pytest.raises(ValoPyCircuitOpenError):
+            await adapter.get("/v1/version/eu", Version, endpoint=Endpoint.VERSION_V1)
+
+        assert upstream["calls"] == 2
+
+        upstream["healthy"] = True
+        await asyncio.sleep(0.06)
+
+        result = await adapter.get("/v1/version/eu", Version, endpoint=Endpoint.VERSION_V1)
+        assert isinstance(result.data, Version)
+        assert breaker.state is CircuitState.CLOSED
+
+        await adapter.close()
+
+    def test_only_probes_close_a_half_open_circuit(self) -> None:
+        """Test that a call started before the circuit opened cannot close it."""
+
+        breaker = CircuitBreaker(
+            name="VERSION_V1",
+            config=CircuitBreakerConfig(consecutive_failures=1, recovery_time=0.0),
+        )
+
+        straggler = breaker.before_call()
+        failing = breaker.before_call()
+        breaker.record_failure(failing)
+
+        probe = breaker.before_call()
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert probe is not None
+
+        # The straggler's success and release neither close nor free the probe slot
+        breaker.record_success(straggler)
+        breaker.release(straggler)
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(ValoPyCircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success(probe)
+        assert breaker.state is CircuitState.CLOSED
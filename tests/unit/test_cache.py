@@ -0,0 +1,52 @@
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.cache import NegativeCache, request_key
+from valopy.exceptions import ValoPyNotFoundError, ValoPyValidationError
+from valopy.models import AccountV2
+
+
+class TestNegativeCache:
+    """Test negative caching of 404 responses."""
+
+    def test_cache_bounded_and_expiring(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that entries are evicted when full and expire after the TTL."""
+
+        now = 100.0
+        monkeypatch.setattr("valopy.cache.time.monotonic", lambda: now)
+
+        cache = NegativeCache(ttl=10, maxsize=2)
+        for name in ("a", "b", "c"):
+            cache.put(request_key("GET", f"/v2/account/{name}/tag"), ValoPyNotFoundError(404))
+
+        assert len(cache) == 2
+        assert cache.get(request_key("GET", "/v2/account/a/tag")) is None
+        assert cache.get(request_key("GET", "/v2/account/c/tag")) is not None
+
+        now = 111.0
+        assert cache.get(request_key("GET", "/v2/account/c/tag")) is None
+
+        with pytest.raises(ValoPyValidationError):
+            NegativeCache(ttl=0)
+
+    @pytest.mark.asyncio
+    async def test_adapter_fails_fast_on_cached_404(self, api_server) -> None:
+        """Test that a repeated 404 lookup does not reach the API."""
+
+        calls = []
+
+        async def handler(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            return web.json_response({"errors": []}, status=404)
+
+        adapter = Adapter(api_key="test-key", negative_cache_ttl=60)
+        adapter.api_url = await api_server({"/v2/account/{name}/{tag}": handler})
+
+        for _ in range(3):
+            with pytest.raises(ValoPyNotFoundError):
+                await adapter.get("/v2/account/Nobody/0000", AccountV2, params={"force": "false"})
+
+        assert len(calls) == 1
+
+        await adapter.close()
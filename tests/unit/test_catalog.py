@@ -0,0 +1,68 @@
+import multiprocessing
+
+import pytest
+
+from valopy.catalog import ContentCatalog, compile_content
+from valopy.exceptions import ValoPyValidationError
+from valopy.models import Content
+from valopy.utils import dict_to_dataclass
+
+
+def _lookup_in_child(path: str, item_id: str) -> str:
+    with ContentCatalog(path) as catalog:
+        return catalog.name("maps", item_id)
+
+
+class TestContentCatalog:
+    """Test the memory-mapped content catalog."""
+
+    def test_lookups(self, content, tmp_path) -> None:
+        """Test id lookups, names and iteration against the source content."""
+
+        source = dict_to_dataclass(content["data"], Content)
+        path = compile_content(source, tmp_path / "content.cat")
+
+        with ContentCatalog(path) as catalog:
+            assert catalog.version == source.version
+            assert "skins" in catalog.categories and "playerTitles" in catalog.categories
+
+            for category in catalog.categories:
+                items = getattr(source, category)
+                assert catalog.count(category) == len(items)
+                assert sorted(catalog.ids(category)) == sorted(item.id for item in items)
+                for item in items:
+                    assert catalog.get(category, item.id) == item
+                    assert catalog.name(category, item.id) == item.name
+
+            assert catalog.get("maps", "missing") is None
+            with pytest.raises(ValoPyValidationError):
+                catalog.get("nope", "x")
+
+        with pytest.raises(ValoPyValidationError):
+            (tmp_path / "other.bin").write_bytes(b"not a catalog at all, but long enough")
+            ContentCatalog(tmp_path / "other.bin")
+
+    def test_truncated_catalog(self, content, tmp_path) -> None:
+        """Test that a truncated catalog raises a validation error instead of a struct error."""
+
+        source = dict_to_dataclass(content["data"], Content)
+        data = compile_content(source, tmp_path / "content.cat").read_bytes()
+
+        for size in (0, 10, len(data) // 2, len(data) - 1):
+            path = tmp_path / f"truncated-{size}.cat"
+            path.write_bytes(data[:size])
+
+            with pytest.raises(ValoPyValidationError), ContentCatalog(path) as catalog:
+                for category in catalog.categories:
+                    for item_id in catalog.ids(category):
+                        catalog.get(category, item_id)
+
+    def test_shared_between_processes(self, content, tmp_path) -> None:
+        """Test that another process maps the same file and finds the same items."""
+
+        source = dict_to_dataclass(content["data"], Content)
+        path = compile_content(source, tmp_path / "content.cat")
+        item = source.maps[0]
+
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            assert pool.apply(_lookup_in_child, (str(path), item.id)) == item.name
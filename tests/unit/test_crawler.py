@@ -0,0 +1,88 @@
+import asyncio
+import pickle
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from valopy.crawler import BudgetedTransport, ProcessCrawler, SharedRateBudget
+from valopy.exceptions import ValoPyRateLimitError
+from valopy.models import AccountV2
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+from valopy.transport import Transport
+
+MOCK_DIR = Path(__file__).parent.parent / "mock"
+
+
+class TestProcessCrawler:
+    """Test crawling across worker processes with a shared rate budget."""
+
+    def test_shared_rate_budget_follows_headers(self) -> None:
+        """Test that the budget probes once, then follows the rate limit headers."""
+
+        budget = SharedRateBudget(window=30.0)
+        headers = {
+            "x-ratelimit-limit": "3",
+            "x-ratelimit-remaining": "2",
+            "x-ratelimit-reset": "20",
+        }
+
+        # Only one probe is sent until the limit is known
+        wait, window_id = budget.try_acquire()
+        assert wait == 0
+        assert budget.try_acquire()[0] > 0
+
+        budget.update(headers, window_id)
+        assert budget.limit == 3
+        assert budget.try_acquire()[0] == 0
+        assert budget.try_acquire()[0] == 0
+        assert 19 <= budget.try_acquire()[0] <= 20
+
+        # A late response to a request of an older window does not move the current one
+        budget.update({**headers, "x-ratelimit-reset": "1"}, window_id - 1)
+        assert 19 <= budget.try_acquire()[0] <= 20
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_releases_the_budget(self) -> None:
+        """Test that a probe failing without a response lets the next probe through."""
+
+        class FailingTransport(Transport):
+            async def request(self, *args, **kwargs):
+                raise aiohttp.ClientConnectionError("connection reset")
+
+        budget = SharedRateBudget(window=30.0)
+        transport = BudgetedTransport(budget, FailingTransport())
+
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await transport.request("GET", "http://localhost/v1/version/eu", {})
+
+        # The next probe is let through instead of waiting for the window to end
+        assert budget.try_acquire()[0] == 0
+
+    def test_errors_pickle_with_attributes(self) -> None:
+        """Test that errors raised in workers keep their attributes across processes."""
+
+        error = pickle.loads(pickle.dumps(ValoPyRateLimitError(429, "https://example.com")))
+
+        assert error.status_code == 429
+        assert error.url == "https://example.com"
+
+    @pytest.mark.asyncio
+    async def test_process_crawler_stays_within_rate_limit(self) -> None:
+        """Test that all workers together stay within the API's rate limit."""
+
+        config = FakeAPIConfig(rate_limit=4, rate_window=1.0)
+        async with FakeAPIServer(MOCK_DIR, config) as server:
+            calls = [{"puuid": f"puuid-{i}"} for i in range(6)]
+
+            def crawl():
+                with ProcessCrawler(
+                    "test-key", processes=2, rate_window=1.0, chunk_size=2, api_url=server.url
+                ) as crawler:
+                    return crawler.batch("get_account_v2_by_puuid", calls)
+
+            results = await asyncio.get_running_loop().run_in_executor(None, crawl)
+
+        assert [account.puuid for account in results] == [call["puuid"] for call in calls]
+        assert all(isinstance(account, AccountV2) for account in results)
+        assert server.requests == len(calls)
@@ -0,0 +1,81 @@
+import asyncio
+import copy
+
+import pytest
+from aiohttp import web
+
+from valopy.client import Client
+from valopy.enums import EsportsRegion, League
+from valopy.exceptions import ValoPyNotFoundError, ValoPyValidationError
+
+
+class TestEsportsFanOut:
+    """Test fetching many esports schedules concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_merges_and_bounds_concurrency(self, api_server, esports) -> None:
+        """Test that overlapping events are merged and requests are bounded."""
+
+        in_flight = 0
+        peak = 0
+        seen = []
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            key = request.query.get("league") or request.query["region"]
+            seen.append(key)
+
+            # Every schedule contains a shared event and one of its own
+            own = copy.deepcopy(esports["data"][0])
+            own["match"]["id"] = key
+            return web.json_response({"status": 200, "data": [esports["data"][0], own]})
+
+        base_url = await api_server({"/v1/esports/schedule": handler})
+
+        async with Client(api_key="test-key") as client:
+            client.adapter.api_url = base_url
+
+            schedule = await client.get_esports_schedules(max_concurrency=3)
+            assert sorted(seen) == sorted(league.value for league in League)
+            assert len(schedule) == len(League) + 1
+            assert peak <= 3
+
+            seen.clear()
+            schedule = await client.get_esports_schedules(
+                leagues=[League.VCT_EMEA], regions=[EsportsRegion.INTERNATIONAL]
+            )
+            assert sorted(seen) == ["international", "vct_emea"]
+            assert len(schedule) == 3
+
+            with pytest.raises(ValoPyValidationError):
+                await client.get_esports_schedules(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_skips_failed_schedules(self, api_server, esports) -> None:
+        """Test that one failing league does not discard the other schedules."""
+
+        async def handler(request: web.Request) -> web.Response:
+            if request.query.get("league") == League.VCT_EMEA.value:
+                return web.json_response({"errors": []}, status=404)
+
+            own = copy.deepcopy(esports["data"][0])
+            own["match"]["id"] = request.query["league"]
+            return web.json_response({"status": 200, "data": [own]})
+
+        base_url = await api_server({"/v1/esports/schedule": handler})
+
+        async with Client(api_key="test-key") as client:
+            client.adapter.api_url = base_url
+
+            schedule = await client.get_esports_schedules(
+                leagues=[League.VCT_EMEA, League.VCT_AMERICAS]
+            )
+            assert len(schedule) == 1
+
+            with pytest.raises(ValoPyNotFoundError):
+                await client.get_esports_schedules(leagues=[League.VCT_EMEA])
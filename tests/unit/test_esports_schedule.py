@@ -0,0 +1,58 @@
+import copy
+from datetime import datetime, timezone
+
+from valopy.esports import EsportsSchedule
+from valopy.models import EsportsEvent
+from valopy.utils import dict_to_dataclass
+
+
+def make_event(base: dict, match_id: str, date: str, state: str, team: str) -> EsportsEvent:
+    data = copy.deepcopy(base)
+    data["match"]["id"] = match_id
+    data["date"] = date
+    data["state"] = state
+    data["match"]["teams"][1]["code"] = team
+    return dict_to_dataclass(data, EsportsEvent)
+
+
+class TestEsportsSchedule:
+    """Test the indexed esports schedule."""
+
+    def test_queries_and_incremental_update(self, esports) -> None:
+        """Test time window, upcoming and index queries across an update."""
+
+        base = esports["data"][0]
+        schedule = EsportsSchedule(
+            [
+                make_event(base, "3", "2025-05-12T15:00:00+00:00", "unstarted", "FNC"),
+                make_event(base, "1", "2025-05-10T15:00:00+00:00", "completed", "BBL"),
+                make_event(base, "2", "2025-05-11T15:00:00+00:00", "unstarted", "FNC"),
+            ]
+        )
+
+        def ids(events):
+            return [event.match.id for event in events]
+
+        assert ids(schedule) == ["1", "2", "3"]
+        start = datetime(2025, 5, 11, 15, tzinfo=timezone.utc)
+        assert ids(schedule.between(start, datetime(2025, 5, 12, 15, tzinfo=timezone.utc))) == ["2"]
+        assert ids(schedule.upcoming(5, now=start)) == ["2", "3"]
+        assert ids(schedule.by_team("FNC")) == ["2", "3"]
+        assert ids(schedule.by_team("TH")) == ["1", "2", "3"]
+        assert ids(schedule.by_league("vct_emea")) == ["1", "2", "3"]
+        assert ids(schedule.by_tournament("Stage 1")) == ["1", "2", "3"]
+
+        update = schedule.update(
+            [
+                make_event(base, "1", "2025-05-10T15:00:00+00:00", "completed", "BBL"),
+                make_event(base, "2", "2025-05-11T15:00:00+00:00", "completed", "FNC"),
+                make_event(base, "4", "2025-05-09T15:00:00+00:00", "completed", "KC"),
+            ]
+        )
+        assert ids(update.added) == ["4"] and ids(update.changed) == ["2"]
+        assert ids(schedule) == ["4", "1", "2", "3"]
+        assert ids(schedule.by_state("unstarted")) == ["3"]
+        assert ids(schedule.by_state("completed")) == ["4", "1", "2"]
+
+        assert schedule.remove("3").match.id == "3"
+        assert schedule.by_state("unstarted") == [] and "3" not in schedule
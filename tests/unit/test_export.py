@@ -0,0 +1,61 @@
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from valopy.client import Client
+from valopy.enums import ExportFormat, Platform, Region
+from valopy.exceptions import ValoPyValidationError
+from valopy.export import export_content, export_leaderboard
+from valopy.models import Content
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+from valopy.utils import dict_to_dataclass
+
+MOCK_DIR = Path(__file__).parent.parent / "mock"
+
+
+class TestExport:
+    """Test streaming row exports."""
+
+    @pytest.mark.asyncio
+    async def test_export_leaderboard(self, tmp_path) -> None:
+        """Test that every page is streamed to gzipped NDJSON and to CSV."""
+
+        async with (
+            FakeAPIServer(MOCK_DIR, FakeAPIConfig(leaderboard_size=2500)) as server,
+            Client(api_key="test-key") as client,
+        ):
+            client.adapter.api_url = server.url
+
+            path = tmp_path / "ladder.ndjson.gz"
+            assert await export_leaderboard(client, path, Region.EU, Platform.PC) == 2500
+
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f]
+            assert [row["leaderboard_rank"] for row in rows] == list(range(1, 2501))
+            assert rows[0]["updated_at"].startswith("20")
+
+            buffer = io.StringIO()
+            count = await export_leaderboard(
+                client, buffer, Region.EU, Platform.PC, format=ExportFormat.CSV, page_size=2000
+            )
+            rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+            assert count == len(rows) == 2500 and rows[-1]["leaderboard_rank"] == "2500"
+
+    def test_export_content(self, content, tmp_path) -> None:
+        """Test content rows with a category column and JSON-encoded nested values."""
+
+        catalog = dict_to_dataclass(content["data"], Content)
+        path = tmp_path / "content.csv"
+
+        count = export_content(catalog, path, format=ExportFormat.CSV, categories=["maps", "acts"])
+        rows = list(csv.DictReader(path.open(encoding="utf-8")))
+        assert count == len(rows) == len(catalog.maps) + len(catalog.acts)
+        assert rows[0]["category"] == "maps" and rows[0]["name"] == catalog.maps[0].name
+        assert json.loads(rows[0]["localizedNames"]) == catalog.maps[0].localizedNames
+
+        with pytest.raises(ValoPyValidationError):
+            export_content(catalog, tmp_path / "bad.ndjson", categories=["nope"])
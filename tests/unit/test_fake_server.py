@@ -0,0 +1,63 @@
+from pathlib import Path
+
+import pytest
+
+from valopy.client import Client
+from valopy.enums import Platform, Region
+from valopy.exceptions import ValoPyRateLimitError, ValoPyServerError
+from valopy.models import Content, Version
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+
+MOCK_DIR = Path(__file__).parent.parent / "mock"
+
+
+class TestFakeAPIServer:
+    """Test the stand-in API server."""
+
+    @pytest.mark.asyncio
+    async def test_serves_fixtures_and_synthetic_payloads(self) -> None:
+        """Test that fixtures are served and large payloads are synthesized."""
+
+        config = FakeAPIConfig(leaderboard_size=5000, content_scale=50)
+        async with (
+            FakeAPIServer(MOCK_DIR, config=config) as server,
+            Client(api_key="test-key") as client,
+        ):
+            client.adapter.api_url = server.url
+
+            assert isinstance(await client.get_version(Region.EU), Version)
+
+            content = await client.get_content()
+            assert isinstance(content, Content)
+            assert len(content.characters) == 50
+
+            page = await client.get_leaderboard(Region.EU, Platform.PC, size=200, start_index=450)
+            assert [p.leaderboard_rank for p in page.players] == list(range(451, 651))
+            assert page.players[0].tier == 27 and page.players[-1].tier == 26
+            assert page.results.total == 5000 and page.results.after == 4350
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_and_faults(self) -> None:
+        """Test rate limit headers, 429 responses and injected server errors."""
+
+        async with (
+            FakeAPIServer(MOCK_DIR, FakeAPIConfig(rate_limit=2)) as server,
+            Client(api_key="test-key") as client,
+        ):
+            client.adapter.api_url = server.url
+
+            await client.get_version(Region.EU)
+            assert client.adapter.key_pool.states[0].remaining == 1
+
+            await client.get_version(Region.EU)
+            with pytest.raises(ValoPyRateLimitError):
+                await client.get_version(Region.EU)
+
+            server.config = FakeAPIConfig(error_rate=1.0)
+            with pytest.raises(ValoPyServerError):
+                await client.get_version(Region.EU)
+
+            server.config = FakeAPIConfig(slow_body_rate=1.0, slow_body_time=0.05)
+            assert isinstance(await client.get_version(Region.EU), Version)
+
+        assert server.requests == 5
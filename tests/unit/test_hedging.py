@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.hedging import HedgeConfig, Hedger
+from valopy.models import Version
+
+
+class TestHedging:
+    """Test hedged GET requests."""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_over_slow_request(self, version, api_server) -> None:
+        """Test that a hedge is sent after the delay and the fastest response wins."""
+
+        calls = []
+
+        async def handler(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return web.json_response(version)
+
+        adapter = Adapter(api_key="test-key", hedge=HedgeConfig(delay=0.05))
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        started = time.monotonic()
+        result = await adapter.get("/v1/version/eu", Version)
+
+        assert isinstance(result.data, Version)
+        assert time.monotonic() - started < 0.5
+        assert len(calls) == 2
+        assert adapter.key_pool.states[0].in_flight == 0
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_rate_limit_headroom(self, version, api_server) -> None:
+        """Test that hedges are not sent when they could trigger a 429."""
+
+        calls = []
+
+        async def handler(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            await asyncio.sleep(0.1)
+            return web.json_response(
+                version, headers={"x-ratelimit-remaining": "1", "x-ratelimit-reset": "60"}
+            )
+
+        adapter = Adapter(api_key="test-key", hedge=HedgeConfig(delay=0.01))
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        await adapter.get("/v1/version/eu", Version)
+        calls.clear()
+
+        await adapter.get("/v1/version/eu", Version)
+        assert len(calls) == 1
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_hedge_takes_a_request_slot(self, version, api_server) -> None:
+        """Test that hedges respect max_concurrency and trace only the winning attempt."""
+
+        calls = []
+        traces = []
+
+        async def handler(request: web.Request) -> web.Response:
+            calls.append(request.path)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return web.json_response(version)
+
+        url = await api_server({"/v1/version/{region}": handler})
+
+        # The only slot is held by the first attempt, so no hedge is sent
+        adapter = Adapter(api_key="test-key", max_concurrency=1, hedge=HedgeConfig(delay=0.05))
+        adapter.api_url = url
+        await adapter.get("/v1/version/eu", Version)
+        await adapter.close()
+
+        assert len(calls) == 1
+
+        calls.clear()
+        adapter = Adapter(
+            api_key="test-key",
+            max_concurrency=2,
+            hedge=HedgeConfig(delay=0.05),
+            trace_hooks=[traces.append],
+        )
+        adapter.api_url = url
+        started = time.monotonic()
+        await adapter.get("/v1/version/eu", Version)
+        await adapter.close()
+
+        assert time.monotonic() - started < 0.5
+        assert len(calls) == 2
+        assert adapter.scheduler.active == 0
+        assert traces[-1].status_code == 200
+        assert traces[-1].total < 0.5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_attempt_latency_is_recorded(self) -> None:
+        """Test that the losing attempt's elapsed time counts towards the hedge delay."""
+
+        hedger = Hedger(HedgeConfig(delay=0.02))
+        attempts = iter([1.0, 0.0])
+
+        async def attempt() -> str:
+            await asyncio.sleep(next(attempts))
+            return "ok"
+
+        assert await hedger.run("VERSION_V1", attempt, can_hedge=lambda: True) == "ok"
+
+        latencies = sorted(hedger._latencies["VERSION_V1"])
+        assert len(latencies) == 2
+        assert latencies[1] >= 0.02
+
+    def test_delay_follows_observed_quantile(self) -> None:
+        """Test that the hedge delay uses the observed latency quantile."""
+
+        hedger = Hedger(HedgeConfig(min_samples=10, default_delay=2.0))
+        assert hedger.delay("ACCOUNT_BY_NAME_V2") == 2.0
+
+        for i in range(1, 101):
+            hedger.record("ACCOUNT_BY_NAME_V2", i / 100)
+
+        assert hedger.delay("ACCOUNT_BY_NAME_V2") == pytest.approx(0.95)
@@ -0,0 +1,35 @@
+import importlib
+import subprocess
+import sys
+
+import valopy
+
+
+class TestLazyImports:
+    """Test lazy loading of the public API."""
+
+    def test_import_does_not_load_submodules(self) -> None:
+        """Test that importing valopy loads neither aiohttp nor the models."""
+
+        code = (
+            "import sys, valopy; "
+            "assert 'aiohttp' not in sys.modules; "
+            "assert 'valopy.models' not in sys.modules; "
+            "valopy.Season; "
+            "assert 'aiohttp' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_public_names_match_submodules(self) -> None:
+        """Test that every lazy name resolves and matches its submodule's __all__."""
+
+        modules = set(valopy._LAZY_IMPORTS.values())
+        for module_name in modules:
+            module = importlib.import_module(f"valopy.{module_name}")
+            expected = {n for n, m in valopy._LAZY_IMPORTS.items() if m == module_name}
+
+            assert set(module.__all__) == expected, module_name
+            for name in expected:
+                assert getattr(valopy, name) is getattr(module, name)
+
+        assert set(valopy.__all__) <= set(dir(valopy))
@@ -0,0 +1,89 @@
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.exceptions import ValoPyPermissionError, ValoPyRateLimitError
+from valopy.keys import KeyPool
+from valopy.models import Version
+
+
+class TestKeyPool:
+    """Test routing requests over several API keys."""
+
+    def test_acquire_prefers_headroom(self) -> None:
+        """Test that the key with the most remaining quota is selected."""
+
+        pool = KeyPool(["a", "b"])
+        pool.release(pool.acquire(), {"x-ratelimit-remaining": "1", "x-ratelimit-reset": "60"})
+        pool.release(pool.acquire(), {"x-ratelimit-remaining": "20", "x-ratelimit-reset": "60"})
+
+        assert pool.acquire() == "b"
+
+        pool.mark_rate_limited("b", reset="60")
+        assert pool.acquire() == "a"
+
+        pool.mark_rate_limited("a", reset="60")
+        assert pool.available() == 0
+        assert pool.retry_after() > 0
+
+    @pytest.mark.asyncio
+    async def test_adapter_skips_rejected_key(self, version, api_server) -> None:
+        """Test that a key causing a permission error is taken out of rotation."""
+
+        seen_keys = []
+
+        async def handler(request: web.Request) -> web.Response:
+            key = request.headers["Authorization"]
+            seen_keys.append(key)
+
+            if key == "bad-key":
+                return web.json_response({"errors": []}, status=401)
+
+            return web.json_response(
+                version,
+                headers={"x-ratelimit-remaining": "29", "x-ratelimit-reset": "60"},
+            )
+
+        adapter = Adapter(api_key=["bad-key", "good-key"])
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        for _ in range(3):
+            result = await adapter.get("/v1/version/eu", Version)
+            assert isinstance(result.data, Version)
+
+        assert seen_keys.count("bad-key") == 1
+        assert adapter.key_pool.states[0].disabled
+
+        adapter.key_pool.disable("good-key")
+        with pytest.raises(ValoPyPermissionError):
+            await adapter.get("/v1/version/eu", Version)
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_adapter_raises_when_every_key_is_rate_limited(self, api_server) -> None:
+        """Test that the last 429 is raised when retries with other keys run out."""
+
+        seen_keys = []
+
+        async def handler(request: web.Request) -> web.Response:
+            seen_keys.append(request.headers["Authorization"])
+
+            # A zero reset leaves the keys available, so the adapter keeps retrying
+            return web.json_response(
+                {"errors": [{"message": "Rate limit exceeded", "status": 429}]},
+                status=429,
+                headers={"x-ratelimit-remaining": "0", "x-ratelimit-reset": "0"},
+            )
+
+        adapter = Adapter(api_key=["key-a", "key-b"])
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        try:
+            with pytest.raises(ValoPyRateLimitError):
+                await adapter.get("/v1/version/eu", Version)
+        finally:
+            await adapter.close()
+
+        # One attempt per key, then the last 429 is raised instead of returned
+        assert len(seen_keys) == 2
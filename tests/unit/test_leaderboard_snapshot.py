@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from valopy.client import Client
+from valopy.enums import Platform, Region
+from valopy.leaderboard import LeaderboardSnapshot, SnapshotEntry
+from valopy.models import Leaderboard, ResultMetadata
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+
+MOCK_DIR = Path(__file__).parent.parent / "mock"
+UPDATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def entry(puuid: str, rank: int, rr: int) -> SnapshotEntry:
+    return SnapshotEntry(puuid=puuid, name=puuid, tag="EUW", rank=rank, rr=rr, tier=27, wins=10)
+
+
+class TestLeaderboardSnapshot:
+    """Test leaderboard snapshots and diffs."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_skips_unchanged_leaderboard(self) -> None:
+        """Test that a full fetch pages through and an unchanged refresh stops after one page."""
+
+        async with (
+            FakeAPIServer(MOCK_DIR, FakeAPIConfig(leaderboard_size=2500)) as server,
+            Client(api_key="test-key") as client,
+        ):
+            client.adapter.api_url = server.url
+
+            snapshot = await LeaderboardSnapshot.fetch(client, Region.EU, Platform.PC)
+            assert len(snapshot) == 2500 and server.requests == 3
+            assert snapshot.region == "eu" and snapshot.platform == "pc"
+
+            refreshed = await LeaderboardSnapshot.fetch(
+                client, Region.EU, Platform.PC, previous=snapshot
+            )
+            assert refreshed is snapshot and server.requests == 4
+
+    def test_diff_and_round_trip(self, tmp_path) -> None:
+        """Test rank deltas, entrants and dropouts, and compact persistence."""
+
+        older = LeaderboardSnapshot(
+            [entry("a", 1, 900), entry("b", 2, 850), entry("c", 3, 800)], updated_at=UPDATED_AT
+        )
+        newer = LeaderboardSnapshot(
+            [entry("b", 1, 910), entry("a", 2, 900), entry("d", 3, 820)], updated_at=UPDATED_AT
+        )
+
+        diff = newer.diff(older)
+        assert [(c.puuid, c.rank_delta, c.rr_delta) for c in diff.moved] == [
+            ("b", 1, 60),
+            ("a", -1, 0),
+        ]
+        assert [e.puuid for e in diff.entered] == ["d"]
+        assert [e.puuid for e in diff.dropped] == ["c"]
+
+        path = tmp_path / "snapshot.bin"
+        newer.save(path)
+        loaded = LeaderboardSnapshot.load(path)
+        assert list(loaded) == list(newer) and loaded.updated_at == UPDATED_AT
+
+    def test_from_leaderboard_keeps_metadata(self) -> None:
+        """Test that a single page keeps its region and platform and a missing timestamp."""
+
+        page = Leaderboard(results=ResultMetadata(total=0, returned=0, before=0, after=0))
+        page.updated_at = None
+
+        snapshot = LeaderboardSnapshot.from_leaderboard(page, Region.EU, Platform.PC)
+        assert snapshot.region == "eu" and snapshot.platform == "pc"
+
+        loaded = LeaderboardSnapshot.from_bytes(snapshot.to_bytes())
+        assert loaded.updated_at is None and loaded.region == "eu"
@@ -0,0 +1,59 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.models import Version
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool counting the submitted jobs."""
+
+    submitted = 0
+
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestOffload:
+    """Test offloading deserialization of large responses."""
+
+    @pytest.mark.asyncio
+    async def test_offload_above_threshold(self, version, api_server) -> None:
+        """Test that only responses above the threshold are deserialized in the executor."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response(version)
+
+        with CountingExecutor(max_workers=1) as executor:
+            adapter = Adapter(api_key="test-key", executor=executor, offload_threshold=10**6)
+            adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+            result = await adapter.get("/v1/version/eu", Version)
+            assert isinstance(result.data, Version)
+            assert executor.submitted == 0
+
+            adapter.offload_threshold = 0
+            offloaded = await adapter.get("/v1/version/eu", Version)
+            assert offloaded.data == result.data
+            assert executor.submitted == 1
+
+            await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_offload_to_process_pool(self, version, api_server) -> None:
+        """Test that deserialization can run in a process pool."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response(version)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            adapter = Adapter(api_key="test-key", executor=executor, offload_threshold=0)
+            adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+            result = await adapter.get("/v1/version/eu", Version)
+            assert isinstance(result.data, Version)
+
+            await adapter.close()
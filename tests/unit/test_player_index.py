@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from valopy.exceptions import ValoPyValidationError
+from valopy.leaderboard import PlayerIndex
+from valopy.models import LeaderboardPlayer
+
+UPDATED_AT = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def player(
+    puuid: str, name: str, tag: str, rank: int, anonymized: bool = False
+) -> LeaderboardPlayer:
+    return LeaderboardPlayer(
+        puuid=puuid,
+        name=name,
+        tag=tag,
+        card="",
+        title="",
+        is_banned=False,
+        is_anonymized=anonymized,
+        leaderboard_rank=rank,
+        tier=27,
+        rr=500,
+        wins=10,
+        updated_at=UPDATED_AT,
+    )
+
+
+class TestPlayerIndex:
+    """Test local player lookups."""
+
+    def test_lookups(self) -> None:
+        """Test PUUID, Riot ID and prefix lookups including anonymized players."""
+
+        index = PlayerIndex(
+            [
+                player("a", "Verity", "Mary", 2),
+                player("b", "vertigo", "EUW", 1),
+                player("c", "Verity", "Other", 3),
+                player("d", "", "", 4, anonymized=True),
+                player("e", "Zed", "1", 5),
+            ]
+        )
+
+        assert len(index) == 5 and index.anonymized == 1
+        assert index.get("d").leaderboard_rank == 4 and "x" not in index
+
+        assert index.find("VERITY", "mary").puuid == "a"
+        assert index.find("verity#OTHER").puuid == "c"
+        assert index.find("verity", "euw") is None
+
+        assert [p.puuid for p in index.search("ver", limit=None)] == ["a", "c", "b"]
+        assert [p.puuid for p in index.search("VER", limit=2)] == ["a", "c"]
+        assert index.search("")[0].puuid == "a"
+        assert index.search("q") == []
+
+    def test_find_requires_a_tag(self) -> None:
+        """Test that a name without a tag is rejected instead of never matching."""
+
+        index = PlayerIndex([player("a", "Verity", "Mary", 1)])
+
+        with pytest.raises(ValoPyValidationError):
+            index.find("Verity")
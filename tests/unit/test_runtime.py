@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from valopy import Client
+from valopy.runtime import new_event_loop, run, uvloop_available
+
+
+class TestRuntime:
+    """Test event loop selection and connection pool sizing."""
+
+    def test_uvloop_can_be_disabled(self, monkeypatch) -> None:
+        """Test that VALOPY_UVLOOP=0 keeps the default asyncio event loop."""
+
+        monkeypatch.setenv("VALOPY_UVLOOP", "0")
+        assert not uvloop_available()
+
+        loop = new_event_loop()
+        try:
+            assert type(loop).__module__.startswith("asyncio")
+        finally:
+            loop.close()
+
+    def test_run_uses_uvloop_when_installed(self) -> None:
+        """Test that run() picks the event loop requested with use_uvloop."""
+
+        uvloop = pytest.importorskip("uvloop")
+
+        async def loop_type():
+            return type(asyncio.get_running_loop())
+
+        assert run(loop_type(), use_uvloop=True) is uvloop.Loop
+        assert run(loop_type(), use_uvloop=False) is not uvloop.Loop
+
+    @pytest.mark.asyncio
+    async def test_connector_sized_to_max_concurrency(self) -> None:
+        """Test that the connection pool is limited to the adapter's max_concurrency."""
+
+        async with Client(api_key="test-key", max_concurrency=5) as client:
+            session = await client.adapter.transport._get_session()
+
+            assert session.connector.limit == 5
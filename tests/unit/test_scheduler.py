@@ -0,0 +1,138 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from valopy import Client, Region
+from valopy.enums import OverloadPolicy, Priority
+from valopy.exceptions import ValoPyOverloadError
+from valopy.keys import KeyPool
+from valopy.scheduler import RequestScheduler, current_priority, request_priority
+from valopy.testing import FakeAPIConfig, FakeAPIServer
+
+MOCK_DIR = Path(__file__).parent.parent / "mock"
+
+
+class TestRequestScheduler:
+    """Test priority scheduling of request slots and rate limit tokens."""
+
+    @pytest.mark.asyncio
+    async def test_high_priority_gets_next_slot(self) -> None:
+        """Test that a waiting high priority request pre-empts queued bulk requests."""
+
+        scheduler = RequestScheduler(max_concurrency=1)
+        order = []
+
+        async def request(name: str, priority: Priority) -> None:
+            await scheduler.acquire(priority)
+            order.append(name)
+            await asyncio.sleep(0)
+            scheduler.release()
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(request(f"bulk-{i}", Priority.LOW)) for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(request("interactive", Priority.HIGH)))
+        await asyncio.sleep(0)
+
+        assert scheduler.waiting == 4
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["interactive", "bulk-0", "bulk-1", "bulk-2"]
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_tokens_by_priority(self) -> None:
+        """Test that keys are handed out in priority order once the window resets."""
+
+        scheduler = RequestScheduler(wait_for_rate_limit=True)
+        pool = KeyPool("key")
+        pool.mark_rate_limited("key", reset=0.05)
+
+        order = []
+
+        async def request(name: str, priority: Priority) -> None:
+            assert await scheduler.acquire_key(pool, priority) == "key"
+            order.append(name)
+
+        low = asyncio.create_task(request("bulk", Priority.LOW))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(request("interactive", Priority.HIGH))
+        await asyncio.gather(low, high)
+
+        assert order == ["interactive", "bulk"]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self) -> None:
+        """Test that requests beyond max_queue wait outside the queue and keep their order."""
+
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=1)
+        order = []
+
+        async def request(name: str) -> None:
+            await scheduler.acquire()
+            order.append(name)
+            scheduler.release()
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(request(f"request-{i}")) for i in range(3)]
+        await asyncio.sleep(0)
+
+        assert len(scheduler._slot_waiters) == 1
+        assert scheduler.waiting == 3
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["request-0", "request-1", "request-2"]
+        assert scheduler.active == 0
+        assert scheduler.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_while_waiting_for_room_during_release(self) -> None:
+        """Test that a room waiter cancelled in the same step as release passes the room on."""
+
+        scheduler = RequestScheduler(max_concurrency=1, max_queue=0)
+
+        await scheduler.acquire()
+        cancelled = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        following = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        scheduler.release()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+        await asyncio.wait_for(following, 1)
+
+        assert scheduler.active == 1
+        assert scheduler.waiting == 0
+
+    @pytest.mark.asyncio
+    async def test_client_rejects_requests_when_overloaded(self) -> None:
+        """Test that a burst beyond max_concurrency and max_queue fails fast."""
+
+        client = Client(
+            api_key="test-key", max_concurrency=2, max_queue=3, overload=OverloadPolicy.REJECT
+        )
+        async with FakeAPIServer(MOCK_DIR, FakeAPIConfig(latency=0.05)) as server, client:
+            client.adapter.api_url = server.url
+            results = await asyncio.gather(
+                *(client.get_version(Region.EU) for _ in range(10)), return_exceptions=True
+            )
+
+        rejected = [r for r in results if isinstance(r, ValoPyOverloadError)]
+        assert len(rejected) == 5
+        assert server.requests == 5
+
+    def test_request_priority_context(self) -> None:
+        """Test that the priority context manager sets and restores the priority."""
+
+        with request_priority(Priority.LOW):
+            assert current_priority() is Priority.LOW
+
+        assert current_priority() is Priority.NORMAL
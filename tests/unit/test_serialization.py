@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from valopy.exceptions import ValoPyValidationError
+from valopy.models import AccountV1, Content, Leaderboard, WebsiteContent
+from valopy.serialization import from_bytes, to_bytes
+from valopy.utils import dict_to_dataclass
+
+
+class TestSerialization:
+    """Test the compact binary model serialization."""
+
+    def test_round_trip(self, leaderboard, content, website, account_v1) -> None:
+        """Test that models and lists of models round-trip unchanged."""
+
+        board = dict_to_dataclass(leaderboard["data"], Leaderboard)
+        catalog = dict_to_dataclass(content["data"], Content)
+        articles = [dict_to_dataclass(item, WebsiteContent) for item in website["data"]]
+        account = dict_to_dataclass(account_v1["data"], AccountV1)
+
+        for model in (board, catalog, articles, account, []):
+            assert from_bytes(to_bytes(model)) == model
+
+        restored = from_bytes(to_bytes(board))
+        assert restored.updated_at.tzinfo is timezone.utc
+        assert restored.threshold_index.tier_for_rank(1).name == "Radiant"
+
+    def test_mismatched_values_and_errors(self, website) -> None:
+        """Test values that differ from their declared type, and invalid input."""
+
+        article = dict_to_dataclass(website["data"][0], WebsiteContent)
+        article.date = "not a date"
+        assert from_bytes(to_bytes(article)).date == "not a date"
+
+        offset = timezone(timedelta(hours=2))
+        article.date = datetime(2025, 1, 1, 12, 30, 15, 123456, tzinfo=offset)
+        assert from_bytes(to_bytes(article)).date == article.date
+        article.date = datetime(2025, 1, 1)
+        assert from_bytes(to_bytes(article)).date == article.date
+
+        with pytest.raises(ValoPyValidationError):
+            to_bytes({"id": "x"})
+        with pytest.raises(ValoPyValidationError):
+            from_bytes(b"not valopy data")
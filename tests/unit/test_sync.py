@@ -0,0 +1,65 @@
+import inspect
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from valopy.client import Client
+from valopy.enums import Region
+from valopy.exceptions import ValoPyNotFoundError
+from valopy.models import Version
+from valopy.sync import SyncClient
+
+
+class TestSyncClient:
+    """Test the blocking client facade."""
+
+    def test_mirrors_client_methods(self) -> None:
+        """Test that every public Client method has a blocking counterpart."""
+
+        for name, _ in inspect.getmembers(Client, inspect.isfunction):
+            if not name.startswith("_") and name != "close":
+                assert callable(getattr(SyncClient, name, None)), name
+
+    def test_calls_and_batch_share_session(self, version) -> None:
+        """Test blocking calls and batches on the background loop with one session."""
+
+        peers = set()
+
+        async def handler(request: web.Request) -> web.Response:
+            if request.match_info["region"] == "kr":
+                return web.json_response({"errors": []}, status=404)
+
+            peers.add(request.transport.get_extra_info("peername"))
+            return web.json_response(version)
+
+        async def start_server() -> TestServer:
+            app = web.Application()
+            app.router.add_get("/v1/version/{region}", handler)
+            server = TestServer(app)
+            await server.start_server()
+            return server
+
+        with SyncClient(api_key="test-key", max_concurrency=1) as client:
+            # Serve the fake API from the client's own loop thread
+            server = client._run(start_server())
+            client.client.adapter.api_url = str(server.make_url("")).rstrip("/")
+
+            assert isinstance(client.get_version(Region.EU), Version)
+
+            results = client.batch(
+                "get_version",
+                [{"region": Region.EU}, {"region": Region.KR}, {"region": Region.NA}],
+                return_exceptions=True,
+            )
+            assert isinstance(results[0], Version)
+            assert isinstance(results[1], ValoPyNotFoundError)
+            assert isinstance(results[2], Version)
+
+            # Requests were sent over one keep-alive connection
+            assert len(peers) == 1
+
+            client._run(server.close())
+
+        with pytest.raises(RuntimeError):
+            client.get_version(Region.EU)
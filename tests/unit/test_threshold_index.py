@@ -0,0 +1,28 @@
+from valopy.models import Leaderboard
+from valopy.utils import dict_to_dataclass
+
+
+class TestThresholdIndex:
+    """Test tier lookups over leaderboard thresholds."""
+
+    def test_lookups(self, leaderboard) -> None:
+        """Test rank, RR and per-tier queries against the fixture thresholds."""
+
+        board = dict_to_dataclass(leaderboard["data"], Leaderboard)
+        index = board.threshold_index
+        assert board.threshold_index is index
+
+        assert index.tier_for_rank(1).name == "Radiant"
+        assert index.tier_for_rank(500).name == "Radiant"
+        assert index.tier_for_rank(501).name == "Immortal 3"
+        assert index.tier_for_rank(15000).name == "Immortal 1"
+        assert index.tier_for_rank(0) is None and index.tier_for_rank(15001) is None
+
+        assert index.tier_for_rr(549).name == "Immortal 3"
+        assert index.tier_for_rr(550).name == "Radiant"
+        assert index.tier_for_rr(-1) is None
+        assert index.rr_for_tier(26) == 200 and index.rr_for_tier(3) is None
+
+        assert index.rank_range(27) == range(1, 501)
+        assert index.players_per_tier() == {27: 500, 26: 3088, 25: 3935, 24: 7477}
+        assert sum(index.players_per_tier().values()) == board.results.total
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from valopy import Client
+from valopy.adapter import Adapter
+from valopy.exceptions import ValoPyClientTimeoutError, ValoPyTimeoutError
+from valopy.models import Version
+from valopy.timeouts import RequestTimeout, deadline, remaining_time
+
+
+class TestTimeouts:
+    """Test request timeouts and deadline propagation."""
+
+    @pytest.mark.asyncio
+    async def test_request_timeout(self, version, api_server) -> None:
+        """Test that a hung upstream raises a client timeout instead of blocking."""
+
+        async def handler(request: web.Request) -> web.Response:
+            await asyncio.sleep(1)
+            return web.json_response(version)
+
+        adapter = Adapter(api_key="test-key", timeout=RequestTimeout(first_byte=0.05))
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        with pytest.raises(ValoPyTimeoutError) as exc_info:
+            await adapter.get("/v1/version/eu", Version)
+
+        assert isinstance(exc_info.value, ValoPyClientTimeoutError)
+        assert exc_info.value.phase == "first_byte"
+
+        with pytest.raises(ValoPyClientTimeoutError) as exc_info:
+            await adapter.get("/v1/version/eu", Version, timeout=RequestTimeout(total=0.05))
+
+        assert exc_info.value.phase == "total"
+
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_client_method_timeout(self, version, api_server) -> None:
+        """Test that a timeout passed to a client method overrides the adapter's."""
+
+        async def handler(request: web.Request) -> web.Response:
+            await asyncio.sleep(0.2)
+            return web.json_response(version)
+
+        client = Client(api_key="test-key", timeout=RequestTimeout(total=5))
+        client.adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        try:
+            with pytest.raises(ValoPyClientTimeoutError) as exc_info:
+                await client.get_version(timeout=RequestTimeout(total=0.05))
+
+            assert exc_info.value.phase == "total"
+            assert isinstance(await client.get_version(), Version)
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_remaining_work(self, version, api_server) -> None:
+        """Test that requests queued or in flight are cancelled when the deadline passes."""
+
+        async def handler(request: web.Request) -> web.Response:
+            await asyncio.sleep(0.1)
+            return web.json_response(version)
+
+        adapter = Adapter(api_key="test-key", max_concurrency=1)
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        started = time.monotonic()
+        with deadline(0.15):
+            results = await asyncio.gather(
+                *(adapter.get("/v1/version/eu", Version) for _ in range(5)),
+                return_exceptions=True,
+            )
+
+        assert time.monotonic() - started < 0.5
+        assert isinstance(results[0].data, Version)
+        assert all(isinstance(result, ValoPyClientTimeoutError) for result in results[2:])
+        assert all(result.phase == "deadline" for result in results[2:])
+        assert remaining_time() is None
+
+        await adapter.close()
@@ -0,0 +1,64 @@
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.exceptions import ValoPyNotFoundError
+from valopy.models import Version
+from valopy.tracing import Histogram, LatencyCollector
+
+
+class TestTracing:
+    """Test request tracing and latency histograms."""
+
+    @pytest.mark.asyncio
+    async def test_trace_reports_timings(self, version, api_server) -> None:
+        """Test that hooks receive network and deserialization timings per endpoint."""
+
+        async def handler(request: web.Request) -> web.Response:
+            return web.json_response(version)
+
+        async def missing(request: web.Request) -> web.Response:
+            return web.json_response({"errors": []}, status=404)
+
+        traces = []
+        collector = LatencyCollector()
+        adapter = Adapter(api_key="test-key", trace_hooks=[traces.append])
+        adapter.add_trace_hook(collector)
+        adapter.api_url = await api_server(
+            {"/v1/version/{region}": handler, "/v1/missing": missing}
+        )
+
+        await adapter.get("/v1/version/eu", Version)
+        with pytest.raises(ValoPyNotFoundError):
+            await adapter.get("/v1/missing", Version)
+
+        trace = traces[0]
+        assert trace.status_code == 200
+        assert trace.response_bytes > 0
+        assert trace.connect is not None
+        for phase in (trace.queued, trace.first_byte, trace.total, trace.decode, trace.model):
+            assert phase is not None and phase >= 0
+        assert trace.first_byte <= trace.total
+
+        assert traces[1].status_code == 404
+        assert isinstance(traces[1].error, ValoPyNotFoundError)
+
+        snapshot = collector.snapshot()
+        assert snapshot["/v1/version/eu"]["total"].count == 1
+        assert snapshot["/v1/version/eu"]["response_bytes"].max == trace.response_bytes
+        assert collector.errors() == {"/v1/missing": 1}
+
+        await adapter.close()
+
+    def test_histogram_quantiles(self) -> None:
+        """Test that quantiles are estimated within one bucket."""
+
+        histogram = Histogram.exponential(1e-4, 1.25, 63)
+        for millis in range(1, 101):
+            histogram.record(millis / 1000)
+
+        snapshot = histogram.snapshot()
+        assert snapshot.count == 100
+        assert snapshot.min == 0.001 and snapshot.max == 0.1
+        assert 0.05 <= snapshot.p50 <= 0.05 * 1.25
+        assert 0.099 <= snapshot.p99 <= 0.1
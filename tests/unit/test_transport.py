@@ -0,0 +1,78 @@
+import time
+
+import pytest
+from aiohttp import web
+
+from valopy.adapter import Adapter
+from valopy.client import Client
+from valopy.enums import Region
+from valopy.exceptions import ValoPyNotFoundError, ValoPyServerError
+from valopy.models import Version
+from valopy.transport import Cassette, RecordingTransport, ReplayTransport, Transport
+
+
+class TestTransport:
+    """Test the record and replay transports."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_replay(self, version, api_server, tmp_path) -> None:
+        """Test that recorded responses replay identically without a server."""
+
+        async def handler(request: web.Request) -> web.Response:
+            if request.match_info["region"] == "kr":
+                return web.json_response({"errors": []}, status=404)
+            return web.json_response(version, headers={"x-ratelimit-remaining": "29"})
+
+        recorder = RecordingTransport()
+        adapter = Adapter(api_key="secret-key", transport=recorder)
+        adapter.api_url = await api_server({"/v1/version/{region}": handler})
+
+        recorded = await adapter.get("/v1/version/eu", Version, params={"force": "false"})
+        with pytest.raises(ValoPyNotFoundError):
+            await adapter.get("/v1/version/kr", Version)
+        await adapter.close()
+
+        cassette_path = tmp_path / "cassette.json"
+        recorder.cassette.save(cassette_path)
+        assert "secret-key" not in cassette_path.read_text()
+
+        replayer = ReplayTransport(Cassette.load(cassette_path))
+        replay_adapter = Adapter(api_key="test-key", transport=replayer)
+        replay_adapter.api_url = "http://offline"
+
+        replayed = await replay_adapter.get("/v1/version/eu", Version, params={"force": "false"})
+        assert replayed.data == recorded.data
+        assert replay_adapter.key_pool.states[0].remaining == 29
+        with pytest.raises(ValoPyNotFoundError):
+            await replay_adapter.get("/v1/version/kr", Version)
+        with pytest.raises(LookupError):
+            await replay_adapter.get("/v1/version/na", Version)
+
+    @pytest.mark.asyncio
+    async def test_replay_latency_and_errors(self, version) -> None:
+        """Test that mock data can seed a cassette served with latency and injected errors."""
+
+        cassette = Cassette()
+        cassette.add_json("/valorant/v1/version/eu", version)
+
+        transport = ReplayTransport(cassette, latency=0.05)
+        async with Client(api_key="test-key", transport=transport) as client:
+            started = time.monotonic()
+            assert isinstance(await client.get_version(Region.EU), Version)
+            assert time.monotonic() - started >= 0.05
+
+            transport.error_rate = 1.0
+            with pytest.raises(ValoPyServerError):
+                await client.get_version(Region.EU)
+
+        assert transport.requests == 2
+
+    def test_transport_requires_request(self) -> None:
+        """Test that a transport without request fails when created, not when used."""
+
+        class IncompleteTransport(Transport):
+            async def close(self) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            IncompleteTransport()
@@ -0,0 +1,55 @@
+import copy
+
+import pytest
+from aiohttp import web
+
+from valopy.client import Client
+from valopy.enums import CountryCode
+from valopy.website import WebsiteAggregator
+
+
+class TestWebsiteAggregator:
+    """Test aggregating website feeds of many country codes."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_returns_only_new_articles(self, api_server, website) -> None:
+        """Test de-duplication across countries and high-water filtering across refreshes."""
+
+        articles = copy.deepcopy(website["data"][:2])
+        failing = {"fr-fr"}
+
+        async def handler(request: web.Request) -> web.Response:
+            countrycode = request.match_info["countrycode"]
+            if countrycode in failing:
+                return web.json_response({"errors": []}, status=404)
+
+            # Every locale lists the same shared articles plus its own one
+            own = copy.deepcopy(website["data"][2])
+            own["id"] = own["url"] = countrycode
+            return web.json_response({"status": 200, "data": [*articles, own]})
+
+        base_url = await api_server({"/v1/website/{countrycode}": handler})
+
+        async with Client(api_key="test-key") as client:
+            client.adapter.api_url = base_url
+            aggregator = WebsiteAggregator(
+                client, [CountryCode.EN_US, CountryCode.DE_DE, CountryCode.FR_FR]
+            )
+
+            first = await aggregator.refresh()
+            assert [item.id for item in first[:2]] == [a["id"] for a in articles]
+            assert sorted(item.id for item in first[2:]) == ["de-de", "en-us"]
+            assert len(aggregator.feed(CountryCode.DE_DE)) == 3
+            assert aggregator.feed(CountryCode.FR_FR) == []
+
+            assert await aggregator.refresh() == []
+
+            latest = copy.deepcopy(articles[0])
+            latest["id"] = "breaking"
+            latest["url"] = "https://example.com/breaking"
+            latest["date"] = "2026-01-01T00:00:00Z"
+            articles.insert(0, latest)
+            failing.clear()
+
+            second = await aggregator.refresh()
+            assert [item.id for item in second] == ["breaking", "fr-fr"]
@@ -15,13 +15,188 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2025-present Vinc0739"
 __version__ = "0.4.1"
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .adapter import *
+    from .arrow import *
+    from .breaker import *
+    from .cache import *
+    from .catalog import *
+    from .client import *
+    from .crawler import *
+    from .enums import *
+    from .esports import *
+    from .exceptions import *
+    from .export import *
+    from .hedging import *
+    from .keys import *
+    from .leaderboard import *
+    from .models import *
+    from .runtime import *
+    from .scheduler import *
+    from .serialization import *
+    from .sync import *
+    from .timeouts import *
+    from .tracing import *
+    from .transport import *
+    from .website import *
+
+# Public names and the submodule defining them, imported on first access so that
+# importing valopy does not load aiohttp and every model up front
+_LAZY_IMPORTS = {
+    "Adapter": "adapter",
+    "leaderboard_schema": "arrow",
+    "leaderboard_to_record_batch": "arrow",
+    "LeaderboardParquetWriter": "arrow",
+    "write_leaderboard_snapshot": "arrow",
+    "CircuitBreakerConfig": "breaker",
+    "CircuitBreaker": "breaker",
+    "request_key": "cache",
+    "NegativeCache": "cache",
+    "compile_content": "catalog",
+    "ContentCatalog": "catalog",
+    "Client": "client",
+    "SharedRateBudget": "crawler",
+    "BudgetedTransport": "crawler",
+    "ProcessCrawler": "crawler",
+    "AllowedMethod": "enums",
+    "Priority": "enums",
+    "OverloadPolicy": "enums",
+    "CircuitState": "enums",
+    "ExportFormat": "enums",
+    "Locale": "enums",
+    "Region": "enums",
+    "Platform": "enums",
+    "Season": "enums",
+    "CountryCode": "enums",
+    "EsportsRegion": "enums",
+    "League": "enums",
+    "Endpoint": "enums",
+    "ScheduleUpdate": "esports",
+    "EsportsSchedule": "esports",
+    "ValoPyError": "exceptions",
+    "ValoPyHTTPError": "exceptions",
+    "ValoPyRequestError": "exceptions",
+    "ValoPyPermissionError": "exceptions",
+    "ValoPyNotFoundError": "exceptions",
+    "ValoPyValidationError": "exceptions",
+    "ValoPyCircuitOpenError": "exceptions",
+    "ValoPyOverloadError": "exceptions",
+    "ValoPyTimeoutError": "exceptions",
+    "ValoPyClientTimeoutError": "exceptions",
+    "ValoPyRateLimitError": "exceptions",
+    "ValoPyServerError": "exceptions",
+    "from_status": "exceptions",
+    "from_client_response_error": "exceptions",
+    "LEADERBOARD_FIELDS": "export",
+    "CONTENT_FIELDS": "export",
+    "RowWriter": "export",
+    "export_leaderboard": "export",
+    "export_content": "export",
+    "HedgeConfig": "hedging",
+    "Hedger": "hedging",
+    "KeyState": "keys",
+    "KeyPool": "keys",
+    "ThresholdIndex": "leaderboard",
+    "PlayerIndex": "leaderboard",
+    "SnapshotEntry": "leaderboard",
+    "RankChange": "leaderboard",
+    "LeaderboardDiff": "leaderboard",
+    "LeaderboardSnapshot": "leaderboard",
+    "ValoPyModel": "models",
+    "Result": "models",
+    "ResultMetadata": "models",
+    "CardData": "models",
+    "AccountV1": "models",
+    "AccountV2": "models",
+    "ContentCharacter": "models",
+    "ContentMap": "models",
+    "ContentItem": "models",
+    "ContentPlayerTitle": "models",
+    "ContentAct": "models",
+    "Content": "models",
+    "Version": "models",
+    "WebsiteContent": "models",
+    "StatusTranslation": "models",
+    "StatusTitle": "models",
+    "StatusUpdate": "models",
+    "StatusEntry": "models",
+    "Status": "models",
+    "QueuePartySize": "models",
+    "QueueHighSkill": "models",
+    "QueueSkillDisparityTier": "models",
+    "QueueSkillDisparity": "models",
+    "QueueGameRules": "models",
+    "QueueMapInfo": "models",
+    "QueueMap": "models",
+    "QueueData": "models",
+    "EsportsLeague": "models",
+    "EsportsTournament": "models",
+    "EsportsGameType": "models",
+    "EsportsTeamRecord": "models",
+    "EsportsTeam": "models",
+    "EsportsMatch": "models",
+    "EsportsEvent": "models",
+    "LeaderboardTier": "models",
+    "LeaderboardThreshold": "models",
+    "LeaderboardPlayer": "models",
+    "Leaderboard": "models",
+    "uvloop_available": "runtime",
+    "new_event_loop": "runtime",
+    "run": "runtime",
+    "connector_options": "runtime",
+    "current_priority": "scheduler",
+    "request_priority": "scheduler",
+    "RequestScheduler": "scheduler",
+    "to_bytes": "serialization",
+    "from_bytes": "serialization",
+    "SyncClient": "sync",
+    "RequestTimeout": "timeouts",
+    "remaining_time": "timeouts",
+    "deadline": "timeouts",
+    "TIMING_METRICS": "tracing",
+    "RequestTrace": "tracing",
+    "TraceHook": "tracing",
+    "create_trace_config": "tracing",
+    "HistogramSnapshot": "tracing",
+    "Histogram": "tracing",
+    "LatencyCollector": "tracing",
+    "TransportResponse": "transport",
+    "Transport": "transport",
+    "AiohttpTransport": "transport",
+    "Interaction": "transport",
+    "Cassette": "transport",
+    "RecordingTransport": "transport",
+    "ReplayTransport": "transport",
+    "WebsiteAggregator": "website",
+}
+
+_SUBMODULES = {*_LAZY_IMPORTS.values(), "testing", "utils"}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+    # Cache the value so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
 
-from .adapter import *
-from .client import *
-from .enums import *
-from .exceptions import *
-from .models import *
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
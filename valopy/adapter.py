@@ -1,15 +1,53 @@
+import asyncio
+import functools
 import logging
-from typing import TYPE_CHECKING, Optional, Type
+import time
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import aiohttp
 
-from .enums import AllowedMethod
-from .exceptions import from_client_response_error
+from .breaker import CircuitBreaker, CircuitBreakerConfig
+from .cache import NegativeCache, request_key
+from .enums import AllowedMethod, Endpoint, OverloadPolicy, Priority
+from .exceptions import (
+    ValoPyClientTimeoutError,
+    ValoPyHTTPError,
+    ValoPyNotFoundError,
+    ValoPyPermissionError,
+    ValoPyRateLimitError,
+    ValoPyServerError,
+    ValoPyTimeoutError,
+    ValoPyValidationError,
+    from_status,
+)
+from .hedging import HedgeConfig, Hedger
+from .keys import KeyPool
 from .models import Result, ValoPyModel
-from .utils import dict_to_dataclass
+from .runtime import connector_options
+from .scheduler import RequestScheduler, current_priority
+from .timeouts import RequestTimeout, remaining_time
+from .tracing import RequestTrace, TraceHook
+from .transport import AiohttpTransport, Transport, TransportResponse
+from .utils import deserialize_response
 
 if TYPE_CHECKING:
     import types
+    from concurrent.futures import Executor
+
+__all__ = [
+    "Adapter",
+]
 
 _log = logging.getLogger(__name__)
 
@@ -22,65 +60,138 @@ class Adapter:
 
     Attributes
     ----------
-    api_key : :class:`str`
-        The API key used for authentication.
+    key_pool : :class:`~valopy.keys.KeyPool`
+        The API keys used for authentication.
     api_url : :class:`str`
         The base URL for the Valorant API.
+    negative_cache : Optional[:class:`~valopy.cache.NegativeCache`]
+        Cache of requests that returned 404 Not Found, if enabled.
+    scheduler : :class:`~valopy.scheduler.RequestScheduler`
+        Schedules requests by priority over request slots and rate limit headroom.
+    circuit_breakers : Dict[:class:`str`, :class:`~valopy.breaker.CircuitBreaker`]
+        Circuit breakers by endpoint, created on first use if enabled.
+    timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+        Default timeouts of every request.
+    hedger : Optional[:class:`~valopy.hedging.Hedger`]
+        Sends hedged GET requests, if enabled.
+    trace_hooks : List[Callable[[:class:`~valopy.tracing.RequestTrace`], None]]
+        Callbacks receiving the timings of every finished request.
+    executor : Optional[:class:`concurrent.futures.Executor`]
+        Executor deserializing large responses, None for the event loop's default executor.
+    offload_threshold : Optional[:class:`int`]
+        Response size in bytes from which deserialization runs in the executor.
+    transport : :class:`~valopy.transport.Transport`
+        The transport sending the requests.
     """
 
-    def __init__(self, api_key: str, redact_header: bool = True) -> None:
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        redact_header: bool = True,
+        negative_cache_ttl: Optional[float] = None,
+        negative_cache_size: int = 1024,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        overload: OverloadPolicy = OverloadPolicy.WAIT,
+        wait_for_rate_limit: bool = False,
+        circuit_breaker: Optional[CircuitBreakerConfig] = None,
+        timeout: Optional[RequestTimeout] = None,
+        hedge: Optional[HedgeConfig] = None,
+        trace_hooks: Optional[Sequence[TraceHook]] = None,
+        executor: Optional["Executor"] = None,
+        offload_threshold: Optional[int] = None,
+        transport: Optional[Transport] = None,
+    ) -> None:
         """Initialize the Adapter.
 
         Parameters
         ----------
-        api_key : :class:`str`
-            The API key used for authentication.
+        api_key : Union[:class:`str`, Sequence[:class:`str`]]
+            The API key used for authentication. Pass several keys to route each
+            request to the key with the most rate limit headroom.
         redact_header : Optional[:class:`bool`]
             Whether to redact the API key in logs, by default True
+        negative_cache_ttl : Optional[:class:`float`]
+            Seconds to remember 404 Not Found responses and fail fast without
+            a request, by default None (disabled)
+        negative_cache_size : :class:`int`, default 1024
+            Maximum number of remembered 404 responses, by default 1024
+        max_concurrency : Optional[:class:`int`]
+            Maximum number of requests in flight, further requests wait for a
+            slot in priority order, by default None (no limit)
+        max_queue : Optional[:class:`int`]
+            Maximum number of requests waiting for a slot, requires
+            ``max_concurrency``, by default None (no limit)
+        overload : :class:`~valopy.enums.OverloadPolicy`, default OverloadPolicy.WAIT
+            Whether requests arriving while the wait queue is full wait for
+            room or raise :exc:`~valopy.exceptions.ValoPyOverloadError`, by default WAIT
+        wait_for_rate_limit : :class:`bool`, default False
+            Whether to wait in priority order until an API key has rate limit
+            headroom instead of sending requests that would fail with 429, by default False
+        circuit_breaker : Optional[:class:`~valopy.breaker.CircuitBreakerConfig`]
+            Thresholds for per-endpoint circuit breakers that fail fast during
+            upstream outages, by default None (disabled)
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Default connect, first byte and total timeouts of every request,
+            by default None (aiohttp defaults)
+        hedge : Optional[:class:`~valopy.hedging.HedgeConfig`]
+            Settings for sending a second identical GET request when the first
+            one is slow, by default None (disabled)
+        trace_hooks : Optional[Sequence[Callable[[:class:`~valopy.tracing.RequestTrace`], None]]]
+            Callbacks receiving the timings of every finished request, by default None
+        executor : Optional[:class:`concurrent.futures.Executor`]
+            Thread or process pool deserializing large responses, by default None
+            (the event loop's default thread pool)
+        offload_threshold : Optional[:class:`int`]
+            Response size in bytes from which JSON decoding and model building
+            run in the executor instead of on the event loop, by default None (disabled)
+        transport : Optional[:class:`~valopy.transport.Transport`]
+            The transport sending the requests, e.g. a
+            :class:`~valopy.transport.ReplayTransport` for offline load tests,
+            by default a new :class:`~valopy.transport.AiohttpTransport` with
+            :func:`~valopy.runtime.connector_options`
         """
 
+        if offload_threshold is not None and offload_threshold < 0:
+            raise ValoPyValidationError("offload_threshold must not be negative")
+
         self.api_url = "https://api.henrikdev.xyz/valorant"
         self.redact_header = redact_header
+        self.negative_cache = (
+            NegativeCache(ttl=negative_cache_ttl, maxsize=negative_cache_size)
+            if negative_cache_ttl
+            else None
+        )
 
-        self._api_key = api_key
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.key_pool = KeyPool(api_key)
+        self.scheduler = RequestScheduler(
+            max_concurrency=max_concurrency,
+            wait_for_rate_limit=wait_for_rate_limit,
+            max_queue=max_queue,
+            overload=overload,
+        )
+        self.circuit_breaker_config = circuit_breaker
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self.timeout = timeout
+        self.hedger = Hedger(hedge) if hedge else None
+        self.trace_hooks: List[TraceHook] = list(trace_hooks or [])
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+
+        self.transport = transport or AiohttpTransport(connector_options(max_concurrency))
 
         _log.info(
-            "Adapter initialized with API URL: %s (redact_header=%s)",
+            "Adapter initialized with API URL: %s (redact_header=%s, keys=%d)",
             self.api_url,
             redact_header,
+            len(self.key_pool),
         )
         _log.debug("Adapter ready for making requests")
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create the persistent aiohttp session.
-
-        Returns
-        -------
-        :class:`aiohttp.ClientSession`
-            The persistent session for making requests.
-        """
-
-        if self._session is None or self._session.closed:
-            _log.info("Creating new aiohttp ClientSession")
-
-            self._session = aiohttp.ClientSession()
-
-        else:
-            _log.debug("Reusing existing aiohttp ClientSession")
-
-        return self._session
-
     async def close(self) -> None:
-        """Close the persistent session."""
-
-        if self._session and not self._session.closed:
-            _log.info("Closing aiohttp ClientSession")
+        """Close the transport and its persistent session."""
 
-            await self._session.close()
-
-        else:
-            _log.debug("Session already closed or was never created")
+        await self.transport.close()
 
     async def __aenter__(self) -> "Adapter":
         """Async context manager entry.
@@ -112,12 +223,319 @@ class Adapter:
 
         await self.close()
 
+    def add_trace_hook(self, hook: TraceHook) -> None:
+        """Register a callback receiving the timings of every finished request.
+
+        Hooks are called synchronously after each request, so they should be
+        fast. Exceptions raised by a hook are logged and ignored.
+
+        Parameters
+        ----------
+        hook : Callable[[:class:`~valopy.tracing.RequestTrace`], None]
+            The callback, e.g. a :class:`~valopy.tracing.LatencyCollector`.
+        """
+
+        self.trace_hooks.append(hook)
+
+    def _emit_trace(self, trace: RequestTrace) -> None:
+        """Pass a finished trace to every trace hook.
+
+        Parameters
+        ----------
+        trace : :class:`~valopy.tracing.RequestTrace`
+            The finished trace.
+        """
+
+        for hook in self.trace_hooks:
+            try:
+                hook(trace)
+            except Exception:
+                _log.exception("Trace hook %r failed", hook)
+
+    def _get_circuit_breaker(self, name: str) -> Optional[CircuitBreaker]:
+        """Get or create the circuit breaker for an endpoint.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The endpoint name, or the endpoint path for requests without an endpoint.
+
+        Returns
+        -------
+        Optional[:class:`~valopy.breaker.CircuitBreaker`]
+            The endpoint's circuit breaker, or None if circuit breaking is disabled.
+        """
+
+        if self.circuit_breaker_config is None:
+            return None
+
+        breaker = self.circuit_breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name=name, config=self.circuit_breaker_config)
+            self.circuit_breakers[name] = breaker
+
+        return breaker
+
+    def _can_hedge(self) -> bool:
+        """Check whether a hedge request fits in the request queue and rate limit budget.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a hedge may be sent now.
+        """
+
+        if self.hedger is None or self.scheduler.waiting:
+            return False
+
+        # The hedge takes a request slot of its own, it must not wait for one
+        max_concurrency = self.scheduler.max_concurrency
+        if max_concurrency is not None and self.scheduler.active >= max_concurrency:
+            return False
+
+        return self.key_pool.headroom() >= self.hedger.config.min_headroom
+
+    async def _hedged(
+        self,
+        hedger: Hedger,
+        name: str,
+        send: Callable[..., Awaitable[TransportResponse]],
+        priority: Priority,
+        trace: Optional[RequestTrace],
+    ) -> TransportResponse:
+        """Send a request with the hedger, each attempt filling in its own trace.
+
+        Parameters
+        ----------
+        hedger : :class:`~valopy.hedging.Hedger`
+            The adapter's hedger.
+        name : :class:`str`
+            The endpoint name.
+        send : Callable[..., Awaitable[:class:`~valopy.transport.TransportResponse`]]
+            Sends one attempt, taking the ``trace`` to fill in.
+        priority : :class:`Priority`
+            The scheduling priority of the request.
+        trace : Optional[:class:`~valopy.tracing.RequestTrace`]
+            The trace of the call, filled in with the timings of the winning attempt.
+
+        Returns
+        -------
+        :class:`~valopy.transport.TransportResponse`
+            The response of the first successful attempt.
+        """
+
+        async def attempt() -> Tuple[TransportResponse, Optional[RequestTrace]]:
+            # Concurrent attempts would overwrite each other's timings in one trace
+            attempt_trace = None
+            if trace is not None:
+                attempt_trace = RequestTrace(
+                    method=trace.method,
+                    endpoint_path=trace.endpoint_path,
+                    endpoint=trace.endpoint,
+                    started=trace.started,
+                )
+            return await send(trace=attempt_trace), attempt_trace
+
+        async def hedge() -> Tuple[TransportResponse, Optional[RequestTrace]]:
+            # The caller's slot is held by the first attempt, the hedge takes its own
+            await self.scheduler.acquire(priority)
+            try:
+                return await attempt()
+            finally:
+                self.scheduler.release()
+
+        response, winner_trace = await hedger.run(
+            name=name, attempt=attempt, can_hedge=self._can_hedge, hedge=hedge
+        )
+
+        if trace is not None and winner_trace is not None:
+            trace.__dict__.update(winner_trace.__dict__)
+
+        return response
+
+    @staticmethod
+    def _timeout_error(error: BaseException, url: str) -> ValoPyClientTimeoutError:
+        """Convert an aiohttp timeout to a ValoPyClientTimeoutError.
+
+        Parameters
+        ----------
+        error : :class:`BaseException`
+            The raised timeout error.
+        url : :class:`str`
+            The URL of the request.
+
+        Returns
+        -------
+        :exc:`ValoPyClientTimeoutError`
+            The error naming the exceeded timeout.
+        """
+
+        if isinstance(error, aiohttp.ConnectionTimeoutError):
+            phase = "connect"
+        elif isinstance(error, aiohttp.SocketTimeoutError):
+            phase = "first_byte"
+        else:
+            phase = "total"
+
+        return ValoPyClientTimeoutError(phase=phase, url=url)
+
+    async def _send(
+        self,
+        method: AllowedMethod,
+        endpoint_path: str,
+        params: Optional[dict],
+        cache_key: tuple,
+        priority: Priority,
+        timeout: Optional[RequestTimeout],
+        trace: Optional[RequestTrace] = None,
+    ) -> TransportResponse:
+        """Send a request with the best available API key and read the body.
+
+        Parameters
+        ----------
+        method : :class:`AllowedMethod`
+            The HTTP method to use for the request.
+        endpoint_path : :class:`str`
+            The formatted API endpoint path to call.
+        params : Optional[:class:`dict`]
+            Query parameters to include in the request.
+        cache_key : :class:`tuple`
+            The negative cache key of the request.
+        priority : :class:`Priority`
+            The scheduling priority of the request.
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            The timeouts of the request.
+        trace : Optional[:class:`~valopy.tracing.RequestTrace`]
+            The trace to fill in with the timings of the request, by default None
+
+        Returns
+        -------
+        :class:`~valopy.transport.TransportResponse`
+            The successful response.
+        """
+
+        # Construct the full URL
+        url = f"{self.api_url}{endpoint_path}"
+
+        # Retry with another key while the selected one is rate limited or rejected
+        for _ in range(len(self.key_pool)):
+            api_key = await self.scheduler.acquire_key(self.key_pool, priority)
+            headers = {"accept": "application/json", "Authorization": api_key}
+            response = None
+
+            try:
+                # Log request initiation
+                _log.info(
+                    "Starting %s request to endpoint: %s",
+                    method.value,
+                    endpoint_path,
+                )
+                _log.debug(
+                    "API Key: %s Full URL: %s (params=%s)",
+                    api_key if not self.redact_header else "[REDACTED]",
+                    url,
+                    params,
+                )
+
+                if trace is not None:
+                    trace.queued = time.perf_counter() - trace.started
+                    trace.mark("request")
+
+                # Make the HTTP request
+                response = await self.transport.request(
+                    method=method.value,
+                    url=url,
+                    headers=headers,
+                    params=params,
+                    timeout=timeout,
+                    trace=trace,
+                )
+
+                if trace is not None:
+                    trace.status_code = response.status
+                    trace.response_bytes = len(response.body)
+                    trace.total = trace.elapsed("request")
+
+            except asyncio.TimeoutError as e:
+                _log.error("Timeout on %s request to endpoint %s", method.value, endpoint_path)
+
+                raise self._timeout_error(error=e, url=url) from e
+
+            except aiohttp.ClientError as e:
+                _log.error(
+                    "Client error on %s request to %s: %s",
+                    method.value,
+                    url,
+                    str(e),
+                    exc_info=True,
+                )
+
+                raise
+
+            finally:
+                self.key_pool.release(api_key, response.headers if response else None)
+
+            # Check for HTTP errors
+            if response.status >= 400:
+                _log.error(
+                    "HTTP error %d on %s request to endpoint %s",
+                    response.status,
+                    method.value,
+                    endpoint_path,
+                )
+
+                error = from_status(
+                    status_code=response.status,
+                    url=url,
+                    message=response.reason,
+                    request_headers=headers,
+                    response_headers=response.headers,
+                    redacted=self.redact_header,
+                )
+
+                if isinstance(error, ValoPyRateLimitError):
+                    self.key_pool.mark_rate_limited(api_key, error.rate_reset)
+                elif isinstance(error, ValoPyPermissionError):
+                    self.key_pool.disable(api_key)
+
+                if self.negative_cache is not None and isinstance(error, ValoPyNotFoundError):
+                    _log.debug("Storing 404 response for %s in negative cache", endpoint_path)
+                    self.negative_cache.put(cache_key, error)
+
+                if (
+                    isinstance(error, (ValoPyRateLimitError, ValoPyPermissionError))
+                    and self.key_pool.available()
+                ):
+                    _log.info("Retrying request to %s with another API key", endpoint_path)
+                    continue
+
+                raise error
+
+            break
+
+        else:
+            # Every attempt was rate limited or rejected, e.g. by keys whose window
+            # had already reset again, so the last response is an error
+            raise error
+
+        _log.debug(
+            "%s request completed with status %d (size: %d bytes)",
+            method.value,
+            response.status,
+            len(response.body),
+        )
+
+        return response
+
     async def _do(
         self,
         method: AllowedMethod,
         endpoint_path: str,
         model_class: Type[ValoPyModel],
         params: Optional[dict] = None,
+        priority: Optional[Priority] = None,
+        endpoint: Optional[Endpoint] = None,
+        timeout: Optional[RequestTimeout] = None,
     ) -> Result:
         """Make an HTTP request to the Valorant API.
 
@@ -131,6 +549,13 @@ class Adapter:
             The dataclass type to deserialize the response into
         params : Optional[:class:`dict`]
             Query parameters to include in the request, by default None
+        priority : Optional[:class:`Priority`]
+            The scheduling priority of the request, by default the priority
+            set with :func:`~valopy.scheduler.request_priority`
+        endpoint : Optional[:class:`Endpoint`]
+            The endpoint being called, used to select its circuit breaker, by default None
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -145,121 +570,193 @@ class Adapter:
             Raised when a 401 Unauthorized error occurs, indicating invalid or missing API key.
         :exc:`ValoPyNotFoundError`
             Raised when a 404 Not Found error occurs, indicating the resource does not exist.
+            Also raised without a request when the negative cache holds a recent 404 for it.
         :exc:`ValoPyTimeoutError`
             Raised when a 408 Request Timeout error occurs, indicating the request took too long.
+        :exc:`ValoPyClientTimeoutError`
+            Raised when a timeout or the deadline set with :func:`~valopy.timeouts.deadline`
+            is exceeded before the response was read.
         :exc:`ValoPyRateLimitError`
             Raised when a 429 Too Many Requests error occurs, indicating rate limit exceeded.
         :exc:`ValoPyServerError`
             Raised when a 5xx Server Error occurs, indicating an issue with the API server.
         :exc:`ValoPyHTTPError`
             Raised for other HTTP errors not covered by specific exception types.
+        :exc:`ValoPyCircuitOpenError`
+            Raised without a request while the endpoint's circuit breaker is open.
+        :exc:`ValoPyOverloadError`
+            Raised without a request when the wait queue is full and ``overload`` is REJECT.
         :exc:`aiohttp.ClientError`
             Raised for client-level errors such as connection issues or network problems.
         """
 
-        # Construct the full URL and headers
-        url = f"{self.api_url}{endpoint_path}"
-        headers = {"accept": "application/json", "Authorization": self._api_key}
+        if not self.trace_hooks:
+            return await self._call(
+                method=method,
+                endpoint_path=endpoint_path,
+                model_class=model_class,
+                params=params,
+                priority=priority,
+                endpoint=endpoint,
+                timeout=timeout,
+            )
 
-        # Get the session
-        session = await self._get_session()
+        trace = RequestTrace(method=method.value, endpoint_path=endpoint_path, endpoint=endpoint)
 
         try:
-            # Log request initiation
-            _log.info(
-                "Starting %s request to endpoint: %s",
-                method.value,
-                endpoint_path,
-            )
-            _log.debug(
-                "API Key: %s Full URL: %s (params=%s)",
-                self._api_key if not self.redact_header else "[REDACTED]",
-                url,
-                params,
-            )
-
-            # Make the HTTP request
-            response = await session.request(
-                method=method.value,
-                url=url,
-                headers=headers,
+            return await self._call(
+                method=method,
+                endpoint_path=endpoint_path,
+                model_class=model_class,
                 params=params,
+                priority=priority,
+                endpoint=endpoint,
+                timeout=timeout,
+                trace=trace,
             )
+        except BaseException as e:
+            trace.error = e
+            if isinstance(e, ValoPyHTTPError) and trace.status_code is None:
+                trace.status_code = e.status_code
+            raise
+        finally:
+            self._emit_trace(trace)
 
-            # Check for HTTP errors
-            response.raise_for_status()
-            _log.debug("HTTP %d response received", response.status)
-
-        except aiohttp.ClientResponseError as e:
-            _log.error(
-                "HTTP error %d on %s request to endpoint %s",
-                e.status,
-                method.value,
-                endpoint_path,
-                exc_info=True,
-            )
+    async def _call(
+        self,
+        method: AllowedMethod,
+        endpoint_path: str,
+        model_class: Type[ValoPyModel],
+        params: Optional[dict] = None,
+        priority: Optional[Priority] = None,
+        endpoint: Optional[Endpoint] = None,
+        timeout: Optional[RequestTimeout] = None,
+        trace: Optional[RequestTrace] = None,
+    ) -> Result:
+        """Make an HTTP request to the Valorant API, filling in the trace if given.
 
-            raise from_client_response_error(error=e, redacted=self.redact_header) from e
+        See :meth:`_do` for the parameters and raised errors.
+        """
 
-        except aiohttp.ClientError as e:
-            _log.error(
-                "Client error on %s request to %s: %s", method.value, url, str(e), exc_info=True
-            )
+        # Fail fast on requests that recently returned 404
+        cache_key = request_key(method.value, endpoint_path, params)
+        if self.negative_cache is not None:
+            cached_error = self.negative_cache.get(cache_key)
+            if cached_error is not None:
+                _log.info(
+                    "Negative cache hit for %s request to endpoint: %s",
+                    method.value,
+                    endpoint_path,
+                )
+
+                raise ValoPyNotFoundError(
+                    status_code=cached_error.status_code, url=cached_error.url
+                )
+
+        # Fail fast while the endpoint is failing upstream
+        name = endpoint.name if endpoint else endpoint_path
+        breaker = self._get_circuit_breaker(name)
+        probe = breaker.before_call() if breaker is not None else None
+
+        if priority is None:
+            priority = current_priority()
+
+        # Spend at most the time left until the context's deadline, including queueing
+        budget = remaining_time()
+        if budget is not None and budget <= 0:
+            if breaker is not None:
+                breaker.release(probe)
+
+            raise ValoPyClientTimeoutError(phase="deadline", url=f"{self.api_url}{endpoint_path}")
 
+        try:
+            try:
+                async with asyncio.timeout(budget):
+                    # Wait for a request slot, higher priorities are served first
+                    await self.scheduler.acquire(priority)
+                    try:
+                        send = functools.partial(
+                            self._send,
+                            method=method,
+                            endpoint_path=endpoint_path,
+                            params=params,
+                            cache_key=cache_key,
+                            priority=priority,
+                            timeout=timeout or self.timeout,
+                            trace=trace,
+                        )
+
+                        if (
+                            self.hedger is not None
+                            and method is AllowedMethod.GET
+                            and self.hedger.applies_to(endpoint)
+                        ):
+                            response = await self._hedged(self.hedger, name, send, priority, trace)
+                        else:
+                            response = await send()
+                    finally:
+                        self.scheduler.release()
+
+            except asyncio.TimeoutError as e:
+                _log.error("Deadline exceeded for %s request to %s", method.value, endpoint_path)
+
+                raise ValoPyClientTimeoutError(
+                    phase="deadline", url=f"{self.api_url}{endpoint_path}"
+                ) from e
+
+        except (
+            ValoPyServerError,
+            ValoPyTimeoutError,
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+        ) as e:
+            if breaker is not None:
+                # Running out of the caller's budget says nothing about the endpoint
+                if getattr(e, "phase", None) == "deadline":
+                    breaker.release(probe)
+                else:
+                    breaker.record_failure(probe)
             raise
 
-        # Parse response data
-        data = await response.json()
+        except ValoPyHTTPError:
+            # Any other HTTP error means the API is up and responding
+            if breaker is not None:
+                breaker.record_success(probe)
+            raise
 
-        _log.debug(
-            "%s request completed with status %d",
-            method.value,
-            response.status,
-        )
+        except BaseException:
+            if breaker is not None:
+                breaker.release(probe)
+            raise
 
-        # Extract results metadata if present
-        results_metadata = data.get("results")
+        if breaker is not None:
+            breaker.record_success(probe)
 
-        # Extract the actual data from the response
-        response_data = data.get("data", {})
+        body = response.body
 
-        _log.info(
-            "Received response data from %s (size: %d bytes)",
-            endpoint_path,
-            len(str(response_data)),
-        )
-
-        if isinstance(response_data, list):
-            _log.info(
-                "Converting list response to %s dataclass for endpoint %s",
-                model_class.__name__,
-                endpoint_path,
+        # Decode large payloads off the event loop so other requests are not stalled
+        if self.offload_threshold is not None and len(body) >= self.offload_threshold:
+            _log.debug(
+                "Deserializing %d byte response from %s in executor", len(body), endpoint_path
             )
 
-            # Convert list of dicts to list of dataclasses
-            response_data = [
-                dict_to_dataclass(data=item, dataclass_type=model_class)
-                for item in response_data
-                if isinstance(item, dict)
-            ]
-
-        elif isinstance(response_data, dict):
-            # Inject results metadata into response dict before deserialization if present
-            if results_metadata:
-                response_data["results"] = results_metadata
-                _log.debug("Added results metadata to response data")
-
-            _log.info(
-                "Converting response to %s dataclass for endpoint %s",
-                model_class.__name__,
-                endpoint_path,
+            loop = asyncio.get_running_loop()
+            response_data, decode_time, model_time = await loop.run_in_executor(
+                self.executor, deserialize_response, body, model_class
             )
+        else:
+            response_data, decode_time, model_time = deserialize_response(body, model_class)
 
-            # Convert dict to dataclass (results will be deserialized if present)
-            response_data = dict_to_dataclass(data=response_data, dataclass_type=model_class)
+        _log.info(
+            "Converted response from %s to %s (%d bytes)",
+            endpoint_path,
+            model_class.__name__,
+            len(body),
+        )
 
-        else:
-            _log.warning("Response data is not a dict or list, cannot convert to dataclass")
+        if trace is not None:
+            trace.decode = decode_time
+            trace.model = model_time
 
         return Result(
             status_code=response.status,
@@ -272,6 +769,9 @@ class Adapter:
         endpoint_path: str,
         model_class: Type[ValoPyModel],
         params: Optional[dict] = None,
+        priority: Optional[Priority] = None,
+        endpoint: Optional[Endpoint] = None,
+        timeout: Optional[RequestTimeout] = None,
     ) -> Result:
         """Make a GET request to the Valorant API.
 
@@ -283,6 +783,12 @@ class Adapter:
             The dataclass type to deserialize the response into
         params : Optional[class:`dict`]
             Query parameters to include in the request, by default None
+        priority : Optional[:class:`Priority`]
+            The scheduling priority of the request, by default the context priority
+        endpoint : Optional[:class:`Endpoint`]
+            The endpoint being called, by default None
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -295,6 +801,9 @@ class Adapter:
             endpoint_path=endpoint_path,
             params=params,
             model_class=model_class,
+            priority=priority,
+            endpoint=endpoint,
+            timeout=timeout,
         )
 
     async def post(
@@ -302,6 +811,9 @@ class Adapter:
         endpoint_path: str,
         model_class: Type[ValoPyModel],
         params: Optional[dict] = None,
+        priority: Optional[Priority] = None,
+        endpoint: Optional[Endpoint] = None,
+        timeout: Optional[RequestTimeout] = None,
     ) -> Result:
         """Make a POST request to the Valorant API.
 
@@ -313,6 +825,12 @@ class Adapter:
             The dataclass type to deserialize the response into
         params : Optional[class:`dict`]
             Query parameters to include in the request, by default None
+        priority : Optional[:class:`Priority`]
+            The scheduling priority of the request, by default the context priority
+        endpoint : Optional[:class:`Endpoint`]
+            The endpoint being called, by default None
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -325,4 +843,7 @@ class Adapter:
             endpoint_path=endpoint_path,
             params=params,
             model_class=model_class,
+            priority=priority,
+            endpoint=endpoint,
+            timeout=timeout,
         )
@@ -0,0 +1,293 @@
+import functools
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+if TYPE_CHECKING:
+    import types
+
+    from .client import Client
+    from .enums import Platform, Region, Season
+    from .models import Leaderboard
+
+__all__ = [
+    "leaderboard_schema",
+    "leaderboard_to_record_batch",
+    "LeaderboardParquetWriter",
+    "write_leaderboard_snapshot",
+]
+
+_log = logging.getLogger(__name__)
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Arrow and Parquet export, install it with "
+            "'pip install valopy[arrow]'"
+        )
+
+
+@functools.cache
+def leaderboard_schema() -> "pa.Schema":
+    """Get the Arrow schema of leaderboard rows.
+
+    Ranks, RR, wins and tiers are ``int32``, dates are UTC timestamps and the
+    repeated strings (tier name, region, platform) are dictionary-encoded.
+    ``snapshot_at`` is the leaderboard's ``updated_at``, which identifies the
+    snapshot a row belongs to when many snapshots are loaded together.
+
+    Returns
+    -------
+    :class:`pyarrow.Schema`
+        The schema.
+
+    Raises
+    ------
+    :exc:`ImportError`
+        If pyarrow is not installed.
+    """
+
+    _require_pyarrow()
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [
+            ("snapshot_at", timestamp),
+            ("region", dictionary),
+            ("platform", dictionary),
+            ("leaderboard_rank", pa.int32()),
+            ("puuid", pa.string()),
+            ("name", pa.string()),
+            ("tag", pa.string()),
+            ("card", pa.string()),
+            ("title", pa.string()),
+            ("is_banned", pa.bool_()),
+            ("is_anonymized", pa.bool_()),
+            ("tier", pa.int32()),
+            ("tier_name", dictionary),
+            ("rr", pa.int32()),
+            ("wins", pa.int32()),
+            ("updated_at", timestamp),
+        ]
+    )
+
+
+def leaderboard_to_record_batch(
+    leaderboard: "Leaderboard",
+    region: Optional[str] = None,
+    platform: Optional[str] = None,
+) -> "pa.RecordBatch":
+    """Convert a leaderboard page to an Arrow record batch.
+
+    The columns are built directly from the player models, without creating
+    a dictionary per row.
+
+    Parameters
+    ----------
+    leaderboard : :class:`~valopy.models.Leaderboard`
+        The leaderboard page.
+    region : Optional[:class:`str`]
+        The region written to every row, by default None
+    platform : Optional[:class:`str`]
+        The platform written to every row, by default None
+
+    Returns
+    -------
+    :class:`pyarrow.RecordBatch`
+        The rows with :func:`leaderboard_schema`.
+
+    Raises
+    ------
+    :exc:`ImportError`
+        If pyarrow is not installed.
+    """
+
+    schema = leaderboard_schema()
+    players = leaderboard.players
+    count = len(players)
+    tier_names = {t.tier.id: t.tier.name for t in leaderboard.thresholds}
+
+    def column(name: str) -> List[Any]:
+        return [getattr(player, name) for player in players]
+
+    tiers = column("tier")
+    columns: Dict[str, Any] = {
+        "snapshot_at": [leaderboard.updated_at] * count,
+        "region": [region] * count,
+        "platform": [platform] * count,
+        "tier_name": [tier_names.get(tier) for tier in tiers],
+        "tier": tiers,
+        "updated_at": [
+            value if isinstance(value, datetime) else None for value in column("updated_at")
+        ],
+    }
+
+    arrays = []
+    for field in schema:
+        values = columns[field.name] if field.name in columns else column(field.name)
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(values, type=field.type))
+
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class LeaderboardParquetWriter:
+    """Write leaderboard pages to a Parquet file as they arrive.
+
+    Every page becomes one record batch, so memory stays at about one page.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        region: Optional[str] = None,
+        platform: Optional[str] = None,
+        compression: str = "zstd",
+    ) -> None:
+        """Initialize the LeaderboardParquetWriter and open the file.
+
+        Parameters
+        ----------
+        path : Union[:class:`str`, :class:`pathlib.Path`]
+            The Parquet file to write.
+        region : Optional[:class:`str`]
+            The region written to every row, by default None
+        platform : Optional[:class:`str`]
+            The platform written to every row, by default None
+        compression : :class:`str`, default "zstd"
+            The Parquet compression codec, by default "zstd"
+
+        Raises
+        ------
+        :exc:`ImportError`
+            If pyarrow is not installed.
+        """
+
+        self.region = region
+        self.platform = platform
+        self.rows = 0
+
+        schema = leaderboard_schema()
+        self._writer = pq.ParquetWriter(str(path), schema, compression=compression)
+
+    def write(self, leaderboard: "Leaderboard") -> None:
+        """Append a leaderboard page.
+
+        Parameters
+        ----------
+        leaderboard : :class:`~valopy.models.Leaderboard`
+            The leaderboard page.
+        """
+
+        batch = leaderboard_to_record_batch(leaderboard, self.region, self.platform)
+        self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def close(self) -> None:
+        """Finish and close the file."""
+
+        self._writer.close()
+
+    def __enter__(self) -> "LeaderboardParquetWriter":
+        """Context manager entry.
+
+        Returns
+        -------
+        :class:`LeaderboardParquetWriter`
+            The writer instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[BaseException]]",
+        exc_val: "Optional[BaseException]",
+        exc_tb: "Optional[types.TracebackType]",
+    ) -> None:
+        """Context manager exit, closing the writer."""
+
+        self.close()
+
+
+async def write_leaderboard_snapshot(
+    client: "Client",
+    directory: Union[str, Path],
+    region: "Region",
+    platform: "Platform",
+    season: Optional["Season"] = None,
+    page_size: int = 1000,
+) -> Optional[Path]:
+    """Append a snapshot of a whole leaderboard to a Parquet dataset directory.
+
+    Each snapshot is written to its own file named after the region, platform
+    and ``updated_at``, so the directory can be loaded as one table with
+    :func:`pyarrow.dataset.dataset` or :func:`pyarrow.parquet.read_table`.
+    If the snapshot was already written, only the first page is fetched.
+
+    Parameters
+    ----------
+    client : :class:`~valopy.client.Client`
+        The client to fetch the pages with.
+    directory : Union[:class:`str`, :class:`pathlib.Path`]
+        The dataset directory, created if missing.
+    region : :class:`~valopy.enums.Region`
+        The region of the leaderboard.
+    platform : :class:`~valopy.enums.Platform`
+        The platform of the leaderboard.
+    season : Optional[:class:`~valopy.enums.Season`]
+        The season of the leaderboard, by default the current season
+    page_size : :class:`int`, default 1000
+        Number of players per request, by default 1000
+
+    Returns
+    -------
+    Optional[:class:`pathlib.Path`]
+        The written file, or None if this snapshot was already stored.
+
+    Raises
+    ------
+    :exc:`ImportError`
+        If pyarrow is not installed.
+    """
+
+    _require_pyarrow()
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    pages = client.iter_leaderboard_pages(
+        region=region, platform=platform, season=season, page_size=page_size
+    )
+    first = await anext(pages)
+
+    stamp = first.updated_at.strftime("%Y%m%dT%H%M%S%fZ")
+    path = directory / f"{region.value}_{platform.value}_{stamp}.parquet"
+    if path.exists():
+        _log.info("Leaderboard snapshot %s already written", path.name)
+        await pages.aclose()  # type: ignore[attr-defined]
+        return None
+
+    # Write under a name that dataset readers skip, so an interrupted crawl is never loaded
+    partial = directory / f"_{path.name}"
+    with LeaderboardParquetWriter(partial, region.value, platform.value) as writer:
+        writer.write(first)
+        async for page in pages:
+            writer.write(page)
+
+    partial.replace(path)
+
+    _log.info("Wrote %d leaderboard players to %s", writer.rows, path)
+
+    return path
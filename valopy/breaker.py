@@ -0,0 +1,218 @@
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from .enums import CircuitState
+from .exceptions import ValoPyCircuitOpenError, ValoPyValidationError
+
+__all__ = [
+    "CircuitBreakerConfig",
+    "CircuitBreaker",
+]
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Thresholds of the per-endpoint circuit breakers.
+
+    Attributes
+    ----------
+    consecutive_failures : :class:`int`
+        Consecutive failures that open the circuit.
+    failure_rate : :class:`float`
+        Failure rate within the window that opens the circuit (0 to 1).
+    window_size : :class:`int`
+        Number of recent calls the failure rate is computed over.
+    min_calls : :class:`int`
+        Minimum number of calls in the window before the failure rate applies.
+    recovery_time : :class:`float`
+        Seconds the circuit stays open before probe requests are allowed.
+    half_open_calls : :class:`int`
+        Number of concurrent probe requests allowed while half-open.
+    """
+
+    consecutive_failures: int = 5
+    failure_rate: float = 0.5
+    window_size: int = 20
+    min_calls: int = 10
+    recovery_time: float = 30.0
+    half_open_calls: int = 1
+
+    def __post_init__(self) -> None:
+        if not 0 < self.failure_rate <= 1:
+            raise ValoPyValidationError("failure_rate must be between 0 and 1")
+
+        if min(self.consecutive_failures, self.window_size, self.half_open_calls) <= 0:
+            raise ValoPyValidationError(
+                "consecutive_failures, window_size and half_open_calls must be greater than 0"
+            )
+
+
+class CircuitBreaker:
+    """Circuit breaker for a single endpoint.
+
+    The circuit opens after too many consecutive failures or a too high
+    failure rate, failing requests fast with :exc:`ValoPyCircuitOpenError`.
+    After ``recovery_time`` it lets probe requests through and closes again
+    once a probe succeeds. Outcomes of calls started before the circuit
+    became half-open are ignored until then.
+
+    Attributes
+    ----------
+    name : :class:`str`
+        The endpoint the breaker guards.
+    config : :class:`CircuitBreakerConfig`
+        The thresholds of the breaker.
+    """
+
+    def __init__(self, name: str, config: CircuitBreakerConfig) -> None:
+        """Initialize the CircuitBreaker.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The endpoint the breaker guards.
+        config : :class:`CircuitBreakerConfig`
+            The thresholds of the breaker.
+        """
+
+        self.name = name
+        self.config = config
+
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=config.window_size)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._half_open_round = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving from open to half-open once the recovery time passed."""
+
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.config.recovery_time
+        ):
+            _log.info("Circuit for %s is half-open, allowing probe requests", self.name)
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            self._half_open_round += 1
+
+        return self._state
+
+    def before_call(self) -> Optional[int]:
+        """Check whether a request may be sent.
+
+        Every allowed call must be followed by :meth:`record_success`,
+        :meth:`record_failure` or :meth:`release`, passing the returned probe token.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+            A token identifying the call as a probe of the half-open circuit,
+            or None if the circuit is closed.
+
+        Raises
+        ------
+        :exc:`ValoPyCircuitOpenError`
+            If the circuit is open, or half-open with all probe requests in flight.
+        """
+
+        state = self.state
+
+        if state is CircuitState.OPEN:
+            retry_after = self.config.recovery_time - (time.monotonic() - self._opened_at)
+            raise ValoPyCircuitOpenError(endpoint=self.name, retry_after=max(retry_after, 0.0))
+
+        if state is CircuitState.HALF_OPEN:
+            if self._probes >= self.config.half_open_calls:
+                raise ValoPyCircuitOpenError(endpoint=self.name, retry_after=0.0)
+
+            self._probes += 1
+            return self._half_open_round
+
+        return None
+
+    def record_success(self, probe: Optional[int] = None) -> None:
+        """Record a call that reached the API, closing a half-open circuit.
+
+        Parameters
+        ----------
+        probe : Optional[:class:`int`]
+            The token returned by :meth:`before_call`, by default None
+        """
+
+        if self._state is CircuitState.HALF_OPEN:
+            if not self._is_probe(probe):
+                # Started before the circuit opened, says nothing about the recovery
+                return
+
+            _log.info("Probe request succeeded, closing circuit for %s", self.name)
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+
+        self._consecutive_failures = 0
+        self._outcomes.append(True)
+
+    def record_failure(self, probe: Optional[int] = None) -> None:
+        """Record a failed call, opening the circuit if a threshold is exceeded.
+
+        Parameters
+        ----------
+        probe : Optional[:class:`int`]
+            The token returned by :meth:`before_call`, by default None
+        """
+
+        if self._state is CircuitState.HALF_OPEN:
+            if not self._is_probe(probe):
+                return
+
+            _log.warning("Probe request failed, reopening circuit for %s", self.name)
+            self._open()
+            return
+
+        self._consecutive_failures += 1
+        self._outcomes.append(False)
+
+        failures = self._outcomes.count(False)
+        too_many_failures = self._consecutive_failures >= self.config.consecutive_failures
+        too_high_rate = (
+            len(self._outcomes) >= self.config.min_calls
+            and failures / len(self._outcomes) >= self.config.failure_rate
+        )
+
+        if self._state is CircuitState.CLOSED and (too_many_failures or too_high_rate):
+            _log.warning(
+                "Opening circuit for %s (%d consecutive failures, %d/%d failed)",
+                self.name,
+                self._consecutive_failures,
+                failures,
+                len(self._outcomes),
+            )
+            self._open()
+
+    def release(self, probe: Optional[int] = None) -> None:
+        """Record a call that ended without an outcome, e.g. because it was cancelled.
+
+        Parameters
+        ----------
+        probe : Optional[:class:`int`]
+            The token returned by :meth:`before_call`, by default None
+        """
+
+        if self._state is CircuitState.HALF_OPEN and self._is_probe(probe):
+            self._probes = max(self._probes - 1, 0)
+
+    def _is_probe(self, probe: Optional[int]) -> bool:
+        return probe is not None and probe == self._half_open_round
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._consecutive_failures = 0
+        self._outcomes.clear()
@@ -0,0 +1,134 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from .exceptions import ValoPyNotFoundError, ValoPyValidationError
+
+__all__ = [
+    "request_key",
+    "NegativeCache",
+]
+
+_log = logging.getLogger(__name__)
+
+
+def request_key(method: str, endpoint_path: str, params: Optional[dict] = None) -> Tuple:
+    """Build a hashable key identifying a request.
+
+    Parameters
+    ----------
+    method : :class:`str`
+        The HTTP method of the request.
+    endpoint_path : :class:`str`
+        The formatted API endpoint path.
+    params : Optional[:class:`dict`]
+        Query parameters of the request, by default None
+
+    Returns
+    -------
+    :class:`tuple`
+        A key that is equal for identical requests.
+    """
+
+    return (method, endpoint_path, tuple(sorted((params or {}).items())))
+
+
+class NegativeCache:
+    """Bounded cache remembering requests that returned 404 Not Found.
+
+    Entries expire after ``ttl`` seconds. When the cache is full the least
+    recently stored entry is evicted.
+
+    Attributes
+    ----------
+    ttl : :class:`float`
+        Time in seconds an entry stays valid.
+    maxsize : :class:`int`
+        Maximum number of entries kept in the cache.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        """Initialize the NegativeCache.
+
+        Parameters
+        ----------
+        ttl : :class:`float`
+            Time in seconds an entry stays valid.
+        maxsize : :class:`int`, default 1024
+            Maximum number of entries kept in the cache, by default 1024
+        """
+
+        if ttl <= 0:
+            raise ValoPyValidationError("ttl must be greater than 0")
+
+        if maxsize <= 0:
+            raise ValoPyValidationError("maxsize must be greater than 0")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._entries: OrderedDict[Hashable, Tuple[float, ValoPyNotFoundError]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[ValoPyNotFoundError]:
+        """Get the cached error for a request.
+
+        Parameters
+        ----------
+        key : :class:`Hashable`
+            The request key, see :func:`request_key`.
+
+        Returns
+        -------
+        Optional[:exc:`ValoPyNotFoundError`]
+            The cached error, or None if the request is not cached or the entry expired.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, error = entry
+        if expires_at <= time.monotonic():
+            _log.debug("Negative cache entry expired for %s", key)
+            del self._entries[key]
+            return None
+
+        return error
+
+    def put(self, key: Hashable, error: ValoPyNotFoundError) -> None:
+        """Remember a failed request.
+
+        Parameters
+        ----------
+        key : :class:`Hashable`
+            The request key, see :func:`request_key`.
+        error : :exc:`ValoPyNotFoundError`
+            The error raised for the request.
+        """
+
+        self._entries[key] = (time.monotonic() + self.ttl, error)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            _log.debug("Evicted negative cache entry for %s", evicted)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a request from the cache.
+
+        Parameters
+        ----------
+        key : :class:`Hashable`
+            The request key, see :func:`request_key`.
+        """
+
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+
+        self._entries.clear()
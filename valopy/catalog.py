@@ -0,0 +1,349 @@
+import json
+import logging
+import mmap
+import os
+import struct
+from dataclasses import fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union, get_args
+
+from .exceptions import ValoPyValidationError
+from .models import Content
+
+if TYPE_CHECKING:
+    import types
+
+__all__ = [
+    "compile_content",
+    "ContentCatalog",
+]
+
+_log = logging.getLogger(__name__)
+
+# File layout, all integers little-endian:
+#
+#   header     magic, format version, section count, string table start, version (offset, length)
+#   sections   per category: name (offset, length), record count, records offset
+#   records    per item, sorted by id bytes: id, name and JSON item (offset, length each)
+#   strings    UTF-8 string table referenced by (offset, length) pairs
+_MAGIC = b"VPYCAT"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<6sBxIIII")
+_SECTION = struct.Struct("<IIII")
+_RECORD = struct.Struct("<IIIIII")
+
+# Content attributes holding lists of items and their model classes
+_CATEGORIES: Dict[str, type] = {
+    field.name: get_args(field.type)[0] for field in fields(Content) if get_args(field.type)
+}
+
+
+class _StringTable:
+    """Collects UTF-8 strings, storing repeated strings once."""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._offsets: Dict[bytes, int] = {}
+
+    def add(self, value: Union[str, bytes]) -> Tuple[int, int]:
+        encoded = value.encode("utf-8") if isinstance(value, str) else value
+        offset = self._offsets.get(encoded)
+        if offset is None:
+            offset = self._offsets[encoded] = len(self.data)
+            self.data += encoded
+        return offset, len(encoded)
+
+
+def compile_content(content: Content, path: Union[str, Path]) -> Path:
+    """Compile a content catalog into a read-only file for :class:`ContentCatalog`.
+
+    The file is written to a temporary name and then renamed, so processes
+    that have the previous file open keep reading a consistent copy.
+
+    Parameters
+    ----------
+    content : :class:`~valopy.models.Content`
+        The content catalog, e.g. from :meth:`~valopy.client.Client.get_content`.
+    path : Union[:class:`str`, :class:`pathlib.Path`]
+        The file to write.
+
+    Returns
+    -------
+    :class:`pathlib.Path`
+        The written file.
+    """
+
+    path = Path(path)
+    strings = _StringTable()
+
+    sections = []
+    for category in _CATEGORIES:
+        records = []
+        for item in getattr(content, category) or []:
+            item_id = str(item.id).encode("utf-8")
+            data = json.dumps(item.__dict__, separators=(",", ":"), ensure_ascii=False)
+            records.append((item_id, item.name or "", data))
+
+        # Sorting by the encoded bytes lets readers binary search without decoding
+        records.sort(key=lambda record: record[0])
+        sections.append((category, records))
+
+    header_size = _HEADER.size
+    records_start = header_size + _SECTION.size * len(sections)
+
+    section_bytes = bytearray()
+    record_bytes = bytearray()
+    for category, records in sections:
+        name_offset, name_length = strings.add(category)
+        section_bytes += _SECTION.pack(
+            name_offset, name_length, len(records), records_start + len(record_bytes)
+        )
+        for item_id, name, data in records:
+            record_bytes += _RECORD.pack(
+                *strings.add(item_id), *strings.add(name), *strings.add(data)
+            )
+
+    strings_start = records_start + len(record_bytes)
+    version_offset, version_length = strings.add(content.version or "")
+
+    # String offsets are relative to the table, readers add strings_start
+    header = _HEADER.pack(
+        _MAGIC, _FORMAT_VERSION, len(sections), strings_start, version_offset, version_length
+    )
+
+    partial = path.with_name(f".{path.name}.partial")
+    with open(partial, "wb") as f:
+        f.write(header)
+        f.write(section_bytes)
+        f.write(record_bytes)
+        f.write(strings.data)
+    os.replace(partial, path)
+
+    _log.info("Compiled content catalog with %d sections to %s", len(sections), path)
+
+    return path
+
+
+class ContentCatalog:
+    """Read-only, memory-mapped content catalog created with :func:`compile_content`.
+
+    The file is mapped, not read, so every process that opens the same file
+    shares one copy through the page cache. Lookups binary search the id-sorted
+    records in place and only decode the item that was found.
+
+    Attributes
+    ----------
+    path : :class:`pathlib.Path`
+        The catalog file.
+    version : :class:`str`
+        The content version.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize the ContentCatalog by mapping the file.
+
+        Parameters
+        ----------
+        path : Union[:class:`str`, :class:`pathlib.Path`]
+            The catalog file.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If the file is not a catalog of this format version, or is truncated or corrupt.
+        """
+
+        self.path = Path(path)
+
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise ValoPyValidationError(f"{self.path} is not a ValoPy content catalog")
+
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_index()
+        except ValoPyValidationError:
+            self._mmap.close()
+            raise
+
+    def _read_index(self) -> None:
+        (
+            magic,
+            version,
+            section_count,
+            strings_start,
+            version_offset,
+            version_length,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValoPyValidationError(f"{self.path} is not a ValoPy content catalog")
+
+        # Check the layout once so lookups cannot read past the end of the file
+        records_start = _HEADER.size + section_count * _SECTION.size
+        if not records_start <= strings_start <= len(self._mmap):
+            raise ValoPyValidationError(f"{self.path} is a truncated or corrupt content catalog")
+
+        self._strings_start = strings_start
+        self.version = self._string(version_offset, version_length)
+
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for index in range(section_count):
+            name_offset, name_length, count, records_offset = _SECTION.unpack_from(
+                self._mmap, _HEADER.size + index * _SECTION.size
+            )
+            if records_offset < records_start or (
+                records_offset + count * _RECORD.size > strings_start
+            ):
+                raise ValoPyValidationError(
+                    f"{self.path} is a truncated or corrupt content catalog"
+                )
+
+            self._sections[self._string(name_offset, name_length)] = (count, records_offset)
+
+    def _bytes(self, offset: int, length: int) -> bytes:
+        start = self._strings_start + offset
+        if start + length > len(self._mmap):
+            raise ValoPyValidationError(f"{self.path} is a truncated or corrupt content catalog")
+
+        return self._mmap[start : start + length]
+
+    def _string(self, offset: int, length: int) -> str:
+        return self._bytes(offset, length).decode("utf-8")
+
+    def _section(self, category: str) -> Tuple[int, int]:
+        section = self._sections.get(category)
+        if section is None:
+            raise ValoPyValidationError(f"Unknown content category: {category}")
+        return section
+
+    def _find(self, category: str, item_id: str) -> Optional[Tuple[int, ...]]:
+        count, records_offset = self._section(category)
+        target = item_id.encode("utf-8")
+
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            record = _RECORD.unpack_from(self._mmap, records_offset + middle * _RECORD.size)
+            current = self._bytes(record[0], record[1])
+            if current < target:
+                low = middle + 1
+            elif current > target:
+                high = middle
+            else:
+                return record
+
+        return None
+
+    @property
+    def categories(self) -> List[str]:
+        """The categories in the catalog, e.g. ``"skins"``."""
+
+        return list(self._sections)
+
+    def count(self, category: str) -> int:
+        """Get the number of items in a category.
+
+        Parameters
+        ----------
+        category : :class:`str`
+            The :class:`~valopy.models.Content` attribute, e.g. ``"skins"``.
+
+        Returns
+        -------
+        :class:`int`
+            The number of items.
+        """
+
+        return self._section(category)[0]
+
+    def ids(self, category: str) -> Iterator[str]:
+        """Iterate over the item IDs of a category in sorted order.
+
+        Parameters
+        ----------
+        category : :class:`str`
+            The :class:`~valopy.models.Content` attribute, e.g. ``"skins"``.
+
+        Yields
+        ------
+        :class:`str`
+            The item IDs.
+        """
+
+        count, records_offset = self._section(category)
+        for index in range(count):
+            record = _RECORD.unpack_from(self._mmap, records_offset + index * _RECORD.size)
+            yield self._string(record[0], record[1])
+
+    def name(self, category: str, item_id: str) -> Optional[str]:
+        """Get the name of an item without decoding the item.
+
+        Parameters
+        ----------
+        category : :class:`str`
+            The :class:`~valopy.models.Content` attribute, e.g. ``"skins"``.
+        item_id : :class:`str`
+            The item ID.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            The name, or None if the item is not in the catalog.
+        """
+
+        record = self._find(category, item_id)
+        return self._string(record[2], record[3]) if record else None
+
+    def get(self, category: str, item_id: str) -> Optional[Any]:
+        """Get an item as its model, e.g. :class:`~valopy.models.ContentItem`.
+
+        Parameters
+        ----------
+        category : :class:`str`
+            The :class:`~valopy.models.Content` attribute, e.g. ``"skins"``.
+        item_id : :class:`str`
+            The item ID.
+
+        Returns
+        -------
+        Optional[Any]
+            The item, or None if it is not in the catalog.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If the category is not in the catalog.
+        """
+
+        record = self._find(category, item_id)
+        if record is None:
+            return None
+
+        data = json.loads(self._bytes(record[4], record[5]))
+        return _CATEGORIES[category](**data)
+
+    def close(self) -> None:
+        """Unmap the file."""
+
+        self._mmap.close()
+
+    def __enter__(self) -> "ContentCatalog":
+        """Context manager entry.
+
+        Returns
+        -------
+        :class:`ContentCatalog`
+            The catalog instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[BaseException]]",
+        exc_val: "Optional[BaseException]",
+        exc_tb: "Optional[types.TracebackType]",
+    ) -> None:
+        """Context manager exit, closing the catalog."""
+
+        self.close()
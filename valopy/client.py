@@ -1,10 +1,12 @@
+import asyncio
 import logging
 import types
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Optional, Sequence, Union
 
 from .adapter import Adapter
 from .enums import CountryCode, Endpoint, EsportsRegion, League, Locale, Platform, Region, Season
-from .exceptions import ValoPyValidationError
+from .esports import EsportsSchedule
+from .exceptions import ValoPyError, ValoPyValidationError
 
 if TYPE_CHECKING:
     import types
@@ -20,6 +22,11 @@ if TYPE_CHECKING:
         Version,
         WebsiteContent,
     )
+    from .timeouts import RequestTimeout
+
+__all__ = [
+    "Client",
+]
 
 _log = logging.getLogger(__name__)
 
@@ -33,21 +40,29 @@ class Client:
         The adapter used for making HTTP requests.
     """
 
-    def __init__(self, api_key: str, redact_header: bool = True) -> None:
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        redact_header: bool = True,
+        **adapter_options: Any,
+    ) -> None:
         """Initialize the Client.
 
         Parameters
         ----------
-        api_key : :class:`str`
-            The API key used for authentication.
+        api_key : Union[:class:`str`, Sequence[:class:`str`]]
+            The API key used for authentication, or several keys to spread requests over.
         redact_header : :class:`bool`, default True
             Whether to redact the API key in logs, by default True
+        **adapter_options : :class:`Any`
+            Additional options forwarded to :class:`~valopy.adapter.Adapter`,
+            e.g. ``negative_cache_ttl``.
         """
 
         _log.info("Initializing Valorant API Client (redact_header=%s)", redact_header)
-        _log.debug("Creating adapter with provided API key")
+        _log.debug("Creating adapter with provided API key(s)")
 
-        self.adapter = Adapter(api_key=api_key, redact_header=redact_header)
+        self.adapter = Adapter(api_key=api_key, redact_header=redact_header, **adapter_options)
 
     async def close(self) -> None:
         """Close the client's adapter session."""
@@ -84,7 +99,13 @@ class Client:
 
         await self.close()
 
-    async def get_account_v1(self, name: str, tag: str, force_update: bool = False) -> "AccountV1":
+    async def get_account_v1(
+        self,
+        name: str,
+        tag: str,
+        force_update: bool = False,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> "AccountV1":
         """Get Account V1 information.
 
         Parameters
@@ -95,6 +116,8 @@ class Client:
             The tag of the account.
         force_update : :class:`bool`, default False
             Whether to force update the account information, by default False
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -112,12 +135,16 @@ class Client:
             endpoint_path=endpoint_path,
             params={"force": str(force_update).lower()},
             model_class=Endpoint.ACCOUNT_BY_NAME_V1.model,
+            endpoint=Endpoint.ACCOUNT_BY_NAME_V1,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved Account V1 for %s#%s", name, tag)
         return result.data  # type: ignore
 
-    async def get_account_v1_by_puuid(self, puuid: str, force_update: bool = False) -> "AccountV1":
+    async def get_account_v1_by_puuid(
+        self, puuid: str, force_update: bool = False, timeout: Optional["RequestTimeout"] = None
+    ) -> "AccountV1":
         """Get Account V1 information by PUUID.
 
         Parameters
@@ -126,6 +153,8 @@ class Client:
             The player's unique identifier (PUUID).
         force_update : :class:`bool`, default False
             Whether to force update the account information, by default False
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -143,12 +172,20 @@ class Client:
             endpoint_path=endpoint_path,
             params={"force": str(force_update).lower()},
             model_class=Endpoint.ACCOUNT_BY_PUUID_V1.model,
+            endpoint=Endpoint.ACCOUNT_BY_PUUID_V1,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved Account V1 for PUUID %s", puuid)
         return result.data  # type: ignore
 
-    async def get_account_v2(self, name: str, tag: str, force_update: bool = False) -> "AccountV2":
+    async def get_account_v2(
+        self,
+        name: str,
+        tag: str,
+        force_update: bool = False,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> "AccountV2":
         """Get Account V2 information.
 
         Parameters
@@ -159,6 +196,8 @@ class Client:
             The tag of the account.
         force_update : :class:`bool`, default false
             Whether to force update the account information, by default False
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -176,12 +215,16 @@ class Client:
             endpoint_path=endpoint_path,
             params={"force": str(force_update).lower()},
             model_class=Endpoint.ACCOUNT_BY_NAME_V2.model,
+            endpoint=Endpoint.ACCOUNT_BY_NAME_V2,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved Account V2 for %s#%s", name, tag)
         return result.data  # type: ignore
 
-    async def get_account_v2_by_puuid(self, puuid: str, force_update: bool = False) -> "AccountV2":
+    async def get_account_v2_by_puuid(
+        self, puuid: str, force_update: bool = False, timeout: Optional["RequestTimeout"] = None
+    ) -> "AccountV2":
         """Get Account V2 information by PUUID.
 
         Parameters
@@ -190,6 +233,8 @@ class Client:
             The player's unique identifier (PUUID).
         force_update : :class:`bool`, default false
             Whether to force update the account information, by default False
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -206,18 +251,24 @@ class Client:
             endpoint_path=endpoint_path,
             params={"force": str(force_update).lower()},
             model_class=Endpoint.ACCOUNT_BY_PUUID_V2.model,
+            endpoint=Endpoint.ACCOUNT_BY_PUUID_V2,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved Account V2 for PUUID %s", puuid)
         return result.data  # type: ignore
 
-    async def get_content(self, locale: Optional[Locale] = None) -> "Content":
+    async def get_content(
+        self, locale: Optional[Locale] = None, timeout: Optional["RequestTimeout"] = None
+    ) -> "Content":
         """Get basic content data like season ids or skins.
 
         Parameters
         ----------
         locale : Optional[:class:`Locale`]
             The locale for the content data, by default None
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -233,19 +284,25 @@ class Client:
             endpoint_path=Endpoint.CONTENT_V1.url,
             params=params,
             model_class=Endpoint.CONTENT_V1.model,
+            endpoint=Endpoint.CONTENT_V1,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved content data")
 
         return result.data  # type: ignore
 
-    async def get_version(self, region: Optional[Region] = Region.EU) -> "Version":
+    async def get_version(
+        self, region: Optional[Region] = Region.EU, timeout: Optional["RequestTimeout"] = None
+    ) -> "Version":
         """Get the current API version for a specific region.
 
         Parameters
         ----------
         region : Optional[:class:`Region`]
             The region to get the API version for, by default Region.EU
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -260,19 +317,25 @@ class Client:
         result = await self.adapter.get(
             endpoint_path=endpoint_path,
             model_class=Endpoint.VERSION_V1.model,
+            endpoint=Endpoint.VERSION_V1,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved Version for region %s", region.value)
 
         return result.data  # type: ignore
 
-    async def get_website(self, countrycode: CountryCode) -> list["WebsiteContent"]:
+    async def get_website(
+        self, countrycode: CountryCode, timeout: Optional["RequestTimeout"] = None
+    ) -> list["WebsiteContent"]:
         """Get website information for a specific country code.
 
         Parameters
         ----------
         countrycode : :class:`CountryCode`
             The country code to get the website information for.
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -287,17 +350,23 @@ class Client:
         result = await self.adapter.get(
             endpoint_path=endpoint_path,
             model_class=Endpoint.WEBSITE.model,
+            endpoint=Endpoint.WEBSITE,
+            timeout=timeout,
         )
 
         return result.data  # type: ignore
 
-    async def get_status(self, region: Region) -> "Status":
+    async def get_status(
+        self, region: Region, timeout: Optional["RequestTimeout"] = None
+    ) -> "Status":
         """Get the current VALORANT server status for a region.
 
         Parameters
         ----------
         region : :class:`Region`
             The region to get server status for.
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -312,19 +381,25 @@ class Client:
         result = await self.adapter.get(
             endpoint_path=endpoint_path,
             model_class=Endpoint.STATUS.model,
+            endpoint=Endpoint.STATUS,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved server status for region %s", region.value)
 
         return result.data  # type: ignore
 
-    async def get_queue_status(self, region: Region) -> list["QueueData"]:
+    async def get_queue_status(
+        self, region: Region, timeout: Optional["RequestTimeout"] = None
+    ) -> list["QueueData"]:
         """Get the current queue status for a region.
 
         Parameters
         ----------
         region : :class:`Region`
             The region to get queue status for.
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -339,6 +414,8 @@ class Client:
         result = await self.adapter.get(
             endpoint_path=endpoint_path,
             model_class=Endpoint.QUEUE_STATUS.model,
+            endpoint=Endpoint.QUEUE_STATUS,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved queue status for region %s", region.value)
@@ -346,7 +423,10 @@ class Client:
         return result.data  # type: ignore
 
     async def get_esports_schedule(
-        self, region: Optional[EsportsRegion] = None, league: Optional[League] = None
+        self,
+        region: Optional[EsportsRegion] = None,
+        league: Optional[League] = None,
+        timeout: Optional["RequestTimeout"] = None,
     ) -> list["EsportsEvent"]:
         """Get the esports schedule.
 
@@ -356,6 +436,8 @@ class Client:
             Filter by esports region.
         league : Optional[:class:`League`]
             Filter by esports league.
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -376,12 +458,91 @@ class Client:
             endpoint_path=endpoint_path,
             params=params,
             model_class=Endpoint.ESPORTS_SCHEDULE.model,
+            endpoint=Endpoint.ESPORTS_SCHEDULE,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved esports schedule")
 
         return result.data  # type: ignore
 
+    async def get_esports_schedules(
+        self,
+        leagues: Optional[Iterable[League]] = None,
+        regions: Optional[Iterable[EsportsRegion]] = None,
+        max_concurrency: int = 8,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> EsportsSchedule:
+        """Get the esports schedules of many leagues or regions concurrently.
+
+        One request is made per league and per region. Events returned by more
+        than one request, e.g. international events, are merged by match ID.
+        Schedules that fail to load are logged and skipped.
+
+        Parameters
+        ----------
+        leagues : Optional[Iterable[:class:`League`]]
+            The leagues to fetch, by default every league if ``regions`` is also None
+        regions : Optional[Iterable[:class:`EsportsRegion`]]
+            The esports regions to fetch, by default None
+        max_concurrency : :class:`int`, default 8
+            Maximum number of requests in flight, by default 8
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of each request, by default the adapter's ``timeout``
+
+        Returns
+        -------
+        :class:`~valopy.esports.EsportsSchedule`
+            The merged and indexed schedule.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``max_concurrency`` is not positive.
+        :exc:`ValoPyError`
+            The first error if every schedule failed to load.
+        """
+
+        if max_concurrency <= 0:
+            raise ValoPyValidationError("max_concurrency must be greater than 0")
+
+        if leagues is None and regions is None:
+            leagues = list(League)
+
+        filters = [{"league": league} for league in leagues or ()]
+        filters += [{"region": region} for region in regions or ()]
+
+        _log.info("Fetching %d esports schedules", len(filters))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(kwargs: dict) -> Union[list["EsportsEvent"], ValoPyError]:
+            async with semaphore:
+                try:
+                    return await self.get_esports_schedule(**kwargs, timeout=timeout)
+                except ValoPyError as e:
+                    _log.warning("Failed to fetch esports schedule %s: %s", kwargs, e)
+                    return e
+
+        results = await asyncio.gather(*(fetch(kwargs) for kwargs in filters))
+
+        errors = [result for result in results if isinstance(result, ValoPyError)]
+        if filters and len(errors) == len(filters):
+            raise errors[0]
+
+        schedule = EsportsSchedule()
+        for events in results:
+            if not isinstance(events, ValoPyError):
+                schedule.update(events)
+
+        _log.info(
+            "Merged %d esports events from %d schedules",
+            len(schedule),
+            len(filters),
+        )
+
+        return schedule
+
     async def get_leaderboard(
         self,
         region: Region,
@@ -392,6 +553,7 @@ class Client:
         tag: Optional[str] = None,
         size: Optional[int] = None,
         start_index: Optional[int] = None,
+        timeout: Optional["RequestTimeout"] = None,
     ) -> "Leaderboard":
         """Get leaderboard for a specific region and platform.
 
@@ -413,6 +575,8 @@ class Client:
             Number of players to return.
         start_index : Optional[:class:`int`]
             Starting index for pagination.
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of this request, by default the adapter's ``timeout``
 
         Returns
         -------
@@ -465,8 +629,66 @@ class Client:
             endpoint_path=endpoint_path,
             params=params,
             model_class=Endpoint.LEADERBOARD_V3.model,
+            endpoint=Endpoint.LEADERBOARD_V3,
+            timeout=timeout,
         )
 
         _log.info("Successfully retrieved leaderboard")
 
         return result.data  # type: ignore
+
+    async def iter_leaderboard_pages(
+        self,
+        region: Region,
+        platform: Platform,
+        season: Optional[Season] = None,
+        page_size: int = 1000,
+        start_index: int = 0,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> AsyncIterator["Leaderboard"]:
+        """Iterate over the pages of a leaderboard until its end.
+
+        Parameters
+        ----------
+        region : :class:`Region`
+            The region to get leaderboard for.
+        platform : :class:`Platform`
+            The platform (PC or Console).
+        season : Optional[:class:`Season`]
+            The season to filter by, by default the current season
+        page_size : :class:`int`, default 1000
+            Number of players per page, by default 1000
+        start_index : :class:`int`, default 0
+            Index of the first player, by default 0
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            Timeouts of each request, by default the adapter's ``timeout``
+
+        Yields
+        ------
+        :class:`~valopy.models.Leaderboard`
+            One page of the leaderboard.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``page_size`` is not positive.
+        """
+
+        if page_size <= 0:
+            raise ValoPyValidationError("page_size must be greater than 0")
+
+        while True:
+            page = await self.get_leaderboard(
+                region=region,
+                platform=platform,
+                season=season,
+                size=page_size,
+                start_index=start_index,
+                timeout=timeout,
+            )
+            yield page
+
+            if not page.players or not page.results or page.results.after <= 0:
+                return
+
+            start_index += len(page.players)
@@ -0,0 +1,501 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import is_dataclass
+from multiprocessing.util import Finalize
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .client import Client
+from .exceptions import ValoPyValidationError
+from .runtime import new_event_loop
+from .serialization import from_bytes, to_bytes
+from .transport import AiohttpTransport, Transport, TransportResponse
+from .utils import parse_rate_limit_header
+
+if TYPE_CHECKING:
+    import types
+    from multiprocessing.context import BaseContext
+
+    from .timeouts import RequestTimeout
+    from .tracing import RequestTrace
+
+__all__ = [
+    "SharedRateBudget",
+    "BudgetedTransport",
+    "ProcessCrawler",
+]
+
+_log = logging.getLogger(__name__)
+
+# Slots of the shared budget array
+_LIMIT = 0
+_USED = 1
+_WINDOW_END = 2
+_WINDOW_ID = 3
+
+# Seconds to wait for the response of the first request while the limit is unknown
+_PROBE_WAIT = 0.05
+
+
+class SharedRateBudget:
+    """Rate limit budget of one API key shared by several processes.
+
+    The budget is a fixed window counter in shared memory, guarded by a
+    process-shared lock. Every request takes one slot before it is sent, so
+    requests in flight in all processes are counted, and every response
+    aligns the window with its ``x-ratelimit-*`` headers. Together the
+    processes never send more than ``x-ratelimit-limit`` requests per window.
+
+    Until the limit is known, either passed in or read from the first
+    response, only one request is sent at a time.
+
+    Windows are measured with :func:`time.monotonic`, which reads the same
+    system-wide clock in every process on Linux, macOS and Windows and is not
+    affected by wall clock adjustments.
+
+    The budget is passed to worker processes when they are started, e.g. as
+    an initializer argument of a process pool, and cannot be pickled otherwise.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        window: float = 60.0,
+        context: Optional["BaseContext"] = None,
+    ) -> None:
+        """Initialize the SharedRateBudget.
+
+        Parameters
+        ----------
+        limit : Optional[:class:`int`]
+            Requests allowed per window, by default read from ``x-ratelimit-limit``
+        window : :class:`float`, default 60.0
+            Length of a rate limit window in seconds, by default 60.0
+        context : Optional[:class:`multiprocessing.context.BaseContext`]
+            The multiprocessing context of the worker processes, by default the default context
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``limit`` or ``window`` is not positive.
+        """
+
+        if (limit is not None and limit < 1) or window <= 0:
+            raise ValoPyValidationError("limit and window must be positive")
+
+        context = context or multiprocessing.get_context()
+
+        self.window = window
+        self._lock = context.Lock()
+        self._state = context.RawArray("d", 4)
+        self._state[_LIMIT] = limit or 0
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Requests allowed per window, None until known."""
+
+        return int(self._state[_LIMIT]) or None
+
+    @property
+    def used(self) -> int:
+        """Requests sent in the current window by all processes."""
+
+        with self._lock:
+            if self._state[_WINDOW_END] <= time.monotonic():
+                return 0
+            return int(self._state[_USED])
+
+    def try_acquire(self) -> Tuple[float, int]:
+        """Take a slot for one request if the window has one left.
+
+        Returns
+        -------
+        Tuple[:class:`float`, :class:`int`]
+            0 if a slot was taken, otherwise the seconds to wait before trying
+            again, and the number of the current window.
+        """
+
+        with self._lock:
+            state = self._state
+            now = time.monotonic()
+
+            if state[_WINDOW_END] <= now:
+                state[_USED] = 0
+                state[_WINDOW_END] = now + self.window
+                state[_WINDOW_ID] += 1
+
+            window_id = int(state[_WINDOW_ID])
+            limit = state[_LIMIT]
+            if not limit:
+                # Send one probe request and wait for its headers
+                if state[_USED]:
+                    return _PROBE_WAIT, window_id
+            elif state[_USED] >= limit:
+                return state[_WINDOW_END] - now, window_id
+
+            state[_USED] += 1
+            return 0.0, window_id
+
+    async def acquire(self) -> int:
+        """Wait until a slot for one request is taken.
+
+        Returns
+        -------
+        :class:`int`
+            The number of the window the slot belongs to, to pass to :meth:`update`.
+        """
+
+        while True:
+            wait, window_id = self.try_acquire()
+            if not wait:
+                return window_id
+
+            _log.debug("Shared rate budget exhausted, waiting %.2fs", wait)
+            await asyncio.sleep(wait)
+
+    def release_probe(self) -> None:
+        """Let the next probe through after a probe request failed without a response.
+
+        Does nothing once the limit is known.
+        """
+
+        with self._lock:
+            if not self._state[_LIMIT]:
+                self._state[_USED] = 0
+
+    def update(self, headers: Mapping[str, str], window_id: Optional[int] = None) -> None:
+        """Align the budget with the ``x-ratelimit-*`` headers of a response.
+
+        Parameters
+        ----------
+        headers : Mapping[:class:`str`, :class:`str`]
+            The response headers.
+        window_id : Optional[:class:`int`]
+            The window the request was sent in, as returned by :meth:`acquire`.
+            Responses to requests of earlier windows only update the limit.
+            By default the current window.
+        """
+
+        limit = parse_rate_limit_header(headers, "x-ratelimit-limit")
+        remaining = parse_rate_limit_header(headers, "x-ratelimit-remaining")
+        reset = parse_rate_limit_header(headers, "x-ratelimit-reset")
+
+        with self._lock:
+            state = self._state
+            if limit:
+                state[_LIMIT] = limit
+            elif not state[_LIMIT]:
+                # No limit in the headers, let the next probe through
+                state[_USED] = 0
+                return
+
+            if remaining is None or reset is None:
+                return
+
+            now = time.monotonic()
+            if state[_WINDOW_END] <= now:
+                # The window has ended, start the next one where the server's ends
+                state[_USED] = state[_LIMIT] - remaining
+                state[_WINDOW_END] = now + reset
+                state[_WINDOW_ID] += 1
+            elif window_id is None or window_id == state[_WINDOW_ID]:
+                # The server's window decides, it starts when its first request
+                # arrives, and requests of other clients with the key count too
+                state[_USED] = max(state[_USED], state[_LIMIT] - remaining)
+                state[_WINDOW_END] = now + reset
+
+
+class BudgetedTransport(Transport):
+    """Transport taking a slot of a :class:`SharedRateBudget` before every request.
+
+    Attributes
+    ----------
+    budget : :class:`SharedRateBudget`
+        The shared budget.
+    transport : :class:`~valopy.transport.Transport`
+        The transport sending the requests.
+    """
+
+    def __init__(self, budget: SharedRateBudget, transport: Optional[Transport] = None) -> None:
+        """Initialize the BudgetedTransport.
+
+        Parameters
+        ----------
+        budget : :class:`SharedRateBudget`
+            The shared budget.
+        transport : Optional[:class:`~valopy.transport.Transport`]
+            The transport sending the requests, by default a new
+            :class:`~valopy.transport.AiohttpTransport`
+        """
+
+        self.budget = budget
+        self.transport = transport or AiohttpTransport()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional["RequestTimeout"] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> TransportResponse:
+        """Wait for the budget, then send a request with the wrapped transport."""
+
+        window_id = await self.budget.acquire()
+
+        try:
+            response = await self.transport.request(
+                method=method, url=url, headers=headers, params=params, timeout=timeout, trace=trace
+            )
+        except BaseException:
+            # Otherwise a failed probe would stall every process until the window ends
+            self.budget.release_probe()
+            raise
+
+        self.budget.update(response.headers, window_id)
+
+        return response
+
+    async def close(self) -> None:
+        """Close the wrapped transport."""
+
+        await self.transport.close()
+
+
+# Client and event loop of the current worker process
+_worker: Optional[Tuple[asyncio.AbstractEventLoop, Client]] = None
+
+
+def _close_worker() -> None:
+    if _worker is None:
+        return
+
+    loop, client = _worker
+    loop.run_until_complete(client.close())
+    loop.close()
+
+
+def _init_worker(
+    api_key: str,
+    budget: SharedRateBudget,
+    api_url: Optional[str],
+    adapter_options: Dict[str, Any],
+) -> None:
+    global _worker
+
+    options = dict(adapter_options)
+    transport = BudgetedTransport(budget, options.pop("transport", None))
+
+    loop = new_event_loop()
+    asyncio.set_event_loop(loop)
+    client = Client(api_key=api_key, transport=transport, **options)
+    if api_url is not None:
+        client.adapter.api_url = api_url
+    _worker = (loop, client)
+
+    # Runs when the pool shuts the worker down, atexit handlers do not
+    Finalize(None, _close_worker, exitpriority=10)
+
+    _log.debug("Started crawler worker %d", os.getpid())
+
+
+def _pack(result: Any) -> Tuple[int, Any]:
+    # Models travel as valopy.serialization bytes, which load faster than pickles
+    if isinstance(result, BaseException):
+        return 2, result
+
+    sample = result[0] if isinstance(result, list) and result else result
+    if is_dataclass(sample) and not isinstance(sample, type):
+        try:
+            return 1, to_bytes(result)
+        except ValoPyValidationError:
+            pass
+
+    return 0, result
+
+
+def _unpack(packed: Tuple[int, Any]) -> Any:
+    kind, value = packed
+    return from_bytes(value) if kind == 1 else value
+
+
+def _run_chunk(method: str, calls: List[Mapping[str, Any]]) -> List[Tuple[int, Any]]:
+    if _worker is None:
+        raise RuntimeError("Crawler worker process was not initialized")
+
+    loop, client = _worker
+    function = getattr(client, method)
+
+    async def run_all() -> List[Any]:
+        return await asyncio.gather(
+            *(function(**kwargs) for kwargs in calls), return_exceptions=True
+        )
+
+    return [_pack(result) for result in loop.run_until_complete(run_all())]
+
+
+class ProcessCrawler:
+    """Run many client calls across a pool of worker processes.
+
+    Every worker process has its own event loop, a uvloop loop if it is
+    installed, and its own :class:`~valopy.client.Client`, so decoding
+    responses is spread over several CPUs. The workers share one :class:`SharedRateBudget`, so
+    together they stay within the API key's rate limit.
+
+    Results that are models are sent back to the calling process with
+    :mod:`valopy.serialization`.
+
+    Attributes
+    ----------
+    budget : :class:`SharedRateBudget`
+        The rate limit budget shared by the workers.
+    processes : :class:`int`
+        Number of worker processes.
+    chunk_size : :class:`int`
+        Number of calls sent to a worker at once and run concurrently there.
+
+    Examples
+    --------
+    >>> with ProcessCrawler(api_key, processes=4) as crawler:
+    ...     pages = crawler.batch(
+    ...         "get_leaderboard",
+    ...         [{"region": region, "platform": Platform.PC} for region in Region],
+    ...     )
+    ...     accounts = crawler.batch(
+    ...         "get_account_v2_by_puuid",
+    ...         [{"puuid": p.puuid} for page in pages for p in page.players if p.puuid],
+    ...         return_exceptions=True,
+    ...     )
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        processes: Optional[int] = None,
+        rate_limit: Optional[int] = None,
+        rate_window: float = 60.0,
+        chunk_size: int = 50,
+        mp_context: Optional["BaseContext"] = None,
+        api_url: Optional[str] = None,
+        **adapter_options: Any,
+    ) -> None:
+        """Initialize the ProcessCrawler and start its worker processes.
+
+        Parameters
+        ----------
+        api_key : :class:`str`
+            The API key shared by the workers.
+        processes : Optional[:class:`int`]
+            Number of worker processes, by default the number of CPUs
+        rate_limit : Optional[:class:`int`]
+            Requests allowed per window, by default read from ``x-ratelimit-limit``
+        rate_window : :class:`float`, default 60.0
+            Length of a rate limit window in seconds, by default 60.0
+        chunk_size : :class:`int`, default 50
+            Number of calls sent to a worker at once, by default 50
+        mp_context : Optional[:class:`multiprocessing.context.BaseContext`]
+            The multiprocessing context, by default ``spawn``
+        api_url : Optional[:class:`str`]
+            The API base URL of the workers, by default the HenrikDev API
+        **adapter_options : :class:`Any`
+            Additional options forwarded to every worker's
+            :class:`~valopy.adapter.Adapter`. They must be picklable.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``processes`` or ``chunk_size`` is not positive.
+        """
+
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        if self.processes < 1 or chunk_size < 1:
+            raise ValoPyValidationError("processes and chunk_size must be positive")
+
+        # Workers start without a copy of the parent's event loop or sessions
+        context = mp_context or multiprocessing.get_context("spawn")
+
+        self.budget = SharedRateBudget(rate_limit, rate_window, context=context)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(api_key, self.budget, api_url, adapter_options),
+        )
+
+        _log.info("Started ProcessCrawler with %d worker processes", self.processes)
+
+    def batch(
+        self,
+        method: str,
+        calls: Iterable[Mapping[str, Any]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run many calls of one client method across the worker processes.
+
+        Parameters
+        ----------
+        method : :class:`str`
+            Name of the :class:`~valopy.client.Client` method, e.g. ``"get_account_v1"``.
+        calls : Iterable[Mapping[:class:`str`, Any]]
+            Keyword arguments of each call, which must be picklable.
+        return_exceptions : :class:`bool`, default False
+            Whether to return errors in place of results instead of raising
+            the first one, by default False
+
+        Returns
+        -------
+        List[Any]
+            The results in the order of ``calls``.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``method`` is not a method of :class:`~valopy.client.Client`.
+        """
+
+        if method.startswith("_") or not callable(getattr(Client, method, None)):
+            raise ValoPyValidationError(f"Unknown client method: {method}")
+
+        calls = list(calls)
+        chunks = [calls[i : i + self.chunk_size] for i in range(0, len(calls), self.chunk_size)]
+
+        results: List[Any] = []
+        for chunk in self._executor.map(_run_chunk, [method] * len(chunks), chunks):
+            for packed in chunk:
+                if packed[0] == 2 and not return_exceptions:
+                    raise packed[1]
+                results.append(_unpack(packed))
+
+        return results
+
+    def close(self) -> None:
+        """Stop the worker processes, closing their sessions."""
+
+        _log.info("Closing ProcessCrawler")
+
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ProcessCrawler":
+        """Context manager entry.
+
+        Returns
+        -------
+        :class:`ProcessCrawler`
+            The crawler instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[BaseException]]",
+        exc_val: "Optional[BaseException]",
+        exc_tb: "Optional[types.TracebackType]",
+    ) -> None:
+        """Context manager exit, closing the crawler."""
+
+        self.close()
@@ -14,6 +14,22 @@ from .models import (
     WebsiteContent,
 )
 
+__all__ = [
+    "AllowedMethod",
+    "Priority",
+    "OverloadPolicy",
+    "CircuitState",
+    "ExportFormat",
+    "Locale",
+    "Region",
+    "Platform",
+    "Season",
+    "CountryCode",
+    "EsportsRegion",
+    "League",
+    "Endpoint",
+]
+
 
 class AllowedMethod(Enum):
     """Allowed HTTP methods.
@@ -30,6 +46,74 @@ class AllowedMethod(Enum):
     POST = "POST"
 
 
+class Priority(int, Enum):
+    """Request priority classes used by the request scheduler.
+
+    Lower values are served first.
+
+    Members
+    -------
+    HIGH : :class:`int`
+        Interactive requests a user is waiting on.
+    NORMAL : :class:`int`
+        Default priority.
+    LOW : :class:`int`
+        Background and bulk requests.
+    """
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+class OverloadPolicy(str, Enum):
+    """What the request scheduler does with a request when its wait queue is full.
+
+    Members
+    -------
+    WAIT : :class:`str`
+        The caller waits until the queue has room.
+    REJECT : :class:`str`
+        The request fails immediately with :exc:`~valopy.exceptions.ValoPyOverloadError`.
+    """
+
+    WAIT = "wait"
+    REJECT = "reject"
+
+
+class CircuitState(str, Enum):
+    """States of an endpoint circuit breaker.
+
+    Members
+    -------
+    CLOSED : :class:`str`
+        Requests pass through normally.
+    OPEN : :class:`str`
+        Requests fail fast without reaching the API.
+    HALF_OPEN : :class:`str`
+        A limited number of probe requests test whether the API recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ExportFormat(str, Enum):
+    """File formats of the row exporters.
+
+    Members
+    -------
+    NDJSON : :class:`str`
+        One JSON object per line.
+    CSV : :class:`str`
+        Comma-separated values with a header row.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 class Locale(str, Enum):
     """Supported locale codes for internationalization.
 
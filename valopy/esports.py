@@ -0,0 +1,322 @@
+import bisect
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .enums import EsportsRegion, League
+    from .models import EsportsEvent
+
+__all__ = [
+    "ScheduleUpdate",
+    "EsportsSchedule",
+]
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class ScheduleUpdate:
+    """Changes applied by :meth:`EsportsSchedule.update`.
+
+    Attributes
+    ----------
+    added : List[:class:`~valopy.models.EsportsEvent`]
+        Events with a match ID that was not in the schedule.
+    changed : List[:class:`~valopy.models.EsportsEvent`]
+        Events that replaced a different version of the same match.
+    """
+
+    added: List["EsportsEvent"] = field(default_factory=list)
+    changed: List["EsportsEvent"] = field(default_factory=list)
+
+
+class EsportsSchedule:
+    """Esports events indexed by date, state, league, tournament and team.
+
+    Events are kept sorted by ``date`` so time window queries are binary
+    searches, and are identified by ``match.id`` so :meth:`update` only
+    touches events that were added or changed.
+    """
+
+    def __init__(self, events: Iterable["EsportsEvent"] = ()) -> None:
+        """Initialize the EsportsSchedule.
+
+        Parameters
+        ----------
+        events : Iterable[:class:`~valopy.models.EsportsEvent`]
+            The initial events, by default none
+        """
+
+        self._by_id: Dict[str, "EsportsEvent"] = {}
+        self._keys: List[Tuple[datetime, str]] = []
+        self._events: List["EsportsEvent"] = []
+
+        self._by_state: Dict[str, Dict[str, "EsportsEvent"]] = {}
+        self._by_league: Dict[str, Dict[str, "EsportsEvent"]] = {}
+        self._by_tournament: Dict[str, Dict[str, "EsportsEvent"]] = {}
+        self._by_team: Dict[str, Dict[str, "EsportsEvent"]] = {}
+
+        self.update(events)
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator["EsportsEvent"]:
+        return iter(self._events)
+
+    def __contains__(self, match_id: object) -> bool:
+        return match_id in self._by_id
+
+    def get(self, match_id: str) -> Optional["EsportsEvent"]:
+        """Get an event by match ID.
+
+        Parameters
+        ----------
+        match_id : :class:`str`
+            The ID of the event's match.
+
+        Returns
+        -------
+        Optional[:class:`~valopy.models.EsportsEvent`]
+            The event, or None if it is not in the schedule.
+        """
+
+        return self._by_id.get(match_id)
+
+    def update(self, events: Iterable["EsportsEvent"]) -> ScheduleUpdate:
+        """Add new events and replace changed ones, keyed by match ID.
+
+        Unchanged events are skipped, so refreshing with a full schedule only
+        re-indexes what differs.
+
+        Parameters
+        ----------
+        events : Iterable[:class:`~valopy.models.EsportsEvent`]
+            The fetched events.
+
+        Returns
+        -------
+        :class:`ScheduleUpdate`
+            The added and changed events.
+        """
+
+        result = ScheduleUpdate()
+
+        for event in events:
+            current = self._by_id.get(event.match.id)
+            if current is None:
+                result.added.append(event)
+            elif current != event:
+                self._remove(current)
+                result.changed.append(event)
+            else:
+                continue
+
+            self._insert(event)
+
+        if result.added or result.changed:
+            _log.debug(
+                "Updated esports schedule: %d added, %d changed",
+                len(result.added),
+                len(result.changed),
+            )
+
+        return result
+
+    def remove(self, match_id: str) -> Optional["EsportsEvent"]:
+        """Remove an event by match ID.
+
+        Parameters
+        ----------
+        match_id : :class:`str`
+            The ID of the event's match.
+
+        Returns
+        -------
+        Optional[:class:`~valopy.models.EsportsEvent`]
+            The removed event, or None if it was not in the schedule.
+        """
+
+        event = self._by_id.get(match_id)
+        if event is not None:
+            self._remove(event)
+
+        return event
+
+    async def refresh(
+        self,
+        client: "Client",
+        region: Optional["EsportsRegion"] = None,
+        league: Optional["League"] = None,
+    ) -> ScheduleUpdate:
+        """Fetch the schedule and apply it with :meth:`update`.
+
+        Parameters
+        ----------
+        client : :class:`~valopy.client.Client`
+            The client to fetch the schedule with.
+        region : Optional[:class:`~valopy.enums.EsportsRegion`]
+            Filter by esports region, by default None
+        league : Optional[:class:`~valopy.enums.League`]
+            Filter by esports league, by default None
+
+        Returns
+        -------
+        :class:`ScheduleUpdate`
+            The added and changed events.
+        """
+
+        return self.update(await client.get_esports_schedule(region=region, league=league))
+
+    def between(self, start: datetime, end: datetime) -> List["EsportsEvent"]:
+        """Get the events with ``start <= date < end``.
+
+        Parameters
+        ----------
+        start : :class:`datetime.datetime`
+            Start of the window, inclusive.
+        end : :class:`datetime.datetime`
+            End of the window, exclusive.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.EsportsEvent`]
+            The events ordered by date.
+        """
+
+        low = bisect.bisect_left(self._keys, (start, ""))
+        high = bisect.bisect_left(self._keys, (end, ""), lo=low)
+        return self._events[low:high]
+
+    def upcoming(self, count: int, now: Optional[datetime] = None) -> List["EsportsEvent"]:
+        """Get the next events starting at or after ``now``.
+
+        Parameters
+        ----------
+        count : :class:`int`
+            Maximum number of events.
+        now : Optional[:class:`datetime.datetime`]
+            The reference time, by default the current UTC time
+
+        Returns
+        -------
+        List[:class:`~valopy.models.EsportsEvent`]
+            The events ordered by date.
+        """
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+
+        low = bisect.bisect_left(self._keys, (now, ""))
+        return self._events[low : low + count]
+
+    def by_state(self, state: str) -> List["EsportsEvent"]:
+        """Get the events in a state, e.g. ``"unstarted"`` or ``"completed"``.
+
+        Parameters
+        ----------
+        state : :class:`str`
+            The event state.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.EsportsEvent`]
+            The events ordered by date.
+        """
+
+        return _sorted(self._by_state.get(state))
+
+    def by_league(self, identifier: str) -> List["EsportsEvent"]:
+        """Get the events of a league by its identifier, e.g. ``"vct_emea"``.
+
+        Parameters
+        ----------
+        identifier : :class:`str`
+            The league identifier.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.EsportsEvent`]
+            The events ordered by date.
+        """
+
+        return _sorted(self._by_league.get(identifier))
+
+    def by_tournament(self, name: str) -> List["EsportsEvent"]:
+        """Get the events of a tournament by name.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The tournament name.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.EsportsEvent`]
+            The events ordered by date.
+        """
+
+        return _sorted(self._by_tournament.get(name))
+
+    def by_team(self, code: str) -> List["EsportsEvent"]:
+        """Get the events a team plays in by its code, e.g. ``"TH"``.
+
+        Parameters
+        ----------
+        code : :class:`str`
+            The team code.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.EsportsEvent`]
+            The events ordered by date.
+        """
+
+        return _sorted(self._by_team.get(code))
+
+    def _insert(self, event: "EsportsEvent") -> None:
+        match_id = event.match.id
+        key = (event.date, match_id)
+
+        position = bisect.bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._events.insert(position, event)
+        self._by_id[match_id] = event
+
+        for index, value in self._index_keys(event):
+            index.setdefault(value, {})[match_id] = event
+
+    def _remove(self, event: "EsportsEvent") -> None:
+        match_id = event.match.id
+
+        position = bisect.bisect_left(self._keys, (event.date, match_id))
+        del self._keys[position]
+        del self._events[position]
+        del self._by_id[match_id]
+
+        for index, value in self._index_keys(event):
+            bucket = index[value]
+            del bucket[match_id]
+            if not bucket:
+                del index[value]
+
+    def _index_keys(
+        self, event: "EsportsEvent"
+    ) -> Iterator[Tuple[Dict[str, Dict[str, "EsportsEvent"]], str]]:
+        yield self._by_state, event.state
+        yield self._by_league, event.league.identifier
+        yield self._by_tournament, event.tournament.name
+
+        # A team code appears once per match even if both sides share it
+        for code in {team.code for team in event.match.teams}:
+            yield self._by_team, code
+
+
+def _sorted(bucket: Optional[Dict[str, "EsportsEvent"]]) -> List["EsportsEvent"]:
+    if not bucket:
+        return []
+
+    return sorted(bucket.values(), key=lambda event: (event.date, event.match.id))
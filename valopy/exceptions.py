@@ -1,12 +1,44 @@
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Mapping, Optional, Union
 
 if TYPE_CHECKING:
     import aiohttp
 
 
+__all__ = [
+    "ValoPyError",
+    "ValoPyHTTPError",
+    "ValoPyRequestError",
+    "ValoPyPermissionError",
+    "ValoPyNotFoundError",
+    "ValoPyValidationError",
+    "ValoPyCircuitOpenError",
+    "ValoPyOverloadError",
+    "ValoPyTimeoutError",
+    "ValoPyClientTimeoutError",
+    "ValoPyRateLimitError",
+    "ValoPyServerError",
+    "from_status",
+    "from_client_response_error",
+]
+
+
+def _restore_error(cls: type, args: tuple, state: dict) -> "ValoPyError":
+    """Rebuild a pickled error without calling its ``__init__``."""
+
+    error = cls.__new__(cls)
+    Exception.__init__(error, *args)
+    error.__dict__.update(state)
+    return error
+
+
 class ValoPyError(Exception):
     """Base exception for all ValoPy errors."""
 
+    def __reduce__(self) -> tuple:
+        # The subclasses take other arguments than the message they pass to
+        # Exception, so pickle the attributes instead of calling __init__ again
+        return _restore_error, (type(self), self.args, self.__dict__)
+
 
 class ValoPyHTTPError(ValoPyError):
     """HTTP error with status code and URL information.
@@ -117,6 +149,48 @@ class ValoPyValidationError(ValoPyError):
         super().__init__(message)
 
 
+class ValoPyCircuitOpenError(ValoPyError):
+    """Request rejected because the endpoint's circuit breaker is open.
+
+    Attributes
+    ----------
+    message : :class:`str`
+        Error message indicating the open circuit.
+    endpoint : :class:`str`
+        The endpoint whose circuit is open.
+    retry_after : :class:`float`
+        Seconds until the circuit breaker lets a probe request through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        self.message = f"Circuit open for {endpoint}, retry in {retry_after:.1f}s"
+
+        super().__init__(self.message)
+
+
+class ValoPyOverloadError(ValoPyError):
+    """Request rejected because the client's wait queue is full.
+
+    Attributes
+    ----------
+    message : :class:`str`
+        Error message indicating the overload.
+    waiting : :class:`int`
+        Number of requests waiting for a slot when the request was rejected.
+    max_queue : :class:`int`
+        The maximum number of waiting requests.
+    """
+
+    def __init__(self, waiting: int, max_queue: int) -> None:
+        self.waiting = waiting
+        self.max_queue = max_queue
+        self.message = f"Client overloaded, {waiting} of {max_queue} queued requests waiting"
+
+        super().__init__(self.message)
+
+
 class ValoPyTimeoutError(ValoPyHTTPError):
     """Request timeout (408).
 
@@ -138,6 +212,30 @@ class ValoPyTimeoutError(ValoPyHTTPError):
         super().__init__(status_code=status_code, message=self.message, url=url)
 
 
+class ValoPyClientTimeoutError(ValoPyTimeoutError):
+    """Request timed out on the client before the API responded.
+
+    Attributes
+    ----------
+    message : :class:`str`
+        Error message indicating the timeout.
+    status_code : :class:`int`
+        HTTP status code (408).
+    url : Optional[:class:`str`]
+        The URL that timed out.
+    phase : :class:`str`
+        The exceeded limit: ``connect``, ``first_byte``, ``total`` or ``deadline``.
+    """
+
+    def __init__(self, phase: str, url: Optional[str] = None) -> None:
+        self.phase = phase
+        self.message = f"Client Timeout ({phase}): {url}"
+        self.status_code = 408
+        self.url = url
+
+        ValoPyHTTPError.__init__(self, message=self.message, status_code=408, url=url)
+
+
 class ValoPyRateLimitError(ValoPyHTTPError):
     """Rate limit exceeded (429).
 
@@ -198,6 +296,76 @@ class ValoPyServerError(ValoPyHTTPError):
         super().__init__(message=self.message, status_code=status_code, url=url)
 
 
+def from_status(
+    status_code: int,
+    url: Optional[str] = None,
+    message: Optional[str] = None,
+    request_headers: Optional[Mapping[str, str]] = None,
+    response_headers: Optional[Mapping[str, str]] = None,
+    redacted: bool = True,
+) -> Union[
+    ValoPyHTTPError,
+    ValoPyRequestError,
+    ValoPyPermissionError,
+    ValoPyNotFoundError,
+    ValoPyTimeoutError,
+    ValoPyRateLimitError,
+    ValoPyServerError,
+]:
+    """Create the ValoPyHTTPError matching an HTTP error status code.
+
+    Parameters
+    ----------
+    status_code : :class:`int`
+        The HTTP status code of the response.
+    url : Optional[:class:`str`]
+        The URL of the request, by default None
+    message : Optional[:class:`str`]
+        The reason phrase of the response, by default None
+    request_headers : Optional[Mapping[:class:`str`, :class:`str`]]
+        The request headers, by default None
+    response_headers : Optional[Mapping[:class:`str`, :class:`str`]]
+        The response headers, by default None
+    redacted : :class:`bool`, default True
+        Whether the API key in the request headers is redacted, by default True
+
+    Returns
+    -------
+    :exc:`ValoPyHTTPError` | :exc:`ValoPyRequestError` | :exc:`ValoPyPermissionError` | :exc:`ValoPyNotFoundError` | :exc:`ValoPyTimeoutError` | :exc:`ValoPyRateLimitError` | :exc:`ValoPyServerError`
+        The corresponding ValoPy error matching the HTTP status code.
+    """  # noqa: E501
+
+    match status_code:
+        case 400:
+            error_class = ValoPyRequestError(status_code=status_code, url=url)
+        case 401:
+            error_class = ValoPyPermissionError(
+                status_code=status_code,
+                url=url,
+                request_headers=dict(request_headers or {}) if not redacted else {},
+            )
+        case 404:
+            error_class = ValoPyNotFoundError(status_code=status_code, url=url)
+        case 408:
+            error_class = ValoPyTimeoutError(status_code=status_code, url=url)
+        case 429:
+            error_class = ValoPyRateLimitError(
+                status_code=status_code,
+                url=url,
+                response_headers=response_headers or {},  # type: ignore[arg-type]
+            )
+        case _ if 500 <= status_code < 600:
+            error_class = ValoPyServerError(status_code=status_code, url=url)
+        case _:
+            error_class = ValoPyHTTPError(
+                status_code=status_code,
+                message=message or "",
+                url=url,
+            )
+
+    return error_class
+
+
 def from_client_response_error(
     error: "aiohttp.ClientResponseError",
     redacted: bool,
@@ -242,51 +410,11 @@ def from_client_response_error(
         For any other HTTP error status codes.
     """  # noqa: E501
 
-    request_headers = (
-        dict(error.request_info.headers)
-        if error.request_info and error.request_info.headers
-        else {}
+    return from_status(
+        status_code=error.status,
+        url=str(error.request_info.url) if error.request_info else None,
+        message=error.message,
+        request_headers=error.request_info.headers if error.request_info else None,
+        response_headers=error.headers,
+        redacted=redacted,
     )
-    response_headers = dict(error.headers) if error.headers else {}
-
-    match error.status:
-        case 400:
-            error_class = ValoPyRequestError(
-                status_code=error.status,
-                url=str(error.request_info.url) if error.request_info else None,
-            )
-        case 401:
-            error_class = ValoPyPermissionError(
-                status_code=error.status,
-                url=str(error.request_info.url) if error.request_info else None,
-                request_headers=request_headers if not redacted else {},
-            )
-        case 404:
-            error_class = ValoPyNotFoundError(
-                status_code=error.status,
-                url=str(error.request_info.url) if error.request_info else None,
-            )
-        case 408:
-            error_class = ValoPyTimeoutError(
-                status_code=error.status,
-                url=str(error.request_info.url) if error.request_info else None,
-            )
-        case 429:
-            error_class = ValoPyRateLimitError(
-                status_code=error.status,
-                url=str(error.request_info.url) if error.request_info else None,
-                response_headers=response_headers,
-            )
-        case status_code if 500 <= status_code < 600:
-            error_class = ValoPyServerError(
-                status_code=error.status,
-                url=str(error.request_info.url) if error.request_info else None,
-            )
-        case _:
-            error_class = ValoPyHTTPError(
-                status_code=error.status,
-                message=error.message,
-                url=str(error.request_info.url) if error.request_info else None,
-            )
-
-    return error_class
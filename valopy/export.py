@@ -0,0 +1,313 @@
+import csv
+import gzip
+import json
+import logging
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .enums import ExportFormat
+from .exceptions import ValoPyValidationError
+from .models import (
+    Content,
+    ContentAct,
+    ContentCharacter,
+    ContentItem,
+    ContentMap,
+    ContentPlayerTitle,
+    LeaderboardPlayer,
+)
+
+if TYPE_CHECKING:
+    import types
+
+    from .client import Client
+    from .enums import Platform, Region, Season
+
+__all__ = [
+    "LEADERBOARD_FIELDS",
+    "CONTENT_FIELDS",
+    "RowWriter",
+    "export_leaderboard",
+    "export_content",
+]
+
+_log = logging.getLogger(__name__)
+
+LEADERBOARD_FIELDS = tuple(field.name for field in fields(LeaderboardPlayer))
+
+# Columns of every content category, a category only fills the ones its model has
+CONTENT_FIELDS = tuple(
+    dict.fromkeys(
+        ["category"]
+        + [
+            field.name
+            for model in (ContentCharacter, ContentMap, ContentItem, ContentPlayerTitle, ContentAct)
+            for field in fields(model)
+        ]
+    )
+)
+
+# Content attributes holding lists of items, in export order
+_CONTENT_CATEGORIES = tuple(field.name for field in fields(Content) if field.name != "version")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class RowWriter:
+    """Write rows one at a time to an NDJSON or CSV file, optionally gzip-compressed.
+
+    Rows are written as they arrive, so memory does not grow with the number
+    of rows. Dates are written in ISO 8601, and nested values such as
+    ``localizedNames`` are written as JSON in CSV cells.
+
+    Attributes
+    ----------
+    fieldnames : Sequence[:class:`str`]
+        The columns, in order.
+    format : :class:`~valopy.enums.ExportFormat`
+        The file format.
+    rows : :class:`int`
+        Number of rows written.
+    """
+
+    def __init__(
+        self,
+        destination: Union[str, Path, IO[str]],
+        fieldnames: Sequence[str],
+        format: ExportFormat = ExportFormat.NDJSON,
+        compress: Optional[bool] = None,
+    ) -> None:
+        """Initialize the RowWriter and open the destination.
+
+        Parameters
+        ----------
+        destination : Union[:class:`str`, :class:`pathlib.Path`, IO[:class:`str`]]
+            A file path, or an open text file that is left open on :meth:`close`.
+        fieldnames : Sequence[:class:`str`]
+            The columns, in order.
+        format : :class:`~valopy.enums.ExportFormat`, default ExportFormat.NDJSON
+            The file format, by default NDJSON
+        compress : Optional[:class:`bool`]
+            Whether to gzip the file, by default if the path ends with ``.gz``
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``compress`` is set for an open file.
+        """
+
+        self.fieldnames = fieldnames
+        self.format = ExportFormat(format)
+        self.rows = 0
+
+        if isinstance(destination, (str, Path)):
+            path = Path(destination)
+            if compress is None:
+                compress = path.suffix == ".gz"
+
+            # The file stays open across write calls and is closed in close()
+            if compress:
+                self._file: IO[str] = gzip.open(  # noqa: SIM115
+                    path, "wt", encoding="utf-8", newline=""
+                )
+            else:
+                self._file = open(path, "w", encoding="utf-8", newline="")  # noqa: SIM115
+            self._owns_file = True
+        else:
+            if compress:
+                raise ValoPyValidationError("compress requires a path, not an open file")
+
+            self._file = destination
+            self._owns_file = False
+
+        if self.format is ExportFormat.CSV:
+            self._csv = csv.writer(self._file)
+            self._csv.writerow(fieldnames)
+
+    def write(self, row: Mapping[str, Any]) -> None:
+        """Write one row, missing columns are left empty.
+
+        Parameters
+        ----------
+        row : Mapping[:class:`str`, Any]
+            The values by column name.
+        """
+
+        if self.format is ExportFormat.NDJSON:
+            values = {name: row.get(name) for name in self.fieldnames}
+            self._file.write(json.dumps(values, default=_json_default, ensure_ascii=False))
+            self._file.write("\n")
+        else:
+            self._csv.writerow([self._cell(row.get(name)) for name in self.fieldnames])
+
+        self.rows += 1
+
+    def write_all(self, rows: Iterable[Mapping[str, Any]]) -> None:
+        """Write many rows.
+
+        Parameters
+        ----------
+        rows : Iterable[Mapping[:class:`str`, Any]]
+            The rows.
+        """
+
+        for row in rows:
+            self.write(row)
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, default=_json_default, ensure_ascii=False)
+        return value
+
+    def close(self) -> None:
+        """Flush the rows and close the file if the writer opened it."""
+
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "RowWriter":
+        """Context manager entry.
+
+        Returns
+        -------
+        :class:`RowWriter`
+            The writer instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[BaseException]]",
+        exc_val: "Optional[BaseException]",
+        exc_tb: "Optional[types.TracebackType]",
+    ) -> None:
+        """Context manager exit, closing the writer."""
+
+        self.close()
+
+
+async def export_leaderboard(
+    client: "Client",
+    destination: Union[str, Path, IO[str]],
+    region: "Region",
+    platform: "Platform",
+    season: Optional["Season"] = None,
+    format: ExportFormat = ExportFormat.NDJSON,
+    compress: Optional[bool] = None,
+    page_size: int = 1000,
+) -> int:
+    """Stream a whole leaderboard to a file, one page at a time.
+
+    Each page is written as soon as it arrives and then released, so memory
+    stays at about one page regardless of the ladder size.
+
+    Parameters
+    ----------
+    client : :class:`~valopy.client.Client`
+        The client to fetch the pages with.
+    destination : Union[:class:`str`, :class:`pathlib.Path`, IO[:class:`str`]]
+        A file path, or an open text file.
+    region : :class:`~valopy.enums.Region`
+        The region of the leaderboard.
+    platform : :class:`~valopy.enums.Platform`
+        The platform of the leaderboard.
+    season : Optional[:class:`~valopy.enums.Season`]
+        The season of the leaderboard, by default the current season
+    format : :class:`~valopy.enums.ExportFormat`, default ExportFormat.NDJSON
+        The file format, by default NDJSON
+    compress : Optional[:class:`bool`]
+        Whether to gzip the file, by default if the path ends with ``.gz``
+    page_size : :class:`int`, default 1000
+        Number of players per request, by default 1000
+
+    Returns
+    -------
+    :class:`int`
+        Number of players written.
+    """
+
+    with RowWriter(destination, LEADERBOARD_FIELDS, format=format, compress=compress) as writer:
+        pages = client.iter_leaderboard_pages(
+            region=region, platform=platform, season=season, page_size=page_size
+        )
+        async for page in pages:
+            writer.write_all(player.__dict__ for player in page.players)
+
+    _log.info("Exported %d leaderboard players", writer.rows)
+
+    return writer.rows
+
+
+def export_content(
+    content: Content,
+    destination: Union[str, Path, IO[str]],
+    format: ExportFormat = ExportFormat.NDJSON,
+    compress: Optional[bool] = None,
+    categories: Optional[Iterable[str]] = None,
+) -> int:
+    """Write the items of a content catalog to a file, one row per item.
+
+    Rows are written straight from the models with a ``category`` column
+    naming the :class:`~valopy.models.Content` attribute, e.g. ``"skins"``.
+
+    Parameters
+    ----------
+    content : :class:`~valopy.models.Content`
+        The content catalog.
+    destination : Union[:class:`str`, :class:`pathlib.Path`, IO[:class:`str`]]
+        A file path, or an open text file.
+    format : :class:`~valopy.enums.ExportFormat`, default ExportFormat.NDJSON
+        The file format, by default NDJSON
+    compress : Optional[:class:`bool`]
+        Whether to gzip the file, by default if the path ends with ``.gz``
+    categories : Optional[Iterable[:class:`str`]]
+        The categories to export, by default all of them
+
+    Returns
+    -------
+    :class:`int`
+        Number of items written.
+
+    Raises
+    ------
+    :exc:`ValoPyValidationError`
+        If a category is not a list attribute of :class:`~valopy.models.Content`.
+    """
+
+    selected: List[str] = list(categories) if categories is not None else list(_CONTENT_CATEGORIES)
+    unknown = set(selected) - set(_CONTENT_CATEGORIES)
+    if unknown:
+        raise ValoPyValidationError(f"Unknown content categories: {', '.join(sorted(unknown))}")
+
+    with RowWriter(destination, CONTENT_FIELDS, format=format, compress=compress) as writer:
+        for category in selected:
+            for item in getattr(content, category):
+                row: Dict[str, Any] = {"category": category, **item.__dict__}
+                writer.write(row)
+
+    _log.info("Exported %d content items", writer.rows)
+
+    return writer.rows
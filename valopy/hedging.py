@@ -0,0 +1,223 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+
+from .exceptions import ValoPyValidationError
+
+if TYPE_CHECKING:
+    from .enums import Endpoint
+
+__all__ = [
+    "HedgeConfig",
+    "Hedger",
+]
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeConfig:
+    """Settings for hedged GET requests.
+
+    Attributes
+    ----------
+    delay : Optional[:class:`float`]
+        Fixed seconds to wait before sending the hedge. If None, the observed
+        ``quantile`` latency of the endpoint is used.
+    quantile : :class:`float`
+        Latency quantile to wait for when ``delay`` is None (0 to 1).
+    min_samples : :class:`int`
+        Number of observed latencies needed before the quantile is used.
+    default_delay : :class:`float`
+        Seconds to wait while fewer than ``min_samples`` latencies were observed.
+    window_size : :class:`int`
+        Number of recent latencies kept per endpoint.
+    min_headroom : :class:`int`
+        Rate limit headroom the API keys must have left for a hedge to be sent.
+    endpoints : Optional[FrozenSet[:class:`~valopy.enums.Endpoint`]]
+        Endpoints to hedge, None to hedge every GET request.
+    """
+
+    delay: Optional[float] = None
+    quantile: float = 0.95
+    min_samples: int = 20
+    default_delay: float = 1.0
+    window_size: int = 200
+    min_headroom: int = 2
+    endpoints: Optional[FrozenSet["Endpoint"]] = None
+
+    def __post_init__(self) -> None:
+        if not 0 < self.quantile < 1:
+            raise ValoPyValidationError("quantile must be between 0 and 1")
+
+        if self.window_size < self.min_samples:
+            raise ValoPyValidationError("window_size must be at least min_samples")
+
+
+class Hedger:
+    """Races a second identical request against a slow first one.
+
+    If the first attempt has not completed after the hedge delay, a second
+    attempt is started. The first successful attempt wins and the other is
+    cancelled. The hedge delay adapts to the observed latency of each endpoint.
+
+    Attributes
+    ----------
+    config : :class:`HedgeConfig`
+        The hedging settings.
+    """
+
+    def __init__(self, config: HedgeConfig) -> None:
+        """Initialize the Hedger.
+
+        Parameters
+        ----------
+        config : :class:`HedgeConfig`
+            The hedging settings.
+        """
+
+        self.config = config
+
+        self._latencies: Dict[str, deque[float]] = {}
+
+    def applies_to(self, endpoint: Optional["Endpoint"]) -> bool:
+        """Check whether requests to an endpoint are hedged.
+
+        Parameters
+        ----------
+        endpoint : Optional[:class:`~valopy.enums.Endpoint`]
+            The endpoint of the request.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the request should be hedged.
+        """
+
+        return self.config.endpoints is None or endpoint in self.config.endpoints
+
+    def delay(self, name: str) -> float:
+        """Get the time to wait before hedging a request.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The endpoint name.
+
+        Returns
+        -------
+        :class:`float`
+            The hedge delay in seconds.
+        """
+
+        if self.config.delay is not None:
+            return self.config.delay
+
+        latencies = self._latencies.get(name)
+        if latencies is None or len(latencies) < self.config.min_samples:
+            return self.config.default_delay
+
+        ordered = sorted(latencies)
+        index = min(math.ceil(self.config.quantile * len(ordered)) - 1, len(ordered) - 1)
+
+        return ordered[max(index, 0)]
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the latency of a completed attempt.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The endpoint name.
+        seconds : :class:`float`
+            The latency of the attempt.
+        """
+
+        latencies = self._latencies.get(name)
+        if latencies is None:
+            latencies = self._latencies[name] = deque(maxlen=self.config.window_size)
+
+        latencies.append(seconds)
+
+    async def run(
+        self,
+        name: str,
+        attempt: Callable[[], Awaitable[T]],
+        can_hedge: Callable[[], bool],
+        hedge: Optional[Callable[[], Awaitable[T]]] = None,
+    ) -> T:
+        """Run an attempt, hedging it if it is slow and a hedge is allowed.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The endpoint name.
+        attempt : Callable[[], Awaitable[T]]
+            Starts the first attempt of the request.
+        can_hedge : Callable[[], :class:`bool`]
+            Checked once the delay passed, whether a hedge may be sent now.
+        hedge : Optional[Callable[[], Awaitable[T]]]
+            Starts the hedge attempt, e.g. taking its own request slot, by default ``attempt``
+
+        Returns
+        -------
+        T
+            The result of the first successful attempt.
+        """
+
+        primary = asyncio.create_task(self._timed(name, attempt))
+        attempts = [primary]
+
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.delay(name))
+            if done or not can_hedge():
+                return await primary
+
+            _log.info("Hedging slow request to %s", name)
+            attempts.append(asyncio.create_task(self._timed(name, hedge or attempt)))
+
+            pending = set(attempts)
+            first_error: Optional[BaseException] = None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        _log.debug("Attempt %d won for %s", attempts.index(task) + 1, name)
+                        return task.result()
+
+                    first_error = first_error or error
+
+            raise first_error  # type: ignore[misc]
+
+        finally:
+            # Cancel the losing attempt and wait until it gave back its API key
+            losers = [task for task in attempts if not task.done()]
+            for task in losers:
+                task.cancel()
+
+            await asyncio.gather(*losers, return_exceptions=True)
+
+    async def _timed(self, name: str, attempt: Callable[[], Awaitable[T]]) -> T:
+        """Run one attempt and record its latency if it succeeds or is cancelled."""
+
+        started = time.monotonic()
+        try:
+            result = await attempt()
+        except asyncio.CancelledError:
+            # A losing attempt took at least this long, leaving it out would
+            # only keep the fast winners and pull the hedge delay down
+            self.record(name, time.monotonic() - started)
+            raise
+
+        self.record(name, time.monotonic() - started)
+
+        return result
@@ -0,0 +1,241 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence, Union
+
+from .exceptions import ValoPyPermissionError, ValoPyValidationError
+from .utils import parse_rate_limit_header
+
+__all__ = [
+    "KeyState",
+    "KeyPool",
+]
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class KeyState:
+    """Rate limit state of a single API key.
+
+    Attributes
+    ----------
+    key : :class:`str`
+        The API key.
+    limit : Optional[:class:`int`]
+        The last seen ``x-ratelimit-limit`` value, None until a response is received.
+    remaining : Optional[:class:`int`]
+        The last seen ``x-ratelimit-remaining`` value, None until a response is received.
+    reset_at : :class:`float`
+        Monotonic time at which the rate limit window resets.
+    in_flight : :class:`int`
+        Number of requests currently using this key.
+    disabled : :class:`bool`
+        Whether the key was taken out of rotation after a permission error.
+    """
+
+    key: str
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_at: float = 0.0
+    in_flight: int = 0
+    disabled: bool = False
+
+    def headroom(self, now: float) -> float:
+        """Estimate how many more requests this key can make in the current window.
+
+        Parameters
+        ----------
+        now : :class:`float`
+            The current monotonic time.
+
+        Returns
+        -------
+        :class:`float`
+            The estimated headroom, ``inf`` if the key's quota is unknown or its window reset.
+        """
+
+        if self.remaining is None or self.reset_at <= now:
+            return float("inf")
+
+        return self.remaining - self.in_flight
+
+
+class KeyPool:
+    """Pool of API keys routing each request to the key with the most headroom.
+
+    The pool tracks the ``x-ratelimit-*`` headers of every response. Keys are
+    skipped while they are rate limited and removed from rotation after a
+    permission error.
+    """
+
+    def __init__(self, keys: Union[str, Sequence[str]]) -> None:
+        """Initialize the KeyPool.
+
+        Parameters
+        ----------
+        keys : Union[:class:`str`, Sequence[:class:`str`]]
+            A single API key or a sequence of API keys.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If no API key is provided.
+        """
+
+        if isinstance(keys, str):
+            keys = [keys]
+
+        # Drop duplicates while keeping the given order
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            raise ValoPyValidationError("At least one API key must be provided")
+
+        self._states = {key: KeyState(key=key) for key in keys}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    @property
+    def states(self) -> list[KeyState]:
+        """The rate limit state of every key in the pool."""
+
+        return list(self._states.values())
+
+    def available(self) -> int:
+        """Count the keys that are neither disabled nor rate limited.
+
+        Returns
+        -------
+        :class:`int`
+            The number of keys that can currently make requests.
+        """
+
+        now = time.monotonic()
+        return sum(
+            1 for state in self._states.values() if not state.disabled and state.headroom(now) > 0
+        )
+
+    def headroom(self) -> float:
+        """Estimate how many more requests all keys together can make right now.
+
+        Returns
+        -------
+        :class:`float`
+            The summed headroom of all enabled keys, ``inf`` if any key's quota is unknown.
+        """
+
+        now = time.monotonic()
+        return sum(
+            max(state.headroom(now), 0) for state in self._states.values() if not state.disabled
+        )
+
+    def retry_after(self) -> float:
+        """Get the time until the first rate limited key resets.
+
+        Returns
+        -------
+        :class:`float`
+            Seconds until a key has headroom again, 0 if one has headroom now.
+        """
+
+        now = time.monotonic()
+        enabled = [state for state in self._states.values() if not state.disabled]
+        if not enabled or any(state.headroom(now) > 0 for state in enabled):
+            return 0.0
+
+        return max(min(state.reset_at for state in enabled) - now, 0.0)
+
+    def acquire(self) -> str:
+        """Select the key with the most headroom and reserve a request on it.
+
+        If every key is rate limited, the key whose window resets first is
+        returned. Every acquired key must be given back with :meth:`release`.
+
+        Returns
+        -------
+        :class:`str`
+            The selected API key.
+
+        Raises
+        ------
+        :exc:`ValoPyPermissionError`
+            If every key in the pool was disabled after a permission error.
+        """
+
+        now = time.monotonic()
+        enabled = [state for state in self._states.values() if not state.disabled]
+        if not enabled:
+            raise ValoPyPermissionError(status_code=401)
+
+        best = max(enabled, key=lambda state: (state.headroom(now), -state.in_flight))
+        if best.headroom(now) <= 0:
+            best = min(enabled, key=lambda state: state.reset_at)
+            _log.warning("All API keys are rate limited, using the key resetting first")
+
+        best.in_flight += 1
+
+        return best.key
+
+    def release(self, key: str, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Give back a key and update its state from the response headers.
+
+        Parameters
+        ----------
+        key : :class:`str`
+            The key returned by :meth:`acquire`.
+        headers : Optional[Mapping[:class:`str`, :class:`str`]]
+            The response headers, by default None
+        """
+
+        state = self._states[key]
+        state.in_flight = max(state.in_flight - 1, 0)
+
+        if not headers:
+            return
+
+        limit = parse_rate_limit_header(headers, "x-ratelimit-limit")
+        remaining = parse_rate_limit_header(headers, "x-ratelimit-remaining")
+        reset = parse_rate_limit_header(headers, "x-ratelimit-reset")
+
+        if limit is not None:
+            state.limit = limit
+        if remaining is not None:
+            state.remaining = remaining
+        if reset is not None:
+            state.reset_at = time.monotonic() + reset
+
+    def mark_rate_limited(self, key: str, reset: Optional[Union[int, float, str]] = None) -> None:
+        """Take a key out of rotation until its rate limit window resets.
+
+        Parameters
+        ----------
+        key : :class:`str`
+            The rate limited key.
+        reset : Optional[Union[:class:`int`, :class:`float`, :class:`str`]]
+            Seconds until the window resets, by default None (60 seconds)
+        """
+
+        try:
+            seconds = float(reset) if reset is not None else 60.0
+        except ValueError:
+            seconds = 60.0
+
+        state = self._states[key]
+        state.remaining = 0
+        state.reset_at = max(state.reset_at, time.monotonic() + seconds)
+
+        _log.info("API key rate limited for %.1f seconds", seconds)
+
+    def disable(self, key: str) -> None:
+        """Take a key out of rotation permanently.
+
+        Parameters
+        ----------
+        key : :class:`str`
+            The key that caused a permission error.
+        """
+
+        self._states[key].disabled = True
+
+        _log.warning("API key disabled after permission error (%d keys left)", self.available())
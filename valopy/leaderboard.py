@@ -0,0 +1,759 @@
+import bisect
+import json
+import logging
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from .exceptions import ValoPyValidationError
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .enums import Platform, Region, Season
+    from .models import Leaderboard, LeaderboardPlayer, LeaderboardThreshold, LeaderboardTier
+
+__all__ = [
+    "ThresholdIndex",
+    "PlayerIndex",
+    "SnapshotEntry",
+    "RankChange",
+    "LeaderboardDiff",
+    "LeaderboardSnapshot",
+]
+
+_log = logging.getLogger(__name__)
+
+_SNAPSHOT_VERSION = 1
+
+
+class ThresholdIndex:
+    """Tier lookups over the thresholds of a leaderboard.
+
+    The thresholds are sorted once by ``start_index`` and by ``threshold``, so
+    every lookup is a binary search instead of a scan. Usually accessed through
+    :attr:`~valopy.models.Leaderboard.threshold_index`.
+
+    Attributes
+    ----------
+    thresholds : List[:class:`~valopy.models.LeaderboardThreshold`]
+        The thresholds ordered by ``start_index``.
+    total : Optional[:class:`int`]
+        Number of players on the leaderboard, if known.
+    """
+
+    def __init__(
+        self, thresholds: Sequence["LeaderboardThreshold"], total: Optional[int] = None
+    ) -> None:
+        """Initialize the ThresholdIndex.
+
+        Parameters
+        ----------
+        thresholds : Sequence[:class:`~valopy.models.LeaderboardThreshold`]
+            The thresholds of the leaderboard.
+        total : Optional[:class:`int`]
+            Number of players on the leaderboard, by default None
+        """
+
+        self.thresholds = sorted(thresholds, key=lambda t: t.start_index)
+        self.total = total
+
+        self._starts = [t.start_index for t in self.thresholds]
+
+        by_rr = sorted(thresholds, key=lambda t: t.threshold)
+        self._rr_thresholds = [t.threshold for t in by_rr]
+        self._rr_tiers = [t.tier for t in by_rr]
+
+        self._by_tier: Dict[int, "LeaderboardThreshold"] = {t.tier.id: t for t in thresholds}
+
+    def tier_for_rank(self, rank: int) -> Optional["LeaderboardTier"]:
+        """Get the tier of a leaderboard rank.
+
+        Parameters
+        ----------
+        rank : :class:`int`
+            The 1-based leaderboard rank.
+
+        Returns
+        -------
+        Optional[:class:`~valopy.models.LeaderboardTier`]
+            The tier, or None if the rank is outside the leaderboard.
+        """
+
+        if self.total is not None and rank > self.total:
+            return None
+
+        position = bisect.bisect_right(self._starts, rank) - 1
+        if position < 0:
+            return None
+
+        return self.thresholds[position].tier
+
+    def tier_for_rr(self, rr: int) -> Optional["LeaderboardTier"]:
+        """Get the highest tier whose RR threshold is reached.
+
+        Parameters
+        ----------
+        rr : :class:`int`
+            Ranking rating points.
+
+        Returns
+        -------
+        Optional[:class:`~valopy.models.LeaderboardTier`]
+            The tier, or None if ``rr`` is below every threshold.
+        """
+
+        position = bisect.bisect_right(self._rr_thresholds, rr) - 1
+        if position < 0:
+            return None
+
+        return self._rr_tiers[position]
+
+    def rr_for_tier(self, tier_id: int) -> Optional[int]:
+        """Get the RR needed to reach a tier.
+
+        Parameters
+        ----------
+        tier_id : :class:`int`
+            The tier ID.
+
+        Returns
+        -------
+        Optional[:class:`int`]
+            The RR threshold, or None if the tier is not on the leaderboard.
+        """
+
+        threshold = self._by_tier.get(tier_id)
+        return threshold.threshold if threshold else None
+
+    def rank_range(self, tier_id: int) -> Optional[range]:
+        """Get the leaderboard ranks of a tier.
+
+        Parameters
+        ----------
+        tier_id : :class:`int`
+            The tier ID.
+
+        Returns
+        -------
+        Optional[:class:`range`]
+            The ranks, or None if the tier is not on the leaderboard or is the
+            lowest tier and :attr:`total` is unknown.
+        """
+
+        threshold = self._by_tier.get(tier_id)
+        if threshold is None:
+            return None
+
+        position = bisect.bisect_left(self._starts, threshold.start_index)
+        if position + 1 < len(self._starts):
+            end = self._starts[position + 1]
+        elif self.total is not None:
+            end = self.total + 1
+        else:
+            return None
+
+        return range(threshold.start_index, max(end, threshold.start_index))
+
+    def players_per_tier(self) -> Dict[int, int]:
+        """Count the players of every tier.
+
+        Returns
+        -------
+        Dict[:class:`int`, :class:`int`]
+            Number of players keyed by tier ID. The lowest tier is left out
+            if :attr:`total` is unknown.
+        """
+
+        counts = {}
+        for threshold in self.thresholds:
+            ranks = self.rank_range(threshold.tier.id)
+            if ranks is not None:
+                counts[threshold.tier.id] = len(ranks)
+
+        return counts
+
+
+class PlayerIndex:
+    """Local lookups over crawled leaderboard players.
+
+    Players are indexed by ``puuid``, by case-insensitive Riot ID and by
+    name prefix. Anonymized players have no usable name, so they are only
+    found by ``puuid``. If a ``puuid`` appears more than once, for example
+    because a player moved between pages during a crawl, the last row wins.
+
+    Attributes
+    ----------
+    anonymized : :class:`int`
+        Number of anonymized players, which are not searchable by name.
+    """
+
+    def __init__(self, players: Iterable["LeaderboardPlayer"]) -> None:
+        """Initialize the PlayerIndex.
+
+        Parameters
+        ----------
+        players : Iterable[:class:`~valopy.models.LeaderboardPlayer`]
+            The rows of one or more leaderboard pages.
+        """
+
+        self._by_puuid: Dict[str, "LeaderboardPlayer"] = {}
+        for player in players:
+            if player.puuid:
+                self._by_puuid[player.puuid] = player
+
+        self._by_riot_id: Dict[str, "LeaderboardPlayer"] = {}
+        named = []
+        self.anonymized = 0
+        for player in self._by_puuid.values():
+            if player.is_anonymized or not player.name:
+                self.anonymized += 1
+                continue
+
+            self._by_riot_id[_riot_id_key(player.name, player.tag)] = player
+            named.append((player.name.casefold(), player.leaderboard_rank, player))
+
+        named.sort(key=lambda item: (item[0], item[1]))
+        self._names = [item[0] for item in named]
+        self._named_players = [item[2] for item in named]
+
+    def __len__(self) -> int:
+        return len(self._by_puuid)
+
+    def __contains__(self, puuid: object) -> bool:
+        return puuid in self._by_puuid
+
+    def get(self, puuid: str) -> Optional["LeaderboardPlayer"]:
+        """Get a player by PUUID.
+
+        Parameters
+        ----------
+        puuid : :class:`str`
+            The player's unique identifier.
+
+        Returns
+        -------
+        Optional[:class:`~valopy.models.LeaderboardPlayer`]
+            The player, or None if they are not indexed.
+        """
+
+        return self._by_puuid.get(puuid)
+
+    def find(self, name: str, tag: Optional[str] = None) -> Optional["LeaderboardPlayer"]:
+        """Get a player by Riot ID, ignoring case.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The player's name, or the full Riot ID as ``name#tag``.
+        tag : Optional[:class:`str`]
+            The player's tag, by default taken from ``name``
+
+        Returns
+        -------
+        Optional[:class:`~valopy.models.LeaderboardPlayer`]
+            The player, or None if no non-anonymized player has this Riot ID.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If no ``tag`` is given and ``name`` is not a full Riot ID.
+        """
+
+        if tag is None:
+            if "#" not in name:
+                raise ValoPyValidationError(
+                    f"No tag given for {name!r}, pass a tag or a Riot ID like 'name#tag'"
+                )
+
+            name, _, tag = name.rpartition("#")
+
+        return self._by_riot_id.get(_riot_id_key(name, tag))
+
+    def search(self, prefix: str, limit: Optional[int] = 10) -> List["LeaderboardPlayer"]:
+        """Find players whose name starts with a prefix, ignoring case.
+
+        Parameters
+        ----------
+        prefix : :class:`str`
+            The start of the name.
+        limit : Optional[:class:`int`]
+            Maximum number of players to return, by default 10, None for all
+
+        Returns
+        -------
+        List[:class:`~valopy.models.LeaderboardPlayer`]
+            The players ordered by name, then by leaderboard rank.
+        """
+
+        prefix = prefix.casefold()
+        start = bisect.bisect_left(self._names, prefix)
+
+        matches = []
+        for position in range(start, len(self._names)):
+            if not self._names[position].startswith(prefix):
+                break
+            if limit is not None and len(matches) >= limit:
+                break
+            matches.append(self._named_players[position])
+
+        return matches
+
+
+def _riot_id_key(name: str, tag: str) -> str:
+    return f"{name}#{tag}".casefold()
+
+
+@dataclass(slots=True)
+class SnapshotEntry:
+    """Compact state of one player in a :class:`LeaderboardSnapshot`.
+
+    Attributes
+    ----------
+    puuid : :class:`str`
+        Player's unique identifier.
+    name : :class:`str`
+        Player's game name.
+    tag : :class:`str`
+        Player's tag.
+    rank : :class:`int`
+        Leaderboard rank.
+    rr : :class:`int`
+        Ranking rating points.
+    tier : :class:`int`
+        Rank tier.
+    wins : :class:`int`
+        Number of wins.
+    """
+
+    puuid: str
+    name: str
+    tag: str
+    rank: int
+    rr: int
+    tier: int
+    wins: int
+
+
+@dataclass(slots=True)
+class RankChange:
+    """Movement of a player between two snapshots.
+
+    Attributes
+    ----------
+    before : :class:`SnapshotEntry`
+        The player in the older snapshot.
+    after : :class:`SnapshotEntry`
+        The player in the newer snapshot.
+    """
+
+    before: SnapshotEntry
+    after: SnapshotEntry
+
+    @property
+    def puuid(self) -> str:
+        """Player's unique identifier."""
+
+        return self.after.puuid
+
+    @property
+    def rank_delta(self) -> int:
+        """Ranks gained, positive when the player climbed."""
+
+        return self.before.rank - self.after.rank
+
+    @property
+    def rr_delta(self) -> int:
+        """Ranking rating points gained."""
+
+        return self.after.rr - self.before.rr
+
+
+@dataclass
+class LeaderboardDiff:
+    """Changes between two leaderboard snapshots.
+
+    Attributes
+    ----------
+    moved : List[:class:`RankChange`]
+        Players whose rank or RR changed, ordered by their new rank.
+    entered : List[:class:`SnapshotEntry`]
+        Players only in the newer snapshot, ordered by rank.
+    dropped : List[:class:`SnapshotEntry`]
+        Players only in the older snapshot, ordered by their old rank.
+    """
+
+    moved: List[RankChange] = field(default_factory=list)
+    entered: List[SnapshotEntry] = field(default_factory=list)
+    dropped: List[SnapshotEntry] = field(default_factory=list)
+
+
+class LeaderboardSnapshot:
+    """Leaderboard state keyed by ``puuid`` for computing rank changes.
+
+    Anonymized players cannot be followed between snapshots. They are
+    counted in :attr:`anonymized` but not stored.
+
+    Attributes
+    ----------
+    updated_at : Optional[:class:`datetime.datetime`]
+        When the API last updated the leaderboard, None if unknown.
+    region : Optional[:class:`str`]
+        The region of the leaderboard.
+    platform : Optional[:class:`str`]
+        The platform of the leaderboard.
+    season : Optional[:class:`str`]
+        The season of the leaderboard, None for the current season.
+    anonymized : :class:`int`
+        Number of anonymized players that were skipped.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[SnapshotEntry],
+        updated_at: Optional[datetime],
+        region: Optional[str] = None,
+        platform: Optional[str] = None,
+        season: Optional[str] = None,
+        anonymized: int = 0,
+    ) -> None:
+        """Initialize the LeaderboardSnapshot.
+
+        Parameters
+        ----------
+        entries : Iterable[:class:`SnapshotEntry`]
+            The players of the leaderboard.
+        updated_at : Optional[:class:`datetime.datetime`]
+            When the API last updated the leaderboard, None if unknown.
+        region : Optional[:class:`str`]
+            The region of the leaderboard, by default None
+        platform : Optional[:class:`str`]
+            The platform of the leaderboard, by default None
+        season : Optional[:class:`str`]
+            The season of the leaderboard, by default None
+        anonymized : :class:`int`, default 0
+            Number of anonymized players that were skipped, by default 0
+        """
+
+        self.updated_at = updated_at
+        self.region = region
+        self.platform = platform
+        self.season = season
+        self.anonymized = anonymized
+
+        self._entries: Dict[str, SnapshotEntry] = {entry.puuid: entry for entry in entries}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, puuid: object) -> bool:
+        return puuid in self._entries
+
+    def __iter__(self) -> Iterator[SnapshotEntry]:
+        return iter(self._entries.values())
+
+    def get(self, puuid: str) -> Optional[SnapshotEntry]:
+        """Get a player by PUUID.
+
+        Parameters
+        ----------
+        puuid : :class:`str`
+            The player's unique identifier.
+
+        Returns
+        -------
+        Optional[:class:`SnapshotEntry`]
+            The player, or None if they are not on the leaderboard.
+        """
+
+        return self._entries.get(puuid)
+
+    @classmethod
+    def from_players(
+        cls,
+        players: Iterable["LeaderboardPlayer"],
+        updated_at: Optional[datetime],
+        region: Optional[str] = None,
+        platform: Optional[str] = None,
+        season: Optional[str] = None,
+    ) -> "LeaderboardSnapshot":
+        """Create a snapshot from leaderboard rows.
+
+        Parameters
+        ----------
+        players : Iterable[:class:`~valopy.models.LeaderboardPlayer`]
+            The rows of one or more leaderboard pages.
+        updated_at : Optional[:class:`datetime.datetime`]
+            When the API last updated the leaderboard, None if unknown.
+        region : Optional[:class:`str`]
+            The region of the leaderboard, by default None
+        platform : Optional[:class:`str`]
+            The platform of the leaderboard, by default None
+        season : Optional[:class:`str`]
+            The season of the leaderboard, by default None
+
+        Returns
+        -------
+        :class:`LeaderboardSnapshot`
+            The snapshot.
+        """
+
+        entries = []
+        anonymized = 0
+        for player in players:
+            if player.is_anonymized or not player.puuid:
+                anonymized += 1
+                continue
+
+            entries.append(
+                SnapshotEntry(
+                    puuid=player.puuid,
+                    name=player.name,
+                    tag=player.tag,
+                    rank=player.leaderboard_rank,
+                    rr=player.rr,
+                    tier=player.tier,
+                    wins=player.wins,
+                )
+            )
+
+        return cls(
+            entries,
+            updated_at=updated_at,
+            region=region,
+            platform=platform,
+            season=season,
+            anonymized=anonymized,
+        )
+
+    @classmethod
+    def from_leaderboard(
+        cls,
+        leaderboard: "Leaderboard",
+        region: Optional["Region"] = None,
+        platform: Optional["Platform"] = None,
+        season: Optional["Season"] = None,
+    ) -> "LeaderboardSnapshot":
+        """Create a snapshot from a single leaderboard page.
+
+        The API response does not name its leaderboard, so pass the region,
+        platform and season it was requested with to keep them, like :meth:`fetch`.
+
+        Parameters
+        ----------
+        leaderboard : :class:`~valopy.models.Leaderboard`
+            The leaderboard page.
+        region : Optional[:class:`~valopy.enums.Region`]
+            The region of the leaderboard, by default None
+        platform : Optional[:class:`~valopy.enums.Platform`]
+            The platform of the leaderboard, by default None
+        season : Optional[:class:`~valopy.enums.Season`]
+            The season of the leaderboard, by default None
+
+        Returns
+        -------
+        :class:`LeaderboardSnapshot`
+            The snapshot.
+        """
+
+        return cls.from_players(
+            leaderboard.players,
+            updated_at=leaderboard.updated_at,
+            region=region.value if region else None,
+            platform=platform.value if platform else None,
+            season=season.value if season else None,
+        )
+
+    @classmethod
+    async def fetch(
+        cls,
+        client: "Client",
+        region: "Region",
+        platform: "Platform",
+        season: Optional["Season"] = None,
+        previous: Optional["LeaderboardSnapshot"] = None,
+        page_size: int = 1000,
+    ) -> "LeaderboardSnapshot":
+        """Fetch a full leaderboard into a snapshot.
+
+        The API updates a leaderboard as a whole, so if the first page has the
+        same known ``updated_at`` as ``previous``, the remaining pages are not
+        fetched and ``previous`` is returned.
+
+        Parameters
+        ----------
+        client : :class:`~valopy.client.Client`
+            The client to fetch the pages with.
+        region : :class:`~valopy.enums.Region`
+            The region of the leaderboard.
+        platform : :class:`~valopy.enums.Platform`
+            The platform of the leaderboard.
+        season : Optional[:class:`~valopy.enums.Season`]
+            The season of the leaderboard, by default the current season
+        previous : Optional[:class:`LeaderboardSnapshot`]
+            The last snapshot of the same leaderboard, by default None
+        page_size : :class:`int`, default 1000
+            Number of players per request, by default 1000
+
+        Returns
+        -------
+        :class:`LeaderboardSnapshot`
+            The new snapshot, or ``previous`` if the leaderboard did not change.
+        """
+
+        pages = client.iter_leaderboard_pages(
+            region=region, platform=platform, season=season, page_size=page_size
+        )
+
+        # The iterator always yields at least the first page
+        first = await anext(pages)
+        if (
+            previous is not None
+            and first.updated_at is not None
+            and previous.updated_at == first.updated_at
+        ):
+            _log.info(
+                "Leaderboard %s/%s unchanged since %s, skipping remaining pages",
+                region.value,
+                platform.value,
+                first.updated_at,
+            )
+            await pages.aclose()  # type: ignore[attr-defined]
+            return previous
+
+        players: List["LeaderboardPlayer"] = list(first.players)
+        async for page in pages:
+            players.extend(page.players)
+
+        _log.info(
+            "Fetched %d leaderboard players for %s/%s", len(players), region.value, platform.value
+        )
+
+        return cls.from_players(
+            players,
+            updated_at=first.updated_at,
+            region=region.value,
+            platform=platform.value,
+            season=season.value if season else None,
+        )
+
+    def diff(self, older: "LeaderboardSnapshot") -> LeaderboardDiff:
+        """Compute the changes since an older snapshot.
+
+        Parameters
+        ----------
+        older : :class:`LeaderboardSnapshot`
+            The snapshot to compare against.
+
+        Returns
+        -------
+        :class:`LeaderboardDiff`
+            Moved players, new entrants and dropouts.
+        """
+
+        result = LeaderboardDiff()
+        older_entries = older._entries
+
+        for puuid, after in self._entries.items():
+            before = older_entries.get(puuid)
+            if before is None:
+                result.entered.append(after)
+            elif before.rank != after.rank or before.rr != after.rr:
+                result.moved.append(RankChange(before=before, after=after))
+
+        result.dropped = [entry for puuid, entry in older_entries.items() if puuid not in self]
+
+        result.moved.sort(key=lambda change: change.after.rank)
+        result.entered.sort(key=lambda entry: entry.rank)
+        result.dropped.sort(key=lambda entry: entry.rank)
+
+        return result
+
+    def to_bytes(self) -> bytes:
+        """Serialize the snapshot compactly.
+
+        Returns
+        -------
+        :class:`bytes`
+            The zlib-compressed snapshot.
+        """
+
+        data = {
+            "version": _SNAPSHOT_VERSION,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "region": self.region,
+            "platform": self.platform,
+            "season": self.season,
+            "anonymized": self.anonymized,
+            # Rows instead of objects avoid repeating the field names per player
+            "players": [
+                [e.puuid, e.name, e.tag, e.rank, e.rr, e.tier, e.wins]
+                for e in self._entries.values()
+            ],
+        }
+
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "LeaderboardSnapshot":
+        """Deserialize a snapshot created with :meth:`to_bytes`.
+
+        Parameters
+        ----------
+        data : :class:`bytes`
+            The serialized snapshot.
+
+        Returns
+        -------
+        :class:`LeaderboardSnapshot`
+            The snapshot.
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If the data was written by an unsupported version.
+        """
+
+        decoded = json.loads(zlib.decompress(data))
+        if decoded.get("version") != _SNAPSHOT_VERSION:
+            raise ValoPyValidationError(f"Unsupported snapshot version: {decoded.get('version')}")
+
+        updated_at = decoded["updated_at"]
+
+        return cls(
+            (SnapshotEntry(*row) for row in decoded["players"]),
+            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+            region=decoded["region"],
+            platform=decoded["platform"],
+            season=decoded["season"],
+            anonymized=decoded["anonymized"],
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the snapshot to a file.
+
+        Parameters
+        ----------
+        path : Union[:class:`str`, :class:`pathlib.Path`]
+            The file to write.
+        """
+
+        Path(path).write_bytes(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LeaderboardSnapshot":
+        """Read a snapshot written with :meth:`save`.
+
+        Parameters
+        ----------
+        path : Union[:class:`str`, :class:`pathlib.Path`]
+            The file to read.
+
+        Returns
+        -------
+        :class:`LeaderboardSnapshot`
+            The snapshot.
+        """
+
+        return cls.from_bytes(Path(path).read_bytes())
@@ -1,6 +1,51 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, TypeVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, TypeVar
+
+if TYPE_CHECKING:
+    from .leaderboard import ThresholdIndex
+
+__all__ = [
+    "ValoPyModel",
+    "Result",
+    "ResultMetadata",
+    "CardData",
+    "AccountV1",
+    "AccountV2",
+    "ContentCharacter",
+    "ContentMap",
+    "ContentItem",
+    "ContentPlayerTitle",
+    "ContentAct",
+    "Content",
+    "Version",
+    "WebsiteContent",
+    "StatusTranslation",
+    "StatusTitle",
+    "StatusUpdate",
+    "StatusEntry",
+    "Status",
+    "QueuePartySize",
+    "QueueHighSkill",
+    "QueueSkillDisparityTier",
+    "QueueSkillDisparity",
+    "QueueGameRules",
+    "QueueMapInfo",
+    "QueueMap",
+    "QueueData",
+    "EsportsLeague",
+    "EsportsTournament",
+    "EsportsGameType",
+    "EsportsTeamRecord",
+    "EsportsTeam",
+    "EsportsMatch",
+    "EsportsEvent",
+    "LeaderboardTier",
+    "LeaderboardThreshold",
+    "LeaderboardPlayer",
+    "Leaderboard",
+]
 
 
 @dataclass
@@ -969,6 +1014,14 @@ class Leaderboard:
     thresholds: List[LeaderboardThreshold] = field(default_factory=list)
     players: List[LeaderboardPlayer] = field(default_factory=list)
 
+    @cached_property
+    def threshold_index(self) -> "ThresholdIndex":
+        """Binary-search index over :attr:`thresholds`, built on first access."""
+
+        from .leaderboard import ThresholdIndex
+
+        return ThresholdIndex(self.thresholds, total=self.results.total if self.results else None)
+
 
 # ======================================== TypeVar ========================================
 
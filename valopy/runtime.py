@@ -0,0 +1,128 @@
+import asyncio
+import importlib.util
+import logging
+import os
+from typing import Any, Coroutine, Dict, Optional, TypeVar
+
+__all__ = [
+    "uvloop_available",
+    "new_event_loop",
+    "run",
+    "connector_options",
+]
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Set to 0 to keep the default asyncio event loop even if uvloop is installed
+_ENV_UVLOOP = "VALOPY_UVLOOP"
+
+
+def uvloop_available() -> bool:
+    """Check whether the uvloop event loop will be used.
+
+    Returns
+    -------
+    :class:`bool`
+        True if uvloop is installed and not disabled with ``VALOPY_UVLOOP=0``.
+    """
+
+    if os.environ.get(_ENV_UVLOOP, "").strip().lower() in ("0", "false", "no", "off"):
+        return False
+
+    return importlib.util.find_spec("uvloop") is not None
+
+
+def new_event_loop(use_uvloop: Optional[bool] = None) -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when available.
+
+    uvloop is imported on first use only, so importing ValoPy stays fast.
+
+    Parameters
+    ----------
+    use_uvloop : Optional[:class:`bool`]
+        Whether to use uvloop, by default if :func:`uvloop_available`
+
+    Returns
+    -------
+    :class:`asyncio.AbstractEventLoop`
+        The new event loop.
+
+    Raises
+    ------
+    :exc:`ImportError`
+        If ``use_uvloop`` is True and uvloop is not installed.
+    """
+
+    if use_uvloop is None:
+        use_uvloop = uvloop_available()
+
+    if not use_uvloop:
+        return asyncio.new_event_loop()
+
+    try:
+        import uvloop
+    except ImportError as e:
+        raise ImportError(
+            "uvloop is required for the uvloop event loop, install it with "
+            "'pip install valopy[speed]'"
+        ) from e
+
+    _log.debug("Creating uvloop event loop")
+
+    return uvloop.new_event_loop()
+
+
+def run(main: Coroutine[Any, Any, T], use_uvloop: Optional[bool] = None) -> T:
+    """Run a coroutine in a new event loop, like :func:`asyncio.run`.
+
+    The loop is created with :func:`new_event_loop`, so scripts get uvloop
+    when it is installed.
+
+    Parameters
+    ----------
+    main : Coroutine
+        The coroutine to run, e.g. the ``main()`` of a script.
+    use_uvloop : Optional[:class:`bool`]
+        Whether to use uvloop, by default if :func:`uvloop_available`
+
+    Returns
+    -------
+    Any
+        The result of the coroutine.
+
+    Examples
+    --------
+    >>> from valopy.runtime import run
+    >>> run(main())
+    """
+
+    with asyncio.Runner(loop_factory=lambda: new_event_loop(use_uvloop)) as runner:
+        return runner.run(main)
+
+
+def connector_options(max_concurrency: Optional[int] = None) -> Dict[str, Any]:
+    """Get the :class:`aiohttp.TCPConnector` options of the default transport.
+
+    The connection pool is sized to the adapter's ``max_concurrency``, so
+    requests wait in the adapter's priority queue instead of aiohttp's
+    unordered connector queue. DNS results are cached for 5 minutes, since
+    all requests go to one host.
+
+    Parameters
+    ----------
+    max_concurrency : Optional[:class:`int`]
+        The adapter's limit of requests in flight, by default None (aiohttp's 100 connections)
+
+    Returns
+    -------
+    Dict[:class:`str`, Any]
+        Keyword arguments for :class:`aiohttp.TCPConnector`.
+    """
+
+    return {
+        "limit": max_concurrency or 100,
+        "ttl_dns_cache": 300,
+        "keepalive_timeout": 30.0,
+    }
@@ -0,0 +1,330 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from .enums import OverloadPolicy, Priority
+from .exceptions import ValoPyOverloadError, ValoPyValidationError
+
+if TYPE_CHECKING:
+    from .keys import KeyPool
+
+__all__ = [
+    "current_priority",
+    "request_priority",
+    "RequestScheduler",
+]
+
+_log = logging.getLogger(__name__)
+
+_current_priority: ContextVar[Priority] = ContextVar("valopy_priority", default=Priority.NORMAL)
+
+
+def current_priority() -> Priority:
+    """Get the request priority of the current context.
+
+    Returns
+    -------
+    :class:`~valopy.enums.Priority`
+        The active priority, :attr:`Priority.NORMAL` by default.
+    """
+
+    return _current_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run all requests made within the block with the given priority.
+
+    The priority is stored in a context variable, so tasks created inside the
+    block inherit it.
+
+    Parameters
+    ----------
+    priority : :class:`~valopy.enums.Priority`
+        The priority to use for requests made within the block.
+    """
+
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class _FairQueue:
+    """FIFO queues per priority class where lower priorities cannot starve.
+
+    A waiting lower priority class is served once it has been passed over
+    ``max_skips`` times in a row.
+    """
+
+    def __init__(self, max_skips: int) -> None:
+        self._queues: dict[Priority, deque[asyncio.Future]] = {
+            priority: deque() for priority in Priority
+        }
+        self._skips: dict[Priority, int] = dict.fromkeys(Priority, 0)
+        self._max_skips = max_skips
+
+    def __len__(self) -> int:
+        return sum(not waiter.done() for queue in self._queues.values() for waiter in queue)
+
+    def push(self, priority: Priority, waiter: asyncio.Future) -> None:
+        self._queues[priority].append(waiter)
+
+    def pop(self) -> Optional[asyncio.Future]:
+        """Pop the next waiter that was not cancelled, or None if there is none."""
+
+        for queue in self._queues.values():
+            while queue and queue[0].done():
+                queue.popleft()
+
+        waiting = [priority for priority in Priority if self._queues[priority]]
+        if not waiting:
+            return None
+
+        # Serve the most starved class if it was skipped too often, otherwise the highest
+        starved = [p for p in reversed(waiting) if self._skips[p] >= self._max_skips]
+        chosen = starved[0] if starved else waiting[0]
+
+        for priority in waiting:
+            self._skips[priority] = 0 if priority == chosen else self._skips[priority] + 1
+
+        return self._queues[chosen].popleft()
+
+
+class RequestScheduler:
+    """Schedules requests by priority over concurrency slots and rate limit tokens.
+
+    Higher priority requests get the next free slot and, when waiting for a
+    rate limit window to reset, the next API key ahead of lower priority ones.
+    Requests of the same priority are served in arrival order.
+
+    With ``max_queue`` set, at most that many requests wait for a slot, so a
+    burst of calls does not pile up unbounded. Further requests wait for room
+    in the queue or fail fast, depending on ``overload``.
+
+    Attributes
+    ----------
+    max_concurrency : Optional[:class:`int`]
+        Maximum number of requests in flight, None for no limit.
+    wait_for_rate_limit : :class:`bool`
+        Whether to wait for a key's rate limit to reset instead of sending
+        a request that would be rejected with 429.
+    max_queue : Optional[:class:`int`]
+        Maximum number of requests waiting for a slot, None for no limit.
+    overload : :class:`~valopy.enums.OverloadPolicy`
+        What happens to requests arriving while the queue is full.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        wait_for_rate_limit: bool = False,
+        max_skips: int = 8,
+        max_queue: Optional[int] = None,
+        overload: OverloadPolicy = OverloadPolicy.WAIT,
+    ) -> None:
+        """Initialize the RequestScheduler.
+
+        Parameters
+        ----------
+        max_concurrency : Optional[:class:`int`]
+            Maximum number of requests in flight, by default None (no limit)
+        wait_for_rate_limit : :class:`bool`, default False
+            Whether to wait until an API key has rate limit headroom, by default False
+        max_skips : :class:`int`, default 8
+            Number of times a waiting lower priority class may be passed over
+            before it is served, by default 8
+        max_queue : Optional[:class:`int`]
+            Maximum number of requests waiting for a slot, requires
+            ``max_concurrency``, by default None (no limit)
+        overload : :class:`~valopy.enums.OverloadPolicy`, default OverloadPolicy.WAIT
+            Whether requests arriving while the queue is full wait for room or
+            raise :exc:`~valopy.exceptions.ValoPyOverloadError`, by default WAIT
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``max_concurrency`` is not positive, ``max_queue`` is negative
+            or ``max_queue`` is set without ``max_concurrency``.
+        """
+
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValoPyValidationError("max_concurrency must be greater than 0")
+
+        if max_queue is not None and (max_queue < 0 or max_concurrency is None):
+            raise ValoPyValidationError(
+                "max_queue must not be negative and requires max_concurrency"
+            )
+
+        self.max_concurrency = max_concurrency
+        self.wait_for_rate_limit = wait_for_rate_limit
+        self.max_queue = max_queue
+        self.overload = OverloadPolicy(overload)
+
+        self._active = 0
+        self._slot_waiters = _FairQueue(max_skips)
+        self._room_waiters: deque[asyncio.Future] = deque()
+        self._token_waiters = _FairQueue(max_skips)
+        self._token_dispatcher: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> int:
+        """Number of requests currently holding a slot."""
+
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of requests waiting for a slot or a rate limit token."""
+
+        return len(self._room_waiters) + len(self._slot_waiters) + len(self._token_waiters)
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> None:
+        """Wait for a concurrency slot.
+
+        Every acquired slot must be given back with :meth:`release`.
+
+        Parameters
+        ----------
+        priority : :class:`~valopy.enums.Priority`
+            The priority of the request, by default :attr:`Priority.NORMAL`
+
+        Raises
+        ------
+        :exc:`~valopy.exceptions.ValoPyOverloadError`
+            If the wait queue is full and ``overload`` is :attr:`OverloadPolicy.REJECT`.
+        """
+
+        if self.max_concurrency is None:
+            self._active += 1
+            return
+
+        waited = False
+        while True:
+            # New arrivals line up behind requests already waiting for room
+            queue_open = waited or not self._room_waiters
+            if queue_open and self._active < self.max_concurrency and not len(self._slot_waiters):
+                self._active += 1
+                return
+
+            if self.max_queue is None or (queue_open and len(self._slot_waiters) < self.max_queue):
+                break
+
+            if self.overload is OverloadPolicy.REJECT:
+                _log.warning("Request queue full, rejecting request")
+                raise ValoPyOverloadError(len(self._slot_waiters), self.max_queue)
+
+            await self._wait_for_room()
+            waited = True
+
+        _log.debug("Waiting for a request slot (priority=%s)", priority.name)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._slot_waiters.push(priority, waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot was handed over right before the cancellation, pass it on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._wake_room_waiter()
+            raise
+
+    async def _wait_for_room(self) -> None:
+        """Wait until a request leaves the full slot queue or a slot frees up."""
+
+        _log.debug("Request queue full, waiting for room")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._room_waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in self._room_waiters:
+                self._room_waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # The room was handed over right before the cancellation, pass it on
+                self._wake_room_waiter()
+            raise
+
+    def _wake_room_waiter(self) -> None:
+        # Waiters cancelled in the same loop step are still queued, skip them
+        while self._room_waiters:
+            waiter = self._room_waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def release(self) -> None:
+        """Give back a concurrency slot, handing it to the next waiter if any."""
+
+        waiter = self._slot_waiters.pop()
+        if waiter is not None:
+            waiter.set_result(None)
+        else:
+            self._active -= 1
+
+        # The queue or a slot has room now
+        self._wake_room_waiter()
+
+    async def acquire_key(self, key_pool: "KeyPool", priority: Priority = Priority.NORMAL) -> str:
+        """Select an API key, waiting for rate limit headroom if enabled.
+
+        Parameters
+        ----------
+        key_pool : :class:`~valopy.keys.KeyPool`
+            The pool to select the key from.
+        priority : :class:`~valopy.enums.Priority`
+            The priority of the request, by default :attr:`Priority.NORMAL`
+
+        Returns
+        -------
+        :class:`str`
+            The selected API key, to be given back with :meth:`KeyPool.release`.
+        """
+
+        if not self.wait_for_rate_limit or (
+            not len(self._token_waiters) and key_pool.retry_after() == 0
+        ):
+            return key_pool.acquire()
+
+        _log.debug("Waiting for rate limit headroom (priority=%s)", priority.name)
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._token_waiters.push(priority, waiter)
+
+        if self._token_dispatcher is None or self._token_dispatcher.done():
+            self._token_dispatcher = asyncio.create_task(self._dispatch_tokens(key_pool))
+
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # The key was handed over right before the cancellation, give it back
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                key_pool.release(waiter.result())
+            raise
+
+    async def _dispatch_tokens(self, key_pool: "KeyPool") -> None:
+        """Hand out keys to waiting requests in priority order as headroom frees up."""
+
+        while len(self._token_waiters):
+            delay = key_pool.retry_after()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            waiter = self._token_waiters.pop()
+            if waiter is None:
+                break
+
+            try:
+                waiter.set_result(key_pool.acquire())
+            except Exception as e:
+                waiter.set_exception(e)
@@ -0,0 +1,259 @@
+import marshal
+import sys
+from dataclasses import fields, is_dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple, get_args, get_origin
+
+from . import models
+from .exceptions import ValoPyValidationError
+
+__all__ = [
+    "to_bytes",
+    "from_bytes",
+]
+
+# Format version, bumped whenever the encoding of a model changes
+_FORMAT_VERSION = 1
+
+# marshal output is only guaranteed to be readable by the same interpreter version
+_HEADER = b"VPY" + bytes([_FORMAT_VERSION, sys.version_info[0], sys.version_info[1]])
+
+# Field kinds of a model schema
+_PLAIN = 0
+_DATETIME = 1
+_MODEL = 2
+_MODEL_LIST = 3
+
+_Schema = List[Tuple[str, int, Any]]
+
+_schemas: Dict[type, _Schema] = {}
+_timezones: Dict[int, timezone] = {0: timezone.utc}
+
+
+def _schema(cls: type) -> _Schema:
+    """Get the field names and kinds of a model in field order, derived once per class."""
+
+    schema = _schemas.get(cls)
+    if schema is not None:
+        return schema
+
+    schema = []
+    for field in fields(cls):
+        field_type = field.type
+        if field_type is datetime:
+            schema.append((field.name, _DATETIME, None))
+        elif is_dataclass(field_type):
+            schema.append((field.name, _MODEL, field_type))
+        elif (
+            get_origin(field_type) is list
+            and (args := get_args(field_type))
+            and is_dataclass(args[0])
+        ):
+            schema.append((field.name, _MODEL_LIST, args[0]))
+        else:
+            schema.append((field.name, _PLAIN, None))
+
+    _schemas[cls] = schema
+    return schema
+
+
+def _encode_datetime(value: datetime) -> Any:
+    # UTC dates, which is what the API returns, become microseconds since the
+    # epoch. Other offsets and naive dates keep their components.
+    offset = value.utcoffset()
+    if offset is not None and not offset:
+        return round(value.timestamp() * 1_000_000)
+
+    return (
+        value.year,
+        value.month,
+        value.day,
+        value.hour,
+        value.minute,
+        value.second,
+        value.microsecond,
+        None if offset is None else int(offset.total_seconds()),
+    )
+
+
+def _decode_datetime(value: Any) -> Any:
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value / 1_000_000, timezone.utc)
+
+    if not isinstance(value, tuple):
+        return value
+
+    offset = value[7]
+    if offset is None:
+        return datetime(*value[:7])
+
+    tz = _timezones.get(offset)
+    if tz is None:
+        tz = _timezones[offset] = timezone(timedelta(seconds=offset))
+
+    return datetime(*value[:7], tzinfo=tz)
+
+
+def _encode_value(kind: int, sub: Any, value: Any) -> Any:
+    # Values that do not match the declared type, e.g. an unparsable date kept
+    # as a string or a missing nested model, are stored as they are
+    if kind == _DATETIME:
+        return _encode_datetime(value) if isinstance(value, datetime) else value
+    if kind == _MODEL:
+        return _encode(value) if isinstance(value, sub) else value
+    if kind == _MODEL_LIST and isinstance(value, list):
+        return _encode_list(sub, value)
+    return value
+
+
+def _decode_value(kind: int, sub: Any, value: Any) -> Any:
+    if kind == _DATETIME:
+        return _decode_datetime(value)
+    if kind == _MODEL:
+        return _decode(sub, value) if isinstance(value, tuple) else value
+    if kind == _MODEL_LIST:
+        return _decode_list(sub, value)
+    return value
+
+
+def _encode(model: Any) -> Tuple[Any, ...]:
+    # A model becomes a tuple of its field values in field order
+    return tuple(
+        _encode_value(kind, sub, getattr(model, name)) for name, kind, sub in _schema(type(model))
+    )
+
+
+def _decode(cls: type, values: Tuple[Any, ...]) -> Any:
+    schema = _schema(cls)
+
+    model = object.__new__(cls)
+    model.__dict__ = {
+        name: value if kind == _PLAIN else _decode_value(kind, sub, value)
+        for (name, kind, sub), value in zip(schema, values)
+    }
+    return model
+
+
+def _encode_list(cls: type, models_: List[Any]) -> Any:
+    if not all(type(model) is cls for model in models_):
+        return [_encode(model) if isinstance(model, cls) else model for model in models_]
+
+    # Lists of models are stored column by column, which keeps each column's
+    # values together and avoids a tuple per model
+    columns = []
+    for name, kind, sub in _schema(cls):
+        column = [getattr(model, name) for model in models_]
+        if kind != _PLAIN:
+            column = [_encode_value(kind, sub, value) for value in column]
+        columns.append(column)
+
+    return (len(models_), *columns)
+
+
+def _decode_list(cls: type, value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(cls, item) if isinstance(item, tuple) else item for item in value]
+
+    if not isinstance(value, tuple):
+        return value
+
+    count, *columns = value
+    if not count:
+        return []
+
+    schema = _schema(cls)
+    names = [name for name, _, _ in schema]
+    for index, (_, kind, sub) in enumerate(schema):
+        if kind != _PLAIN:
+            columns[index] = [_decode_value(kind, sub, item) for item in columns[index]]
+
+    new = object.__new__
+    result = []
+    for row in zip(*columns):
+        model = new(cls)
+        model.__dict__ = dict(zip(names, row))
+        result.append(model)
+
+    return result
+
+
+def to_bytes(data: Any) -> bytes:
+    """Serialize a model or a list of models to compact bytes.
+
+    Models are encoded as tuples in field order without field names, lists of
+    models column by column and dates as integers, then written with
+    :mod:`marshal`. The result
+    is meant for caches and inter-process communication between processes of
+    the same Python version, not for long-term storage.
+
+    Parameters
+    ----------
+    data : Union[:class:`~valopy.models.ValoPyModel`, List[:class:`~valopy.models.ValoPyModel`]]
+        A model, e.g. a :class:`~valopy.models.Leaderboard`, or a list of
+        models of one type as returned by e.g. ``get_website``.
+
+    Returns
+    -------
+    :class:`bytes`
+        The serialized data.
+
+    Raises
+    ------
+    :exc:`ValoPyValidationError`
+        If ``data`` is not a model of :mod:`valopy.models` or a list of them.
+    """
+
+    items = data if isinstance(data, list) else [data]
+    classes = {type(item) for item in items}
+    if len(classes) > 1:
+        raise ValoPyValidationError("All models in a list must have the same type")
+
+    for cls in classes:
+        if getattr(models, cls.__name__, None) is not cls or not is_dataclass(cls):
+            raise ValoPyValidationError(f"Cannot serialize {cls.__name__}, expected a ValoPy model")
+
+    name = items[0].__class__.__name__ if items else ""
+    if isinstance(data, list):
+        payload = (name, True, _encode_list(type(items[0]), data) if items else [])
+    else:
+        payload = (name, False, _encode(data))
+
+    try:
+        return _HEADER + marshal.dumps(payload)
+    except ValueError as e:
+        raise ValoPyValidationError(f"Cannot serialize {name}: {e}") from e
+
+
+def from_bytes(data: bytes) -> Any:
+    """Deserialize a model or a list of models created with :func:`to_bytes`.
+
+    Dates are rebuilt from integers, so no date strings are parsed.
+
+    Parameters
+    ----------
+    data : :class:`bytes`
+        The serialized data.
+
+    Returns
+    -------
+    Union[:class:`~valopy.models.ValoPyModel`, List[:class:`~valopy.models.ValoPyModel`]]
+        The model or list of models.
+
+    Raises
+    ------
+    :exc:`ValoPyValidationError`
+        If the data was not created by :func:`to_bytes` of this format and
+        Python version.
+    """
+
+    if data[: len(_HEADER)] != _HEADER:
+        raise ValoPyValidationError(
+            "Data was not serialized by this ValoPy format or Python version"
+        )
+
+    name, is_list, payload = marshal.loads(data[len(_HEADER) :])
+
+    if is_list:
+        return _decode_list(getattr(models, name), payload) if name else []
+
+    return _decode(getattr(models, name), payload)
@@ -0,0 +1,341 @@
+import asyncio
+import logging
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from .client import Client
+from .enums import CountryCode, EsportsRegion, League, Locale, Platform, Region, Season
+from .runtime import new_event_loop
+
+if TYPE_CHECKING:
+    import types
+
+    from .esports import EsportsSchedule
+    from .models import (
+        AccountV1,
+        AccountV2,
+        Content,
+        EsportsEvent,
+        Leaderboard,
+        QueueData,
+        Status,
+        Version,
+        WebsiteContent,
+    )
+    from .timeouts import RequestTimeout
+
+__all__ = [
+    "SyncClient",
+]
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SyncClient:
+    """Blocking client for scripts, batch jobs and notebooks.
+
+    The client owns one event loop running in a background thread, a uvloop
+    loop if it is installed (see :func:`~valopy.runtime.new_event_loop`), and one
+    :class:`~valopy.client.Client`, so all calls share a pooled session with
+    keep-alive connections. Every method of :class:`~valopy.client.Client`
+    has a blocking counterpart, and :meth:`batch` runs many calls concurrently.
+
+    Attributes
+    ----------
+    client : :class:`~valopy.client.Client`
+        The async client running on the background loop.
+    """
+
+    def __init__(
+        self,
+        api_key: Union[str, Sequence[str]],
+        redact_header: bool = True,
+        **adapter_options: Any,
+    ) -> None:
+        """Initialize the SyncClient and start its event loop thread.
+
+        Parameters
+        ----------
+        api_key : Union[:class:`str`, Sequence[:class:`str`]]
+            The API key used for authentication, or several keys to spread requests over.
+        redact_header : :class:`bool`, default True
+            Whether to redact the API key in logs, by default True
+        **adapter_options : :class:`Any`
+            Additional options forwarded to :class:`~valopy.adapter.Adapter`.
+        """
+
+        self.client = Client(api_key=api_key, redact_header=redact_header, **adapter_options)
+
+        self._loop = new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="valopy-sync-client", daemon=True
+        )
+        self._thread.start()
+
+        _log.info("Started SyncClient event loop thread")
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop and wait for its result.
+
+        Raises
+        ------
+        :exc:`RuntimeError`
+            If the client is closed or the call is made from the loop thread itself.
+        """
+
+        if self._loop.is_closed():
+            coro.close()
+            raise RuntimeError("SyncClient is closed")
+
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("SyncClient cannot be called from its own event loop")
+
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self) -> None:
+        """Close the session and stop the event loop thread."""
+
+        if self._loop.is_closed():
+            _log.debug("SyncClient already closed")
+            return
+
+        _log.info("Closing SyncClient")
+
+        self._run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncClient":
+        """Context manager entry.
+
+        Returns
+        -------
+        :class:`SyncClient`
+            The client instance.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: "Optional[type[BaseException]]",
+        exc_val: "Optional[BaseException]",
+        exc_tb: "Optional[types.TracebackType]",
+    ) -> None:
+        """Context manager exit, closing the client."""
+
+        self.close()
+
+    def batch(
+        self,
+        method: str,
+        calls: Iterable[Mapping[str, Any]],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run many calls of one client method concurrently.
+
+        The calls share the client's session and are limited by the adapter's
+        ``max_concurrency`` and rate limit settings.
+
+        Parameters
+        ----------
+        method : :class:`str`
+            Name of the :class:`~valopy.client.Client` method, e.g. ``"get_account_v1"``.
+        calls : Iterable[Mapping[:class:`str`, Any]]
+            Keyword arguments of each call.
+        return_exceptions : :class:`bool`, default False
+            Whether to return errors in place of results instead of raising
+            the first one, by default False
+
+        Returns
+        -------
+        List[Any]
+            The results in the order of ``calls``.
+
+        Examples
+        --------
+        >>> client.batch("get_account_v1", [{"name": "a", "tag": "1"}, {"name": "b", "tag": "2"}])
+        """
+
+        function = getattr(self.client, method)
+
+        async def run_all() -> List[Any]:
+            return await asyncio.gather(
+                *(function(**kwargs) for kwargs in calls), return_exceptions=return_exceptions
+            )
+
+        return self._run(run_all())
+
+    def get_account_v1(
+        self,
+        name: str,
+        tag: str,
+        force_update: bool = False,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> "AccountV1":
+        """Blocking version of :meth:`~valopy.client.Client.get_account_v1`."""
+
+        return self._run(self.client.get_account_v1(name, tag, force_update, timeout=timeout))
+
+    def get_account_v1_by_puuid(
+        self, puuid: str, force_update: bool = False, timeout: Optional["RequestTimeout"] = None
+    ) -> "AccountV1":
+        """Blocking version of :meth:`~valopy.client.Client.get_account_v1_by_puuid`."""
+
+        return self._run(self.client.get_account_v1_by_puuid(puuid, force_update, timeout=timeout))
+
+    def get_account_v2(
+        self,
+        name: str,
+        tag: str,
+        force_update: bool = False,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> "AccountV2":
+        """Blocking version of :meth:`~valopy.client.Client.get_account_v2`."""
+
+        return self._run(self.client.get_account_v2(name, tag, force_update, timeout=timeout))
+
+    def get_account_v2_by_puuid(
+        self, puuid: str, force_update: bool = False, timeout: Optional["RequestTimeout"] = None
+    ) -> "AccountV2":
+        """Blocking version of :meth:`~valopy.client.Client.get_account_v2_by_puuid`."""
+
+        return self._run(self.client.get_account_v2_by_puuid(puuid, force_update, timeout=timeout))
+
+    def get_content(
+        self, locale: Optional[Locale] = None, timeout: Optional["RequestTimeout"] = None
+    ) -> "Content":
+        """Blocking version of :meth:`~valopy.client.Client.get_content`."""
+
+        return self._run(self.client.get_content(locale, timeout=timeout))
+
+    def get_version(
+        self, region: Optional[Region] = Region.EU, timeout: Optional["RequestTimeout"] = None
+    ) -> "Version":
+        """Blocking version of :meth:`~valopy.client.Client.get_version`."""
+
+        return self._run(self.client.get_version(region, timeout=timeout))
+
+    def get_website(
+        self, countrycode: CountryCode, timeout: Optional["RequestTimeout"] = None
+    ) -> list["WebsiteContent"]:
+        """Blocking version of :meth:`~valopy.client.Client.get_website`."""
+
+        return self._run(self.client.get_website(countrycode, timeout=timeout))
+
+    def get_status(self, region: Region, timeout: Optional["RequestTimeout"] = None) -> "Status":
+        """Blocking version of :meth:`~valopy.client.Client.get_status`."""
+
+        return self._run(self.client.get_status(region, timeout=timeout))
+
+    def get_queue_status(
+        self, region: Region, timeout: Optional["RequestTimeout"] = None
+    ) -> list["QueueData"]:
+        """Blocking version of :meth:`~valopy.client.Client.get_queue_status`."""
+
+        return self._run(self.client.get_queue_status(region, timeout=timeout))
+
+    def get_esports_schedule(
+        self,
+        region: Optional[EsportsRegion] = None,
+        league: Optional[League] = None,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> list["EsportsEvent"]:
+        """Blocking version of :meth:`~valopy.client.Client.get_esports_schedule`."""
+
+        return self._run(self.client.get_esports_schedule(region, league, timeout=timeout))
+
+    def get_esports_schedules(
+        self,
+        leagues: Optional[Iterable[League]] = None,
+        regions: Optional[Iterable[EsportsRegion]] = None,
+        max_concurrency: int = 8,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> "EsportsSchedule":
+        """Blocking version of :meth:`~valopy.client.Client.get_esports_schedules`."""
+
+        return self._run(
+            self.client.get_esports_schedules(leagues, regions, max_concurrency, timeout=timeout)
+        )
+
+    def get_leaderboard(
+        self,
+        region: Region,
+        platform: Platform,
+        season: Optional[Season] = None,
+        puuid: Optional[str] = None,
+        name: Optional[str] = None,
+        tag: Optional[str] = None,
+        size: Optional[int] = None,
+        start_index: Optional[int] = None,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> "Leaderboard":
+        """Blocking version of :meth:`~valopy.client.Client.get_leaderboard`."""
+
+        return self._run(
+            self.client.get_leaderboard(
+                region=region,
+                platform=platform,
+                season=season,
+                puuid=puuid,
+                name=name,
+                tag=tag,
+                size=size,
+                start_index=start_index,
+                timeout=timeout,
+            )
+        )
+
+    def iter_leaderboard_pages(
+        self,
+        region: Region,
+        platform: Platform,
+        season: Optional[Season] = None,
+        page_size: int = 1000,
+        start_index: int = 0,
+        timeout: Optional["RequestTimeout"] = None,
+    ) -> Iterator["Leaderboard"]:
+        """Blocking version of :meth:`~valopy.client.Client.iter_leaderboard_pages`."""
+
+        pages = self.client.iter_leaderboard_pages(
+            region=region,
+            platform=platform,
+            season=season,
+            page_size=page_size,
+            start_index=start_index,
+            timeout=timeout,
+        )
+
+        try:
+            while True:
+                try:
+                    yield self._run(_next(pages))
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._loop.is_closed():
+                self._run(pages.aclose())
+
+
+async def _next(iterator: AsyncIterator[T]) -> T:
+    return await iterator.__anext__()
@@ -0,0 +1,450 @@
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from aiohttp import web
+
+from .enums import Endpoint
+from .exceptions import ValoPyValidationError
+
+__all__ = [
+    "FakeAPIConfig",
+    "FakeAPIServer",
+]
+
+_log = logging.getLogger(__name__)
+
+_FIXTURE_FILES = (
+    "account",
+    "content",
+    "esports",
+    "leaderboard",
+    "queue",
+    "status",
+    "version",
+    "website",
+)
+
+
+@dataclass
+class FakeAPIConfig:
+    """Behaviour of a :class:`FakeAPIServer`.
+
+    Attributes
+    ----------
+    latency : :class:`float`
+        Seconds every response is delayed by.
+    jitter : :class:`float`
+        Maximum random seconds added to ``latency``.
+    error_rate : :class:`float`
+        Probability of answering with ``error_status`` (0 to 1).
+    error_status : :class:`int`
+        The status code of injected server errors.
+    slow_body_rate : :class:`float`
+        Probability of sending the body in chunks spread over ``slow_body_time`` (0 to 1).
+    slow_body_time : :class:`float`
+        Seconds a slow body takes to send.
+    rate_limit : Optional[:class:`int`]
+        Requests allowed per API key and window, None for no rate limit.
+    rate_window : :class:`float`
+        Length of a rate limit window in seconds.
+    leaderboard_size : :class:`int`
+        Number of players in the synthesized leaderboards.
+    content_scale : :class:`int`
+        Number of copies of every content item, to produce large content payloads.
+    seed : Optional[:class:`int`]
+        Seed of the random fault injection.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    slow_body_rate: float = 0.0
+    slow_body_time: float = 1.0
+    rate_limit: Optional[int] = None
+    rate_window: float = 60.0
+    leaderboard_size: int = 15000
+    content_scale: int = 1
+    seed: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.error_rate <= 1 or not 0 <= self.slow_body_rate <= 1:
+            raise ValoPyValidationError("error_rate and slow_body_rate must be between 0 and 1")
+
+        if self.leaderboard_size < 0 or self.content_scale < 1:
+            raise ValoPyValidationError(
+                "leaderboard_size must not be negative and content_scale must be at least 1"
+            )
+
+
+class FakeAPIServer:
+    """Local stand-in for the HenrikDev API for load and soak tests.
+
+    Serves every :class:`~valopy.enums.Endpoint` from the fixture JSON files,
+    synthesizes leaderboards of any size, emulates ``x-ratelimit-*`` headers and
+    429 responses, and injects latency, server errors and slow bodies.
+    Point ``Adapter.api_url`` at :attr:`url`.
+
+    Attributes
+    ----------
+    config : :class:`FakeAPIConfig`
+        The behaviour of the server, may be changed while it runs.
+    requests : :class:`int`
+        Number of requests received.
+    app : :class:`aiohttp.web.Application`
+        The served application.
+    """
+
+    def __init__(
+        self,
+        fixtures: Union[str, Path],
+        config: Optional[FakeAPIConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Initialize the FakeAPIServer.
+
+        Parameters
+        ----------
+        fixtures : Union[:class:`str`, :class:`pathlib.Path`]
+            Directory with the fixture JSON files, e.g. ``tests/mock``.
+        config : Optional[:class:`FakeAPIConfig`]
+            The behaviour of the server, by default no faults and no rate limit
+        host : :class:`str`, default "127.0.0.1"
+            The host to listen on, by default "127.0.0.1"
+        port : :class:`int`, default 0
+            The port to listen on, by default 0 (a free port)
+        """
+
+        self.config = config or FakeAPIConfig()
+        self.requests = 0
+
+        self._host = host
+        self._port = port
+        self._fixtures = {
+            name: json.loads((Path(fixtures) / f"{name}.json").read_text(encoding="utf-8"))
+            for name in _FIXTURE_FILES
+        }
+        self._random = random.Random(self.config.seed)
+        self._windows: Dict[str, tuple[float, int]] = {}
+        self._content: Optional[bytes] = None
+        self._pages: Dict[tuple, bytes] = {}
+        self._puuid_ranks: Dict[str, int] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._site: Optional[web.TCPSite] = None
+
+        self.app = web.Application(middlewares=[self._faults])
+        self._add_routes()
+
+    @property
+    def url(self) -> str:
+        """The base URL to use as ``Adapter.api_url``."""
+
+        if self._runner is None:
+            raise RuntimeError("FakeAPIServer is not running")
+
+        host, port = self._runner.addresses[0][:2]  # type: ignore[union-attr]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> str:
+        """Start serving.
+
+        Returns
+        -------
+        :class:`str`
+            The base URL to use as ``Adapter.api_url``.
+        """
+
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, self._host, self._port)
+        await self._site.start()
+
+        _log.info("Fake API serving at %s", self.url)
+        return self.url
+
+    async def close(self) -> None:
+        """Stop serving."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._site = None
+
+    async def __aenter__(self) -> "FakeAPIServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def _add_routes(self) -> None:
+        handlers = {
+            Endpoint.ACCOUNT_BY_NAME_V1: self._account_v1,
+            Endpoint.ACCOUNT_BY_PUUID_V1: self._account_v1,
+            Endpoint.ACCOUNT_BY_NAME_V2: self._account_v2,
+            Endpoint.ACCOUNT_BY_PUUID_V2: self._account_v2,
+            Endpoint.CONTENT_V1: self._content_v1,
+            Endpoint.VERSION_V1: self._version,
+            Endpoint.WEBSITE: self._website,
+            Endpoint.STATUS: self._status,
+            Endpoint.QUEUE_STATUS: self._queue_status,
+            Endpoint.ESPORTS_SCHEDULE: self._esports_schedule,
+            Endpoint.LEADERBOARD_V3: self._leaderboard,
+        }
+
+        for endpoint in Endpoint:
+            self.app.router.add_get(endpoint.url, handlers[endpoint])
+
+    def _rate_limit(self, key: str, limit: int) -> tuple[bool, Dict[str, str]]:
+        """Count a request against the key's fixed window.
+
+        Returns whether the request is allowed and the rate limit headers.
+        """
+
+        now = time.monotonic()
+        started, count = self._windows.get(key, (now, 0))
+        if now - started >= self.config.rate_window:
+            started, count = now, 0
+
+        count += 1
+        self._windows[key] = (started, count)
+        reset = self.config.rate_window - (now - started)
+
+        return count <= limit, {
+            "x-ratelimit-limit": str(limit),
+            "x-ratelimit-remaining": str(max(limit - count, 0)),
+            "x-ratelimit-reset": str(int(reset) + 1),
+        }
+
+    @web.middleware
+    async def _faults(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.requests += 1
+        config = self.config
+
+        headers: Dict[str, str] = {}
+        if config.rate_limit is not None:
+            key = request.headers.get("Authorization", "")
+            allowed, headers = self._rate_limit(key, config.rate_limit)
+            if not allowed:
+                return web.json_response(
+                    {"errors": [{"message": "Rate limit exceeded", "status": 429}]},
+                    status=429,
+                    headers=headers,
+                )
+
+        delay = config.latency + (self._random.uniform(0, config.jitter) if config.jitter else 0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if config.error_rate and self._random.random() < config.error_rate:
+            return web.json_response(
+                {"errors": [{"message": "Injected error", "status": config.error_status}]},
+                status=config.error_status,
+                headers=headers,
+            )
+
+        response = await handler(request)
+        response.headers.update(headers)
+
+        if config.slow_body_rate and self._random.random() < config.slow_body_rate:
+            return await self._slow_body(request, response)
+
+        return response
+
+    async def _slow_body(self, request: web.Request, response: web.Response) -> web.StreamResponse:
+        """Send a response body in ten chunks spread over ``slow_body_time``."""
+
+        body = response.body if isinstance(response.body, bytes) else b""
+        stream = web.StreamResponse(status=response.status, headers=response.headers)
+        stream.content_length = len(body)
+        await stream.prepare(request)
+
+        chunk_size = max(len(body) // 10, 1)
+        for start in range(0, len(body), chunk_size):
+            await stream.write(body[start : start + chunk_size])
+            await asyncio.sleep(self.config.slow_body_time / 10)
+
+        await stream.write_eof()
+        return stream
+
+    @staticmethod
+    def _ok(data: Any, **extra: Any) -> web.Response:
+        return web.json_response({"status": 200, "data": data, **extra})
+
+    async def _account_v1(self, request: web.Request) -> web.Response:
+        account = dict(self._fixtures["account"]["v1"])
+        account.update(request.match_info)
+        return self._ok(account)
+
+    async def _account_v2(self, request: web.Request) -> web.Response:
+        account = dict(self._fixtures["account"]["v2"])
+        account.update(request.match_info)
+        return self._ok(account)
+
+    async def _content_v1(self, request: web.Request) -> web.Response:
+        # Build the scaled payload once, it does not depend on the request
+        if self._content is None:
+            content = copy.deepcopy(self._fixtures["content"])
+            for items in content.values():
+                if isinstance(items, list):
+                    items[:] = [
+                        {**item, "id": f"{item.get('id')}-{copy_index}"}
+                        for copy_index in range(self.config.content_scale)
+                        for item in items
+                    ]
+            self._content = json.dumps({"status": 200, "data": content}).encode("utf-8")
+
+        return web.Response(body=self._content, content_type="application/json")
+
+    async def _version(self, request: web.Request) -> web.Response:
+        return self._ok({**self._fixtures["version"], "region": request.match_info["region"]})
+
+    async def _website(self, request: web.Request) -> web.Response:
+        return self._ok(self._fixtures["website"]["contents"])
+
+    async def _status(self, request: web.Request) -> web.Response:
+        return self._ok(self._fixtures["status"])
+
+    async def _queue_status(self, request: web.Request) -> web.Response:
+        return self._ok(self._fixtures["queue"]["queues"])
+
+    async def _esports_schedule(self, request: web.Request) -> web.Response:
+        return self._ok(self._fixtures["esports"]["esports_events"])
+
+    def _synthetic_player(self, rank: int, thresholds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the leaderboard row of a rank, consistent with the fixture thresholds."""
+
+        # Thresholds are sorted by descending start index, the first one reached is the tier
+        threshold = next(t for t in thresholds if t["start_index"] <= rank)
+        next_start = min(
+            (t["start_index"] for t in thresholds if t["start_index"] > threshold["start_index"]),
+            default=self.config.leaderboard_size + 1,
+        )
+
+        # Spread the rr of the tier linearly from its next threshold down to its own
+        above = [t["threshold"] for t in thresholds if t["start_index"] < threshold["start_index"]]
+        ceiling = min(above, default=threshold["threshold"] + 500)
+        span = max(next_start - threshold["start_index"], 1)
+        position = (rank - threshold["start_index"]) / span
+        rr = int(ceiling - (ceiling - threshold["threshold"]) * position)
+
+        player = dict(self._fixtures["leaderboard"]["players"][0])
+        player.update(
+            puuid=str(uuid.uuid5(uuid.NAMESPACE_OID, f"valopy-player-{rank}")),
+            name=f"Player{rank}",
+            tag=f"{rank % 10000:04d}",
+            leaderboard_rank=rank,
+            tier=threshold["tier"]["id"],
+            rr=max(rr, threshold["threshold"]),
+        )
+        return player
+
+    def _leaderboard_page(self, players: List[Dict[str, Any]], before: int) -> bytes:
+        fixture = self._fixtures["leaderboard"]
+        total = self.config.leaderboard_size
+
+        data = {
+            "updated_at": fixture["updated_at"],
+            "thresholds": fixture["thresholds"],
+            "players": players,
+        }
+        results = {
+            "total": total,
+            "returned": len(players),
+            "before": before,
+            "after": max(total - before - len(players), 0),
+        }
+
+        return json.dumps({"status": 200, "data": data, "results": results}).encode("utf-8")
+
+    async def _leaderboard(self, request: web.Request) -> web.Response:
+        total = self.config.leaderboard_size
+        thresholds = sorted(
+            self._fixtures["leaderboard"]["thresholds"], key=lambda t: -t["start_index"]
+        )
+        query = request.query
+
+        if "puuid" in query or "name" in query:
+            if len(self._puuid_ranks) != total:
+                self._puuid_ranks = {
+                    str(uuid.uuid5(uuid.NAMESPACE_OID, f"valopy-player-{rank}")): rank
+                    for rank in range(1, total + 1)
+                }
+
+            name = query.get("name", "")
+            rank = self._puuid_ranks.get(query.get("puuid", ""))
+            if rank is None and name.startswith("Player") and name[6:].isdigit():
+                rank = int(name[6:])
+
+            players = []
+            if rank is not None and 1 <= rank <= total:
+                player = self._synthetic_player(rank, thresholds)
+                if "puuid" in query or player["tag"] == query.get("tag"):
+                    players.append(player)
+
+            body = self._leaderboard_page(players, before=0)
+
+        else:
+            size = min(int(query.get("size", 1000)), 1000)
+            before = min(int(query.get("start_index", 0)), total)
+
+            # Synthesizing a page is costly, serve repeated pages from memory
+            page_key = (total, before, size)
+            body = self._pages.get(page_key)
+            if body is None:
+                players = [
+                    self._synthetic_player(rank, thresholds)
+                    for rank in range(before + 1, min(before + size, total) + 1)
+                ]
+                body = self._pages[page_key] = self._leaderboard_page(players, before)
+
+        return web.Response(body=body, content_type="application/json")
+
+
+def main() -> None:
+    """Run a stand-in API server from the command line."""
+
+    parser = argparse.ArgumentParser(description="Serve a stand-in HenrikDev API.")
+    parser.add_argument("fixtures", help="directory with the fixture JSON files")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--slow-body-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=None)
+    parser.add_argument("--leaderboard-size", type=int, default=15000)
+    parser.add_argument("--content-scale", type=int, default=1)
+    args = parser.parse_args()
+
+    config = FakeAPIConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        slow_body_rate=args.slow_body_rate,
+        rate_limit=args.rate_limit,
+        leaderboard_size=args.leaderboard_size,
+        content_scale=args.content_scale,
+    )
+    server = FakeAPIServer(args.fixtures, config=config, host=args.host, port=args.port)
+
+    async def serve() -> None:
+        async with server:
+            print(f"Serving stand-in API at {server.url}")
+            await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import aiohttp
+
+__all__ = [
+    "RequestTimeout",
+    "remaining_time",
+    "deadline",
+]
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar("valopy_deadline", default=None)
+
+
+@dataclass(frozen=True)
+class RequestTimeout:
+    """Timeouts of a single HTTP request.
+
+    Attributes
+    ----------
+    connect : Optional[:class:`float`]
+        Seconds to establish a connection, including TLS.
+    first_byte : Optional[:class:`float`]
+        Seconds to wait for the response, and between reads of its body.
+    total : Optional[:class:`float`]
+        Seconds for the whole request including reading the body.
+    """
+
+    connect: Optional[float] = None
+    first_byte: Optional[float] = None
+    total: Optional[float] = None
+
+    def to_client_timeout(self) -> aiohttp.ClientTimeout:
+        """Convert to an aiohttp timeout.
+
+        Returns
+        -------
+        :class:`aiohttp.ClientTimeout`
+            The equivalent aiohttp timeout.
+        """
+
+        return aiohttp.ClientTimeout(
+            total=self.total, sock_connect=self.connect, sock_read=self.first_byte
+        )
+
+
+def remaining_time() -> Optional[float]:
+    """Get the time left until the deadline of the current context.
+
+    Returns
+    -------
+    Optional[:class:`float`]
+        Seconds until the deadline, which may be negative once it passed,
+        or None if no deadline is set.
+    """
+
+    deadline_at = _current_deadline.get()
+    if deadline_at is None:
+        return None
+
+    return deadline_at - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Bound the total time of all requests made within the block.
+
+    Requests still queued or in flight when the deadline passes are cancelled
+    and raise :exc:`~valopy.exceptions.ValoPyClientTimeoutError`. The deadline
+    is stored in a context variable, so tasks created inside the block, e.g. by
+    :func:`asyncio.gather`, share it. Nested deadlines can only shorten it.
+
+    Parameters
+    ----------
+    seconds : :class:`float`
+        The time budget in seconds.
+    """
+
+    deadline_at = time.monotonic() + seconds
+
+    outer = _current_deadline.get()
+    if outer is not None:
+        deadline_at = min(deadline_at, outer)
+
+    token = _current_deadline.set(deadline_at)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,419 @@
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from .enums import Endpoint
+
+
+__all__ = [
+    "TIMING_METRICS",
+    "RequestTrace",
+    "TraceHook",
+    "create_trace_config",
+    "HistogramSnapshot",
+    "Histogram",
+    "LatencyCollector",
+]
+
+TIMING_METRICS = ("queued", "dns", "connect", "first_byte", "total", "decode", "model")
+
+
+@dataclass
+class RequestTrace:
+    """Timings and sizes of a single API call.
+
+    All timings are in seconds and None if the phase did not happen, e.g.
+    ``dns`` and ``connect`` when a pooled connection was reused.
+
+    Attributes
+    ----------
+    method : :class:`str`
+        The HTTP method of the request.
+    endpoint_path : :class:`str`
+        The formatted API endpoint path.
+    endpoint : Optional[:class:`~valopy.enums.Endpoint`]
+        The endpoint being called, if known.
+    status_code : Optional[:class:`int`]
+        The HTTP status code of the response.
+    queued : Optional[:class:`float`]
+        Time spent waiting for a request slot and an API key.
+    dns : Optional[:class:`float`]
+        Time spent resolving the host name.
+    connect : Optional[:class:`float`]
+        Time spent establishing the connection, including the TLS handshake.
+    first_byte : Optional[:class:`float`]
+        Time from sending the request until the response headers arrived.
+    total : Optional[:class:`float`]
+        Time from sending the request until the body was read.
+    response_bytes : :class:`int`
+        Size of the response body.
+    decode : Optional[:class:`float`]
+        Time spent decoding the JSON body.
+    model : Optional[:class:`float`]
+        Time spent in :func:`~valopy.utils.dict_to_dataclass`.
+    error : Optional[:class:`BaseException`]
+        The error raised by the call, if any.
+    started : :class:`float`
+        :func:`time.perf_counter` value when the call started.
+    """
+
+    method: str
+    endpoint_path: str
+    endpoint: Optional["Endpoint"] = None
+    status_code: Optional[int] = None
+    queued: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    first_byte: Optional[float] = None
+    total: Optional[float] = None
+    response_bytes: int = 0
+    decode: Optional[float] = None
+    model: Optional[float] = None
+    error: Optional[BaseException] = None
+
+    started: float = field(default_factory=time.perf_counter, repr=False)
+
+    _marks: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    @property
+    def name(self) -> str:
+        """The endpoint name, or the endpoint path if the endpoint is unknown."""
+
+        return self.endpoint.name if self.endpoint else self.endpoint_path
+
+    def mark(self, phase: str) -> None:
+        """Remember the current time as the start of a phase.
+
+        Parameters
+        ----------
+        phase : :class:`str`
+            The name of the phase.
+        """
+
+        self._marks[phase] = time.perf_counter()
+
+    def elapsed(self, phase: str, until: Optional[float] = None) -> Optional[float]:
+        """Get the time since a phase was marked.
+
+        Parameters
+        ----------
+        phase : :class:`str`
+            The name of the phase.
+        until : Optional[:class:`float`]
+            :func:`time.perf_counter` value to measure until, by default now
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The elapsed seconds, None if the phase was never marked.
+        """
+
+        started = self._marks.get(phase)
+        if started is None:
+            return None
+
+        return (time.perf_counter() if until is None else until) - started
+
+
+TraceHook = Callable[[RequestTrace], None]
+
+
+def _trace_of(context: "SimpleNamespace") -> Optional[RequestTrace]:
+    trace = context.trace_request_ctx
+    return trace if isinstance(trace, RequestTrace) else None
+
+
+async def _on_dns_start(
+    session: aiohttp.ClientSession, context: "SimpleNamespace", params: object
+) -> None:
+    trace = _trace_of(context)
+    if trace is not None:
+        trace.mark("dns")
+
+
+async def _on_dns_end(
+    session: aiohttp.ClientSession, context: "SimpleNamespace", params: object
+) -> None:
+    trace = _trace_of(context)
+    if trace is not None:
+        trace.dns = trace.elapsed("dns")
+
+
+async def _on_connection_start(
+    session: aiohttp.ClientSession, context: "SimpleNamespace", params: object
+) -> None:
+    trace = _trace_of(context)
+    if trace is not None:
+        trace.mark("connect")
+
+
+async def _on_connection_end(
+    session: aiohttp.ClientSession, context: "SimpleNamespace", params: object
+) -> None:
+    trace = _trace_of(context)
+    if trace is not None:
+        trace.connect = trace.elapsed("connect")
+
+
+async def _on_request_end(
+    session: aiohttp.ClientSession, context: "SimpleNamespace", params: object
+) -> None:
+    trace = _trace_of(context)
+    if trace is not None:
+        trace.first_byte = trace.elapsed("request")
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Create an aiohttp trace config filling in the network timings of a :class:`RequestTrace`.
+
+    The trace must be passed as ``trace_request_ctx`` to the request, and its
+    ``request`` phase marked with :meth:`RequestTrace.mark` before sending it.
+
+    Returns
+    -------
+    :class:`aiohttp.TraceConfig`
+        The trace config to add to a :class:`aiohttp.ClientSession`.
+    """
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_dns_resolvehost_start.append(_on_dns_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+    trace_config.on_connection_create_start.append(_on_connection_start)
+    trace_config.on_connection_create_end.append(_on_connection_end)
+    trace_config.on_request_end.append(_on_request_end)
+
+    return trace_config
+
+
+@dataclass
+class HistogramSnapshot:
+    """Summary of the recorded values of one metric.
+
+    Quantiles are estimated from the histogram buckets and are accurate to
+    within one bucket (about 12%).
+
+    Attributes
+    ----------
+    count : :class:`int`
+        Number of recorded values.
+    mean : :class:`float`
+        Mean of the recorded values.
+    min : :class:`float`
+        Smallest recorded value.
+    max : :class:`float`
+        Largest recorded value.
+    p50 : :class:`float`
+        Estimated median.
+    p90 : :class:`float`
+        Estimated 90th percentile.
+    p99 : :class:`float`
+        Estimated 99th percentile.
+    """
+
+    count: int
+    mean: float
+    min: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+
+
+class Histogram:
+    """Histogram with logarithmic buckets.
+
+    Attributes
+    ----------
+    bounds : List[:class:`float`]
+        Upper bounds of the buckets.
+    """
+
+    def __init__(self, bounds: List[float]) -> None:
+        """Initialize the Histogram.
+
+        Parameters
+        ----------
+        bounds : List[:class:`float`]
+            Sorted upper bounds of the buckets. Larger values go to an overflow bucket.
+        """
+
+        self.bounds = bounds
+
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = float("inf")
+        self._max = float("-inf")
+
+    @classmethod
+    def exponential(cls, start: float, factor: float, count: int) -> "Histogram":
+        """Create a histogram with exponentially growing buckets.
+
+        Parameters
+        ----------
+        start : :class:`float`
+            Upper bound of the first bucket.
+        factor : :class:`float`
+            Growth factor between consecutive bounds.
+        count : :class:`int`
+            Number of buckets.
+
+        Returns
+        -------
+        :class:`Histogram`
+            The empty histogram.
+        """
+
+        return cls([start * factor**i for i in range(count)])
+
+    def record(self, value: float) -> None:
+        """Record a value.
+
+        Parameters
+        ----------
+        value : :class:`float`
+            The value to record.
+        """
+
+        self._counts[bisect_left(self.bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket containing it.
+
+        Parameters
+        ----------
+        q : :class:`float`
+            The quantile between 0 and 1.
+
+        Returns
+        -------
+        :class:`float`
+            The estimated quantile, clamped to the recorded minimum and maximum.
+        """
+
+        if not self._count:
+            return 0.0
+
+        rank = q * self._count
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = self.bounds[index] if index < len(self.bounds) else self._max
+                return min(max(bound, self._min), self._max)
+
+        return self._max
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Summarize the recorded values.
+
+        Returns
+        -------
+        :class:`HistogramSnapshot`
+            The summary.
+        """
+
+        if not self._count:
+            return HistogramSnapshot(count=0, mean=0.0, min=0.0, max=0.0, p50=0.0, p90=0.0, p99=0.0)
+
+        return HistogramSnapshot(
+            count=self._count,
+            mean=self._sum / self._count,
+            min=self._min,
+            max=self._max,
+            p50=self.quantile(0.5),
+            p90=self.quantile(0.9),
+            p99=self.quantile(0.99),
+        )
+
+
+class LatencyCollector:
+    """In-memory trace hook keeping histograms per endpoint and metric.
+
+    Timing metrics are ``queued``, ``dns``, ``connect``, ``first_byte``,
+    ``total``, ``decode`` and ``model`` in seconds; ``response_bytes`` is
+    recorded in bytes. Add an instance to ``Adapter(trace_hooks=[...])``.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the LatencyCollector."""
+
+        self._histograms: Dict[str, Dict[str, Histogram]] = {}
+        self._errors: Dict[str, int] = {}
+
+    def __call__(self, trace: RequestTrace) -> None:
+        """Record a trace.
+
+        Parameters
+        ----------
+        trace : :class:`RequestTrace`
+            The finished trace.
+        """
+
+        histograms = self._histograms.get(trace.name)
+        if histograms is None:
+            histograms = self._histograms[trace.name] = {}
+
+        if trace.error is not None:
+            self._errors[trace.name] = self._errors.get(trace.name, 0) + 1
+
+        for metric in TIMING_METRICS:
+            value = getattr(trace, metric)
+            if value is None:
+                continue
+
+            histogram = histograms.get(metric)
+            if histogram is None:
+                # 100 microseconds to about 100 seconds
+                histogram = histograms[metric] = Histogram.exponential(1e-4, 1.25, 63)
+
+            histogram.record(value)
+
+        if trace.response_bytes:
+            histogram = histograms.get("response_bytes")
+            if histogram is None:
+                # 64 bytes to about 128 megabytes
+                histogram = histograms["response_bytes"] = Histogram.exponential(64, 2, 22)
+
+            histogram.record(trace.response_bytes)
+
+    def errors(self) -> Dict[str, int]:
+        """Get the number of failed calls per endpoint.
+
+        Returns
+        -------
+        Dict[:class:`str`, :class:`int`]
+            Failed calls by endpoint name.
+        """
+
+        return dict(self._errors)
+
+    def snapshot(self) -> Dict[str, Dict[str, HistogramSnapshot]]:
+        """Summarize all recorded traces.
+
+        Returns
+        -------
+        Dict[:class:`str`, Dict[:class:`str`, :class:`HistogramSnapshot`]]
+            Summaries by endpoint name and metric.
+        """
+
+        return {
+            name: {metric: histogram.snapshot() for metric, histogram in histograms.items()}
+            for name, histograms in self._histograms.items()
+        }
+
+    def reset(self) -> None:
+        """Discard all recorded traces."""
+
+        self._histograms.clear()
+        self._errors.clear()
@@ -0,0 +1,534 @@
+import asyncio
+import json
+import logging
+import random
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+from multidict import CIMultiDict
+
+from .cache import request_key
+from .exceptions import ValoPyValidationError
+from .tracing import create_trace_config
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .timeouts import RequestTimeout
+    from .tracing import RequestTrace
+
+__all__ = [
+    "TransportResponse",
+    "Transport",
+    "AiohttpTransport",
+    "Interaction",
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+]
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class TransportResponse:
+    """Response returned by a :class:`Transport`.
+
+    Attributes
+    ----------
+    status : :class:`int`
+        The HTTP status code.
+    reason : Optional[:class:`str`]
+        The HTTP reason phrase.
+    headers : Mapping[:class:`str`, :class:`str`]
+        The response headers, looked up case-insensitively.
+    body : :class:`bytes`
+        The raw response body.
+    """
+
+    status: int
+    reason: Optional[str]
+    headers: Mapping[str, str]
+    body: bytes
+
+
+class Transport(ABC):
+    """Sends the HTTP requests of an :class:`~valopy.adapter.Adapter`.
+
+    Subclasses must implement :meth:`request` and, if they hold resources, :meth:`close`.
+    Transports raise :exc:`asyncio.TimeoutError` when a timeout is exceeded and
+    :exc:`aiohttp.ClientError` for connection errors. Error status codes are
+    returned as responses, the adapter converts them to ValoPy errors.
+    """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional["RequestTimeout"] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> TransportResponse:
+        """Send a request and read the whole response.
+
+        Parameters
+        ----------
+        method : :class:`str`
+            The HTTP method.
+        url : :class:`str`
+            The full URL without query string.
+        headers : Mapping[:class:`str`, :class:`str`]
+            The request headers.
+        params : Optional[Mapping[:class:`str`, Any]]
+            The query parameters, by default None
+        timeout : Optional[:class:`~valopy.timeouts.RequestTimeout`]
+            The timeouts of the request, by default None
+        trace : Optional[:class:`~valopy.tracing.RequestTrace`]
+            The trace to fill in with network timings, by default None
+
+        Returns
+        -------
+        :class:`TransportResponse`
+            The response.
+        """
+
+    async def close(self) -> None:
+        """Release the resources of the transport."""
+
+
+class AiohttpTransport(Transport):
+    """Transport sending requests over a persistent :class:`aiohttp.ClientSession`.
+
+    Attributes
+    ----------
+    connector_options : Dict[:class:`str`, Any]
+        Keyword arguments of the session's :class:`aiohttp.TCPConnector`.
+    """
+
+    def __init__(self, connector_options: Optional[Mapping[str, Any]] = None) -> None:
+        """Initialize the AiohttpTransport.
+
+        Parameters
+        ----------
+        connector_options : Optional[Mapping[:class:`str`, Any]]
+            Keyword arguments of the session's :class:`aiohttp.TCPConnector`,
+            e.g. from :func:`~valopy.runtime.connector_options`, by default aiohttp's defaults
+        """
+
+        self.connector_options = dict(connector_options or {})
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the persistent aiohttp session.
+
+        Returns
+        -------
+        :class:`aiohttp.ClientSession`
+            The persistent session for making requests.
+        """
+
+        if self._session is None or self._session.closed:
+            _log.info("Creating new aiohttp ClientSession")
+
+            # The connector binds to the running loop, so it is created with the session
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self.connector_options),
+                trace_configs=[create_trace_config()],
+            )
+
+        else:
+            _log.debug("Reusing existing aiohttp ClientSession")
+
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional["RequestTimeout"] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> TransportResponse:
+        """Send a request with aiohttp, see :meth:`Transport.request`."""
+
+        session = await self._get_session()
+
+        options: Dict[str, Any] = {}
+        if timeout is not None:
+            options["timeout"] = timeout.to_client_timeout()
+        if trace is not None:
+            options["trace_request_ctx"] = trace
+
+        async with session.request(
+            method=method, url=url, headers=headers, params=params, **options
+        ) as response:
+            body = await response.read()
+
+            return TransportResponse(
+                status=response.status,
+                reason=response.reason,
+                headers=response.headers,
+                body=body,
+            )
+
+    async def close(self) -> None:
+        """Close the persistent session."""
+
+        if self._session and not self._session.closed:
+            _log.info("Closing aiohttp ClientSession")
+
+            await self._session.close()
+
+        else:
+            _log.debug("Session already closed or was never created")
+
+
+@dataclass
+class Interaction:
+    """A recorded request and its response.
+
+    Attributes
+    ----------
+    method : :class:`str`
+        The HTTP method.
+    path : :class:`str`
+        The URL path, e.g. ``/valorant/v1/version/eu``.
+    params : Dict[:class:`str`, :class:`str`]
+        The query parameters.
+    status : :class:`int`
+        The HTTP status code.
+    reason : Optional[:class:`str`]
+        The HTTP reason phrase.
+    headers : Dict[:class:`str`, :class:`str`]
+        The response headers.
+    body : :class:`str`
+        The response body.
+    """
+
+    method: str
+    path: str
+    params: Dict[str, str] = field(default_factory=dict)
+    status: int = 200
+    reason: Optional[str] = "OK"
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: str = ""
+
+    @property
+    def key(self) -> tuple:
+        """The key requests are matched on."""
+
+        return request_key(self.method, self.path, self.params)
+
+
+def _normalize_params(params: Optional[Mapping[str, Any]]) -> Dict[str, str]:
+    return {name: str(value) for name, value in (params or {}).items()}
+
+
+class Cassette:
+    """Recorded interactions that a :class:`ReplayTransport` serves.
+
+    Request headers are not recorded, so cassettes never contain API keys.
+
+    Attributes
+    ----------
+    interactions : List[:class:`Interaction`]
+        The recorded interactions in recording order.
+    """
+
+    def __init__(self, interactions: Optional[List[Interaction]] = None) -> None:
+        """Initialize the Cassette.
+
+        Parameters
+        ----------
+        interactions : Optional[List[:class:`Interaction`]]
+            The initial interactions, by default None
+        """
+
+        self.interactions: List[Interaction] = list(interactions or [])
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def add(self, interaction: Interaction) -> None:
+        """Append an interaction.
+
+        Parameters
+        ----------
+        interaction : :class:`Interaction`
+            The interaction to append.
+        """
+
+        self.interactions.append(interaction)
+
+    def add_json(
+        self,
+        path: str,
+        payload: Any,
+        method: str = "GET",
+        params: Optional[Mapping[str, Any]] = None,
+        status: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Append an interaction returning a JSON payload, e.g. from ``tests/mock``.
+
+        Parameters
+        ----------
+        path : :class:`str`
+            The URL path, e.g. ``/valorant/v1/version/eu``.
+        payload : Any
+            The JSON payload of the response.
+        method : :class:`str`, default "GET"
+            The HTTP method, by default "GET"
+        params : Optional[Mapping[:class:`str`, Any]]
+            The query parameters, by default None
+        status : :class:`int`, default 200
+            The HTTP status code, by default 200
+        headers : Optional[Mapping[:class:`str`, :class:`str`]]
+            Additional response headers, by default None
+        """
+
+        self.add(
+            Interaction(
+                method=method,
+                path=path,
+                params=_normalize_params(params),
+                status=status,
+                headers={"Content-Type": "application/json", **(headers or {})},
+                body=json.dumps(payload),
+            )
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, "Path"]) -> "Cassette":
+        """Load a cassette file.
+
+        Parameters
+        ----------
+        path : Union[:class:`str`, :class:`pathlib.Path`]
+            The cassette file written by :meth:`save`.
+
+        Returns
+        -------
+        :class:`Cassette`
+            The loaded cassette.
+        """
+
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+
+        return cls([Interaction(**interaction) for interaction in data["interactions"]])
+
+    def save(self, path: Union[str, "Path"]) -> None:
+        """Write the cassette to a JSON file.
+
+        Parameters
+        ----------
+        path : Union[:class:`str`, :class:`pathlib.Path`]
+            The file to write.
+        """
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"interactions": [asdict(i) for i in self.interactions]}, file, indent=2)
+
+        _log.info("Saved %d interactions to %s", len(self.interactions), path)
+
+
+class RecordingTransport(Transport):
+    """Transport recording every exchange of another transport into a :class:`Cassette`.
+
+    Attributes
+    ----------
+    transport : :class:`Transport`
+        The transport sending the requests.
+    cassette : :class:`Cassette`
+        The cassette the exchanges are recorded into.
+    """
+
+    def __init__(
+        self, transport: Optional[Transport] = None, cassette: Optional[Cassette] = None
+    ) -> None:
+        """Initialize the RecordingTransport.
+
+        Parameters
+        ----------
+        transport : Optional[:class:`Transport`]
+            The transport sending the requests, by default a new :class:`AiohttpTransport`
+        cassette : Optional[:class:`Cassette`]
+            The cassette to record into, by default an empty one
+        """
+
+        self.transport = transport or AiohttpTransport()
+        self.cassette = cassette or Cassette()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional["RequestTimeout"] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> TransportResponse:
+        """Send a request with the wrapped transport and record it."""
+
+        response = await self.transport.request(
+            method=method, url=url, headers=headers, params=params, timeout=timeout, trace=trace
+        )
+
+        self.cassette.add(
+            Interaction(
+                method=method,
+                path=urlsplit(url).path,
+                params=_normalize_params(params),
+                status=response.status,
+                reason=response.reason,
+                headers=dict(response.headers),
+                body=response.body.decode("utf-8"),
+            )
+        )
+
+        return response
+
+    async def close(self) -> None:
+        """Close the wrapped transport."""
+
+        await self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """Transport serving recorded responses with simulated latency and errors.
+
+    Requests are matched on method, URL path and query parameters. Repeated
+    requests cycle through all responses recorded for them in order.
+
+    Attributes
+    ----------
+    cassette : :class:`Cassette`
+        The recorded interactions.
+    latency : :class:`float`
+        Seconds every response is delayed by.
+    jitter : :class:`float`
+        Maximum random seconds added to ``latency``.
+    error_rate : :class:`float`
+        Probability of answering with ``error_status`` instead of the recording.
+    error_status : :class:`int`
+        The status code of injected errors.
+    requests : :class:`int`
+        Number of requests served.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the ReplayTransport.
+
+        Parameters
+        ----------
+        cassette : :class:`Cassette`
+            The recorded interactions to serve.
+        latency : :class:`float`, default 0.0
+            Seconds every response is delayed by, by default 0.0
+        jitter : :class:`float`, default 0.0
+            Maximum random seconds added to ``latency``, by default 0.0
+        error_rate : :class:`float`, default 0.0
+            Probability of answering with ``error_status``, by default 0.0
+        error_status : :class:`int`, default 503
+            The status code of injected errors, by default 503
+        seed : Optional[:class:`int`]
+            Seed of the random jitter and error injection, by default None
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If a latency is negative or ``error_rate`` is not between 0 and 1.
+        """
+
+        if latency < 0 or jitter < 0:
+            raise ValoPyValidationError("latency and jitter must not be negative")
+
+        if not 0 <= error_rate <= 1:
+            raise ValoPyValidationError("error_rate must be between 0 and 1")
+
+        self.cassette = cassette
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+
+        self._random = random.Random(seed)
+        self._recordings: Dict[tuple, List[Interaction]] = {}
+        self._positions: Dict[tuple, int] = {}
+
+        for interaction in cassette.interactions:
+            self._recordings.setdefault(interaction.key, []).append(interaction)
+
+    def _next_interaction(self, key: tuple) -> Interaction:
+        """Get the next recorded interaction for a request key, cycling through them."""
+
+        recordings = self._recordings.get(key)
+        if not recordings:
+            raise LookupError(f"No recorded response for {key[0]} {key[1]} (params={key[2]})")
+
+        position = self._positions.get(key, 0)
+        self._positions[key] = (position + 1) % len(recordings)
+
+        return recordings[position]
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional["RequestTimeout"] = None,
+        trace: Optional["RequestTrace"] = None,
+    ) -> TransportResponse:
+        """Serve a recorded response, see :meth:`Transport.request`.
+
+        Raises
+        ------
+        :exc:`LookupError`
+            If no response was recorded for the request.
+        """
+
+        interaction = self._next_interaction(
+            request_key(method, urlsplit(url).path, _normalize_params(params))
+        )
+        self.requests += 1
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        async with asyncio.timeout(timeout.total if timeout else None):
+            await asyncio.sleep(delay)
+
+        if trace is not None:
+            trace.first_byte = trace.elapsed("request")
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            _log.debug("Injecting %d response for %s %s", self.error_status, method, url)
+
+            return TransportResponse(
+                status=self.error_status,
+                reason="Injected Error",
+                headers=CIMultiDict({"x-ratelimit-reset": "1"}),
+                body=b'{"errors": []}',
+            )
+
+        return TransportResponse(
+            status=interaction.status,
+            reason=interaction.reason,
+            headers=CIMultiDict(interaction.headers),
+            body=interaction.body.encode("utf-8"),
+        )
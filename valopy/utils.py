@@ -1,8 +1,21 @@
+import json
 import logging
 import re
+import time
 from dataclasses import fields, is_dataclass
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast, get_args, get_origin
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+    get_args,
+    get_origin,
+)
 
 if TYPE_CHECKING:
     from valopy.models import ValoPyModel
@@ -70,6 +83,33 @@ def parse_datetime_string(value: str) -> Optional[datetime]:
     return None
 
 
+def parse_rate_limit_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer rate limit header.
+
+    Parameters
+    ----------
+    headers : Mapping[:class:`str`, :class:`str`]
+        The response headers.
+    name : :class:`str`
+        The header to read, e.g. ``x-ratelimit-remaining``.
+
+    Returns
+    -------
+    Optional[:class:`int`]
+        The header value, or None if it is missing or malformed.
+    """
+
+    value = headers.get(name)
+    if value is None:
+        return None
+
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        _log.debug("Ignoring malformed %s header: %s", name, value)
+        return None
+
+
 def dict_to_dataclass(data: Dict[str, Any], dataclass_type: Type["ValoPyModel"]) -> "ValoPyModel":
     """Convert a dictionary to a dataclass instance, handling nested dataclasses.
 
@@ -129,3 +169,59 @@ def dict_to_dataclass(data: Dict[str, Any], dataclass_type: Type["ValoPyModel"])
             kwargs[field.name] = value
 
     return dataclass_type(**kwargs)  # type: ignore
+
+
+def deserialize_response(body: bytes, model_class: Type["ValoPyModel"]) -> Tuple[Any, float, float]:
+    """Decode a JSON response body and convert its data to models.
+
+    This is a module-level function so it can run in a thread or process pool.
+
+    Parameters
+    ----------
+    body : :class:`bytes`
+        The raw response body.
+    model_class : Type[:class:`ValoPyModel`]
+        The dataclass type to convert the response data to.
+
+    Returns
+    -------
+    Tuple[Any, :class:`float`, :class:`float`]
+        The converted data, the seconds spent decoding the JSON and the
+        seconds spent building the models.
+    """
+
+    started = time.perf_counter()
+    data = json.loads(body)
+    decoded = time.perf_counter()
+
+    # Extract results metadata if present
+    results_metadata = data.get("results")
+
+    # Extract the actual data from the response
+    response_data = data.get("data", {})
+
+    if isinstance(response_data, list):
+        _log.debug("Converting list response to %s dataclasses", model_class.__name__)
+
+        # Convert list of dicts to list of dataclasses
+        response_data = [
+            dict_to_dataclass(data=item, dataclass_type=model_class)
+            for item in response_data
+            if isinstance(item, dict)
+        ]
+
+    elif isinstance(response_data, dict):
+        # Inject results metadata into response dict before deserialization if present
+        if results_metadata:
+            response_data["results"] = results_metadata
+            _log.debug("Added results metadata to response data")
+
+        _log.debug("Converting response to %s dataclass", model_class.__name__)
+
+        # Convert dict to dataclass (results will be deserialized if present)
+        response_data = dict_to_dataclass(data=response_data, dataclass_type=model_class)
+
+    else:
+        _log.warning("Response data is not a dict or list, cannot convert to dataclass")
+
+    return response_data, decoded - started, time.perf_counter() - decoded
@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from .enums import CountryCode
+from .exceptions import ValoPyError, ValoPyValidationError
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .client import Client
+    from .models import WebsiteContent
+
+__all__ = [
+    "WebsiteAggregator",
+]
+
+_log = logging.getLogger(__name__)
+
+
+class WebsiteAggregator:
+    """Aggregate website news of many country codes into one feed of new articles.
+
+    Every :meth:`refresh` fetches the feeds concurrently, keeps the articles
+    dated at or after each country's high-water mark and drops articles already
+    returned under the same ``id`` or ``url``, so callers only process what is new.
+
+    Attributes
+    ----------
+    client : :class:`~valopy.client.Client`
+        The client used to fetch the feeds.
+    countrycodes : List[:class:`~valopy.enums.CountryCode`]
+        The country codes to aggregate.
+    max_concurrency : :class:`int`
+        Maximum number of feeds fetched at once.
+    high_water : Dict[:class:`~valopy.enums.CountryCode`, :class:`datetime.datetime`]
+        Date of the newest article seen per country.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        countrycodes: Optional[Iterable[CountryCode]] = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the WebsiteAggregator.
+
+        Parameters
+        ----------
+        client : :class:`~valopy.client.Client`
+            The client used to fetch the feeds.
+        countrycodes : Optional[Iterable[:class:`~valopy.enums.CountryCode`]]
+            The country codes to aggregate, by default all of them
+        max_concurrency : :class:`int`, default 4
+            Maximum number of feeds fetched at once, by default 4
+
+        Raises
+        ------
+        :exc:`ValoPyValidationError`
+            If ``max_concurrency`` is not positive.
+        """
+
+        if max_concurrency <= 0:
+            raise ValoPyValidationError("max_concurrency must be greater than 0")
+
+        self.client = client
+        self.countrycodes = list(countrycodes) if countrycodes is not None else list(CountryCode)
+        self.max_concurrency = max_concurrency
+        self.high_water: Dict[CountryCode, "datetime"] = {}
+
+        self._feeds: Dict[CountryCode, List["WebsiteContent"]] = {}
+        # Keys of returned articles mapped to their date, pruned below the lowest high-water mark
+        self._seen: Dict[str, "datetime"] = {}
+
+    def feed(self, countrycode: CountryCode) -> List["WebsiteContent"]:
+        """Get the last fetched feed of a country.
+
+        Parameters
+        ----------
+        countrycode : :class:`~valopy.enums.CountryCode`
+            The country code.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.WebsiteContent`]
+            The articles, empty if the feed was not fetched yet.
+        """
+
+        return self._feeds.get(countrycode, [])
+
+    async def refresh(self) -> List["WebsiteContent"]:
+        """Fetch all feeds and return the articles not returned before.
+
+        A feed that fails to load is logged and skipped, its cached articles
+        and high-water mark are kept.
+
+        Returns
+        -------
+        List[:class:`~valopy.models.WebsiteContent`]
+            The new articles, newest first.
+        """
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(countrycode: CountryCode) -> Optional[List["WebsiteContent"]]:
+            async with semaphore:
+                try:
+                    return await self.client.get_website(countrycode)
+                except ValoPyError as e:
+                    _log.warning("Failed to fetch website feed %s: %s", countrycode.value, e)
+                    return None
+
+        feeds = await asyncio.gather(*(fetch(code) for code in self.countrycodes))
+
+        new_items = []
+        for countrycode, items in zip(self.countrycodes, feeds):
+            if items is None:
+                continue
+
+            self._feeds[countrycode] = items
+
+            mark = self.high_water.get(countrycode)
+            for item in items:
+                if mark is not None and item.date < mark:
+                    continue
+
+                # The same article can be listed under several locales
+                keys = (f"id:{item.id}", f"url:{item.url}")
+                if any(key in self._seen for key in keys):
+                    continue
+
+                for key in keys:
+                    self._seen[key] = item.date
+                new_items.append(item)
+
+            if items:
+                newest = max(item.date for item in items)
+                self.high_water[countrycode] = max(newest, mark) if mark else newest
+
+        self._prune()
+
+        _log.info(
+            "Refreshed %d website feeds, %d new articles", len(self.countrycodes), len(new_items)
+        )
+
+        new_items.sort(key=lambda item: item.date, reverse=True)
+        return new_items
+
+    def _prune(self) -> None:
+        if len(self.high_water) < len(self.countrycodes):
+            return
+
+        # Articles older than every high-water mark are filtered before the key lookup
+        lowest = min(self.high_water.values())
+        self._seen = {key: date for key, date in self._seen.items() if date >= lowest}